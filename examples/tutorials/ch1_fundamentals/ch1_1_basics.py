@@ -307,7 +307,7 @@ gpv.plot_3d(
 # Compute at a given location
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # 
-# This is done by modifying the grid to a custom grid and recomputing.
+# Only the given coordinates are interpolated. Neither the model grid nor the stored solutions are modified.
 # 
 
 # %% 
@@ -318,12 +318,6 @@ lith_values_at_coords: np.ndarray = gp.compute_model_at(
 )
 lith_values_at_coords
 
-# %%
-# Therefore if we just want the value at **x\_i**: 
-
-# %%
-geo_model.solutions.raw_arrays.custom
-
 # %%
 # .. admonition:: Work in progress 
 #
@@ -8,7 +8,11 @@ from .initialization_API import (
 # Compute API
 from .compute_API import (
     compute_model,
-    compute_model_at
+    compute_model_at,
+    compute_model_at_chunks,
+    compute_model_batch,
+    compute_model_chunked,
+    evaluate_on_grid
 )
 
 # Map stack to surfaces API
@@ -59,17 +63,21 @@ from ..modules.data_manipulation.manipulate_structural_frame import (
     remove_element_by_name
 )
 
+# Serialization
+from ..modules.serialization import save_model, load_model
+
 # Geophysics
 from gempy_engine.modules.geophysics.gravity_gradient import calculate_gravity_gradient
 
 __all__ = [
         'create_data_legacy', 'create_geomodel', 'structural_elements_from_borehole_set',
-        'compute_model', 'compute_model_at', 'map_stack_to_surfaces',
+        'compute_model', 'compute_model_at', 'compute_model_at_chunks', 'compute_model_batch', 'compute_model_chunked', 'evaluate_on_grid', 'map_stack_to_surfaces',
         'set_section_grid', 'set_active_grid', 'set_topography_from_random', 'set_topography_from_file', 'set_topography_from_subsurface_structured_grid', 'set_topography_from_arrays',
         'set_custom_grid', 'set_centered_grid',
         'generate_example_model', 'set_fault_relation', 'set_is_fault', 'set_is_finite_fault',
         'add_surface_points', 'add_orientations', 'delete_surface_points', 'delete_orientations',
         'create_orientations_from_surface_points_coords', 'modify_surface_points', 'modify_orientations',
         'add_structural_group', 'remove_structural_group_by_index', 'remove_structural_group_by_name', 'remove_element_by_name',
+        'save_model', 'load_model',
         'calculate_gravity_gradient'
 ]
@@ -1,4 +1,7 @@
-﻿from typing import Optional
+﻿import contextlib
+import copy
+import os
+from typing import ContextManager, Optional, Iterable, Iterator
 
 import numpy as np
 
@@ -6,12 +9,19 @@ import gempy_engine
 from gempy_engine.core.backend_tensor import BackendTensor
 from gempy.API.gp2_gp3_compatibility.gp3_to_gp2_input import gempy3_to_gempy2
 from gempy_engine.config import AvailableBackends
-from gempy_engine.core.data import Solutions
+from gempy_engine.core.data import Solutions, SurfacePoints, Orientations, InterpolationOptions
+from gempy_engine.core.data.engine_grid import EngineGrid
+from gempy_engine.core.data.interp_output import InterpOutput
 from gempy_engine.core.data.interpolation_input import InterpolationInput
-from .grid_API import set_custom_grid
+from gempy_engine.core.data.output.blocks_value_type import ValueType
+from gempy_engine.core.data.raw_arrays_solution import RawArraysSolution
+from gempy_engine.API.interp_single._multi_scalar_field_manager import interpolate_all_fields
 from ..core.data.gempy_engine_config import GemPyEngineConfig
 from ..core.data.geo_model import GeoModel
-from ..modules.data_manipulation.engine_factory import interpolation_input_from_structural_frame
+from ..core.data.grid import Grid
+from ..modules.data_manipulation.engine_factory import interpolation_input_from_structural_frame, engine_grid_from_grid
+from ..modules.data_manipulation.engine_hooks import EngineHooks, InterpolateHook, engine_hooks
+from ..modules.data_manipulation.solutions_disk_cache import SolutionsDiskCache
 from ..optional_dependencies import require_gempy_legacy
 
 
@@ -40,16 +50,39 @@ def compute_model(gempy_model: GeoModel, engine_config: Optional[GemPyEngineConf
                 dtype=engine_config.dtype
             )
 
-            # TODO: To decide what to do with this.
-            interpolation_input = interpolation_input_from_structural_frame(gempy_model)
+            # * Identical models computed before (in this or another process) are loaded from disk
+            solutions_cache = _solutions_disk_cache(engine_config)
+            if solutions_cache is not None:
+                solutions_key = solutions_cache.key(gempy_model)  # * Taken before setting the solutions reorders the elements
+                cached_solutions = solutions_cache.load(solutions_key)
+                if cached_solutions is not None:
+                    gempy_model.solutions = cached_solutions
+                    return gempy_model.solutions
+
+            # * Only the components whose source data changed since the last call are rebuilt
+            interpolation_input = gempy_model.interpolation_input_cache.get_interpolation_input(gempy_model)
             gempy_model.taped_interpolation_input = interpolation_input  # * This is used for gradient tape
 
-            gempy_model.solutions = gempy_engine.compute_model(
-                interpolation_input=interpolation_input,
-                options=gempy_model.interpolation_options,
-                data_descriptor=gempy_model.input_data_descriptor,
-                geophysics_input=gempy_model.geophysics_input,
-            )
+            # * Groups whose input did not change since the last solve skip the covariance system
+            gempy_model.kriging_weights_cache.restore(gempy_model)
+            # * If requested, groups whose input changed update the factorization of their last solve, and groups whose
+            # * input and upstream faults did not change only evaluate the coordinates that are new
+            with _scalar_field_hook(gempy_model, enabled=engine_config.reuse_scalar_fields) as interpolate_scalar_field:
+                hooks = EngineHooks(
+                    solve=gempy_model.incremental_solver.solve_hook if engine_config.incremental_solve else None,
+                    interpolate_scalar_field=interpolate_scalar_field
+                )
+                with engine_hooks(hooks):
+                    solutions = gempy_engine.compute_model(
+                        interpolation_input=interpolation_input,
+                        options=gempy_model.interpolation_options,
+                        data_descriptor=gempy_model.input_data_descriptor,
+                        geophysics_input=gempy_model.geophysics_input,
+                    )
+            gempy_model.kriging_weights_cache.store(gempy_model)
+            if solutions_cache is not None:
+                solutions_cache.store(solutions_key, solutions)
+            gempy_model.solutions = solutions
 
         case AvailableBackends.aesara | AvailableBackends.legacy:
             gempy_model.legacy_model = _legacy_compute_model(gempy_model)
@@ -59,28 +92,324 @@ def compute_model(gempy_model: GeoModel, engine_config: Optional[GemPyEngineConf
     return gempy_model.solutions
 
 
-def compute_model_at(gempy_model: GeoModel, at: np.ndarray,
-                     engine_config: Optional[GemPyEngineConfig] = None) -> np.ndarray:
+def _scalar_field_hook(gempy_model: GeoModel, enabled: bool) -> ContextManager[Optional[InterpolateHook]]:
+    if not enabled:
+        return contextlib.nullcontext()
+    return gempy_model.scalar_field_cache.interpolate_hook(gempy_model)
+
+
+def _solutions_disk_cache(engine_config: GemPyEngineConfig) -> Optional[SolutionsDiskCache]:
+    if engine_config.solutions_cache_dir is None or engine_config.backend != AvailableBackends.numpy:
+        return None
+    return SolutionsDiskCache(
+        directory=engine_config.solutions_cache_dir,
+        max_bytes=engine_config.solutions_cache_max_bytes
+    )
+
+
+def compute_model_at(gempy_model: GeoModel, at: np.ndarray, engine_config: Optional[GemPyEngineConfig] = None,
+                     chunk_size: Optional[int] = None) -> np.ndarray:
     """
     Compute the geological model at specific coordinates.
-    
-    Note: This function sets a custom grid and computes the model so be wary of side effects.
+
+    Only the given coordinates are interpolated; ``gempy_model.grid`` and ``gempy_model.solutions`` are left
+    untouched. Kriging weights are reused from the engine weights cache as long as the input data did not change
+    since the last solve.
 
     Args:
         gempy_model (GeoModel): The GemPy model to compute.
         at (np.ndarray): The coordinates at which to compute the model.
         engine_config (Optional[GemPyEngineConfig], optional): Configuration for the computational engine. Defaults to None, in which case a default configuration will be used.
+        chunk_size (Optional[int], optional): Maximum number of coordinates evaluated at once. Defaults to None, in which case all coordinates are evaluated together.
 
     Returns:
         np.ndarray: The computed geological model at the specified coordinates.
     """
-    set_custom_grid(
-        grid=gempy_model.grid,
-        xyz_coord=at
+    at = np.atleast_2d(at)
+    chunk_size = chunk_size or max(at.shape[0], 1)
+    chunks = (at[i:i + chunk_size] for i in range(0, at.shape[0], chunk_size))
+    values = list(compute_model_at_chunks(gempy_model, chunks, engine_config))
+    return np.concatenate(values) if values else np.empty(0)
+
+
+def compute_model_at_chunks(gempy_model: GeoModel, chunks: Iterable[np.ndarray],
+                            engine_config: Optional[GemPyEngineConfig] = None) -> Iterator[np.ndarray]:
+    """
+    Lazily compute the geological model on a stream of coordinate chunks.
+
+    Same as :func:`compute_model_at` but consuming and yielding one chunk at a time, so the total number of
+    coordinates is only bounded by the consumer.
+
+    Args:
+        gempy_model (GeoModel): The GemPy model to compute.
+        chunks (Iterable[np.ndarray]): Iterable of (n, 3) coordinate arrays.
+        engine_config (Optional[GemPyEngineConfig], optional): Configuration for the computational engine.
+
+    Yields:
+        np.ndarray: The computed geological model at the coordinates of each chunk.
+    """
+    engine_config = engine_config or GemPyEngineConfig(use_gpu=False)
+    if engine_config.backend not in (AvailableBackends.numpy, AvailableBackends.PYTORCH):
+        raise ValueError(f'Backend {engine_config} not supported for point evaluation')
+
+    BackendTensor.change_backend_gempy(
+        engine_backend=engine_config.backend,
+        use_gpu=engine_config.use_gpu,
+        dtype=engine_config.dtype
+    )
+
+    for xyz in chunks:
+        yield _evaluate_at(gempy_model, np.atleast_2d(xyz))
+
+
+def _evaluate_at(gempy_model: GeoModel, xyz: np.ndarray) -> np.ndarray:
+    # * Same as the custom grid: points are only moved to the interpolation space by the input transform
+    gempy_model.kriging_weights_cache.restore(gempy_model)
+    outputs = _interpolate_on_points(gempy_model, gempy_model.input_transform.apply(xyz))
+    gempy_model.kriging_weights_cache.store(gempy_model)
+    return BackendTensor.t.to_numpy(outputs[-1].custom_grid_values)
+
+
+def _interpolate_on_points(gempy_model: GeoModel, xyz_transformed: np.ndarray) -> list[InterpOutput]:
+    # * Only the points are taken from the cache, the coordinates are the only grid of the engine
+    interpolation_input: InterpolationInput = gempy_model.interpolation_input_cache.get_interpolation_input(
+        geo_model=gempy_model,
+        grid=EngineGrid.from_xyz_coords(xyz_transformed)
+    )
+    # * Same rule as gempy_engine.compute_model: the engine writes into its input
+    if BackendTensor.engine_backend is not AvailableBackends.PYTORCH:
+        interpolation_input = copy.deepcopy(interpolation_input)
+
+    return interpolate_all_fields(
+        interpolation_input=interpolation_input,
+        options=gempy_model.interpolation_options,
+        data_descriptor=gempy_model.input_data_descriptor
+    )
+
+
+def compute_model_chunked(gempy_model: GeoModel, chunk_size: int = 100_000, memmap_dir: Optional[str] = None,
+                          engine_config: Optional[GemPyEngineConfig] = None) -> RawArraysSolution:
+    """
+    Compute the geological model on the dense grid chunk by chunk with bounded memory.
+
+    The coordinates of the dense grid are generated lazily from its extent and resolution, so neither the full
+    grid nor the full engine output exist in memory at any point. Peak memory is proportional to ``chunk_size``
+    plus the result arrays, which can be memory-mapped to disk. The kriging system of every structural group is
+    solved once and reused for all chunks. ``gempy_model.solutions`` is not modified.
+
+    Args:
+        gempy_model (GeoModel): The GemPy model to compute. Its grid must have a dense grid.
+        chunk_size (int): Maximum number of grid points interpolated at once.
+        memmap_dir (Optional[str]): If given, the results are written to ``.npy`` memory maps in this directory
+            instead of in-memory arrays.
+        engine_config (Optional[GemPyEngineConfig]): Configuration for the computational engine. Defaults to None, in which case a default configuration will be used.
+
+    Raises:
+        ValueError: If the model has no dense grid or the backend is not supported.
+
+    Returns:
+        RawArraysSolution: Raw arrays with ``lith_block``, ``scalar_field_matrix`` and ``block_matrix`` of the dense grid.
+    """
+    dense_grid = gempy_model.grid.dense_grid
+    if dense_grid is None:
+        raise ValueError('The model grid has no dense grid to compute')
+
+    engine_config = engine_config or GemPyEngineConfig(use_gpu=False)
+    if engine_config.backend not in (AvailableBackends.numpy, AvailableBackends.PYTORCH):
+        raise ValueError(f'Backend {engine_config} not supported for chunked computation')
+
+    BackendTensor.change_backend_gempy(
+        engine_backend=engine_config.backend,
+        use_gpu=engine_config.use_gpu,
+        dtype=engine_config.dtype
+    )
+
+    n_points = int(np.prod(dense_grid.resolution))
+    n_groups = len(gempy_model.structural_frame.structural_groups)
+
+    def _allocate(name: str, shape: tuple, dtype) -> np.ndarray:
+        if memmap_dir is None:
+            return np.empty(shape, dtype=dtype)
+        return np.lib.format.open_memmap(os.path.join(memmap_dir, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape)
+
+    raw_arrays = RawArraysSolution(
+        lith_block=_allocate("lith_block", (n_points,), "int8"),
+        scalar_field_matrix=_allocate("scalar_field_matrix", (n_groups, n_points), BackendTensor.dtype),
+        block_matrix=_allocate("block_matrix", (n_groups, n_points), BackendTensor.dtype)
+    )
+
+    gempy_model.kriging_weights_cache.restore(gempy_model)
+    max_id = 0
+    for chunk, xyz in dense_grid.iter_values(chunk_size, orthogonal=True):
+        outputs = _interpolate_on_points(gempy_model, gempy_model.input_transform.apply(xyz))
+        custom_slice = outputs[-1].grid.custom_grid_slice
+        for e, output in enumerate(outputs):
+            raw_arrays.scalar_field_matrix[e, chunk] = output.get_block_from_value_type(ValueType.scalar, custom_slice)
+            raw_arrays.block_matrix[e, chunk] = output.get_block_from_value_type(ValueType.values_block, custom_slice)
+
+        lith_block = outputs[-1].get_block_from_value_type(ValueType.ids, custom_slice).astype("int8")
+        raw_arrays.lith_block[chunk] = lith_block
+        max_id = max(max_id, int(lith_block.max(initial=0)))
+    gempy_model.kriging_weights_cache.store(gempy_model)
+
+    # * Move basement from first to last as `RawArraysSolution` does. Needs the global maximum so it runs after all chunks
+    for start in range(0, n_points, chunk_size):
+        lith_block = raw_arrays.lith_block[start:start + chunk_size]
+        lith_block[lith_block == 0] = max_id + 1
+
+    return raw_arrays
+
+
+def evaluate_on_grid(gempy_model: GeoModel, grid: Grid, engine_config: Optional[GemPyEngineConfig] = None) -> Solutions:
+    """
+    Evaluate the geological model on a new grid reusing the kriging weights of the last solve.
+
+    The covariance system of a structural group is only solved again if its input changed since the weights were
+    cached. Neither ``gempy_model.grid`` nor ``gempy_model.solutions`` are modified.
+
+    Args:
+        gempy_model (GeoModel): The GemPy model to evaluate.
+        grid (Grid): The grid to evaluate the model on.
+        engine_config (Optional[GemPyEngineConfig]): Configuration for the computational engine. Defaults to None, in which case a default configuration will be used.
+
+    Raises:
+        ValueError: If the provided backend in the engine_config is not supported.
+
+    Returns:
+        Solutions: The solutions on the given grid.
+    """
+    engine_config = engine_config or GemPyEngineConfig(use_gpu=False)
+    if engine_config.backend not in (AvailableBackends.numpy, AvailableBackends.PYTORCH):
+        raise ValueError(f'Backend {engine_config} not supported for grid evaluation')
+
+    BackendTensor.change_backend_gempy(
+        engine_backend=engine_config.backend,
+        use_gpu=engine_config.use_gpu,
+        dtype=engine_config.dtype
+    )
+
+    interpolation_input: InterpolationInput = gempy_model.interpolation_input_cache.get_interpolation_input(
+        geo_model=gempy_model,
+        grid=engine_grid_from_grid(gempy_model, grid)
+    )
+
+    options = copy.copy(gempy_model.interpolation_options)
+    options.block_solutions_type = grid.block_solution_type
+
+    gempy_model.kriging_weights_cache.restore(gempy_model)
+    solutions = gempy_engine.compute_model(
+        interpolation_input=interpolation_input,
+        options=options,
+        data_descriptor=gempy_model.input_data_descriptor,
+        geophysics_input=gempy_model.geophysics_input,
+    )
+    gempy_model.kriging_weights_cache.store(gempy_model)
+    return solutions
+
+
+def compute_model_batch(gempy_model: GeoModel, realizations: np.ndarray,
+                        orientation_realizations: Optional[np.ndarray] = None,
+                        engine_config: Optional[GemPyEngineConfig] = None) -> list[Solutions]:
+    """
+    Compute the geological model for many realizations of the input data.
+
+    Each realization is given as an offset added to the current surface point (and optionally orientation)
+    coordinates, ordered as in ``structural_frame.surface_points_copy`` (``orientations_copy``). The grid, the
+    input data descriptor and the unperturbed data are built once; the offsets of all realizations are
+    transformed to the interpolation space in a single vectorized pass. The kriging system of every realization
+    is solved, weights are never taken from the engine cache. The GeoModel is not modified.
+
+    Args:
+        gempy_model (GeoModel): The GemPy model to compute.
+        realizations (np.ndarray): Surface point offsets of shape (n_realizations, n_points, 3).
+        orientation_realizations (Optional[np.ndarray]): Orientation position offsets of shape
+            (n_realizations, n_orientations, 3). Defaults to None, in which case the orientations are shared.
+        engine_config (Optional[GemPyEngineConfig]): Configuration for the computational engine. Defaults to None,
+            in which case a default configuration will be used.
+
+    Raises:
+        ValueError: If the shape of the realizations does not match the model data or the backend is not supported.
+
+    Returns:
+        list[Solutions]: The solutions of every realization, in order.
+    """
+    engine_config = engine_config or GemPyEngineConfig(use_gpu=False)
+    if engine_config.backend not in (AvailableBackends.numpy, AvailableBackends.PYTORCH):
+        raise ValueError(f'Backend {engine_config} not supported for batched computation')
+
+    BackendTensor.change_backend_gempy(
+        engine_backend=engine_config.backend,
+        use_gpu=engine_config.use_gpu,
+        dtype=engine_config.dtype
     )
 
-    sol = compute_model(gempy_model, engine_config)
-    return sol.raw_arrays.custom
+    base_input: InterpolationInput = gempy_model.interpolation_input_cache.get_interpolation_input(gempy_model)
+    data_descriptor = gempy_model.input_data_descriptor
+
+    # * The engine weights cache is keyed on a repr of the input that numpy abbreviates for large arrays, so
+    # * realizations that only differ in the middle of the points would share the weights of the first one
+    options = copy.copy(gempy_model.interpolation_options)
+    options.cache_mode = InterpolationOptions.CacheMode.NO_CACHE
+
+    surface_points_xyz = _transform_realizations(
+        gempy_model=gempy_model,
+        xyz=gempy_model.structural_frame.surface_points_copy.xyz,
+        offsets=realizations
+    )
+    n_realizations = surface_points_xyz.shape[0]
+
+    orientations_xyz = None
+    if orientation_realizations is not None:
+        orientations_xyz = _transform_realizations(
+            gempy_model=gempy_model,
+            xyz=gempy_model.structural_frame.orientations_copy.xyz,
+            offsets=orientation_realizations
+        )
+        if orientations_xyz.shape[0] != n_realizations:
+            raise ValueError(f'Expected {n_realizations} orientation realizations, got {orientations_xyz.shape[0]}')
+
+    solutions: list[Solutions] = []
+    for i in range(n_realizations):
+        orientations = base_input.orientations
+        if orientations_xyz is not None:
+            orientations = Orientations(
+                dip_positions=orientations_xyz[i],
+                dip_gradients=base_input.orientations.dip_gradients,
+                nugget_effect_grad=base_input.orientations.nugget_effect_grad
+            )
+
+        interpolation_input = InterpolationInput(
+            surface_points=SurfacePoints(
+                sp_coords=surface_points_xyz[i],
+                nugget_effect_scalar=base_input.surface_points.nugget_effect_scalar
+            ),
+            orientations=orientations,
+            grid=base_input.grid,
+            unit_values=base_input.unit_values
+        )
+
+        solutions.append(
+            gempy_engine.compute_model(
+                interpolation_input=interpolation_input,
+                options=options,
+                data_descriptor=data_descriptor,
+                geophysics_input=gempy_model.geophysics_input,
+            )
+        )
+
+    return solutions
+
+
+def _transform_realizations(gempy_model: GeoModel, xyz: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    offsets = np.asarray(offsets, dtype=float)
+    if offsets.ndim != 3 or offsets.shape[1:] != xyz.shape:
+        raise ValueError(f'Realizations must have shape (n_realizations, {xyz.shape[0]}, 3), got {offsets.shape}')
+
+    n_realizations = offsets.shape[0]
+    perturbed = (xyz[np.newaxis] + offsets).reshape(-1, 3)
+    perturbed = gempy_model.grid.transform.apply_with_cached_pivot(perturbed)
+    perturbed = gempy_model.input_transform.apply(perturbed)
+    return perturbed.reshape(n_realizations, -1, 3)
 
 
 def optimize_and_compute(geo_model: GeoModel, engine_config: GemPyEngineConfig, max_epochs: int = 10,
@@ -5,6 +5,7 @@ import numpy as np
 from ..core.data import Grid
 from ..core.data.grid_modules import CustomGrid, Sections
 from ..core.data.grid_modules.topography import Topography
+from ..core.data.grid_modules.tiled_topography import TiledTopography
 from ..modules.grids.create_topography import create_random_topography
 from ..optional_dependencies import require_subsurface
 
@@ -21,7 +22,8 @@ def set_section_grid(grid: Grid, section_dict: dict):
 
 
 def set_topography_from_random(grid: Grid, fractal_dimension: float = 2.0, d_z: Union[Sequence, None] = None,
-                               topography_resolution: Union[Sequence, None] = None):
+                               topography_resolution: Union[Sequence, None] = None,
+                               seed: Union[int, np.random.Generator, None] = None):
     """
     Sets the topography of the grid using a randomly generated topography.
 
@@ -32,6 +34,8 @@ def set_topography_from_random(grid: Grid, fractal_dimension: float = 2.0, d_z:
             If None, a default sequence will be used. Defaults to None.
         topography_resolution (Union[Sequence, None], optional): The resolution of the random topography.
             If None, the resolution of the grid's regular grid will be used. Defaults to None.
+        seed (Union[int, np.random.Generator, None], optional): Seed or generator of the random topography. The same
+            seed gives the same topography. If None, a different topography is generated every call. Defaults to None.
 
     Returns:
         The topography object that was set on the grid.
@@ -52,7 +56,8 @@ def set_topography_from_random(grid: Grid, fractal_dimension: float = 2.0, d_z:
         extent=grid.regular_grid.extent,
         resolution=topography_resolution,
         dz=d_z,
-        fractal_dimension=fractal_dimension
+        fractal_dimension=fractal_dimension,
+        seed=seed
     )
     
     grid.topography = Topography(
@@ -70,13 +75,53 @@ def set_topography_from_subsurface_structured_grid(grid: Grid, struct: "subsurfa
     return grid.topography
 
 
-def set_topography_from_arrays(grid: Grid,  xyz_vertices: np.ndarray):
-    grid.topography = Topography.from_unstructured_mesh(grid.regular_grid, xyz_vertices)
+def set_topography_from_arrays(grid: Grid, xyz_vertices: np.ndarray, resolution: Union[Sequence, None] = None,
+                               spacing: Union[float, Sequence, None] = None, method: str = 'nearest', **kwargs):
+    """
+    Sets the topography of the grid from scattered XYZ points, e.g. mesh vertices or a LiDAR point cloud.
+
+    Args:
+        grid (Grid): The grid object on which to set the topography.
+        xyz_vertices (np.ndarray): (n, 3) points.
+        resolution (Union[Sequence, None], optional): Number of topography nodes in X and Y. If None and no
+            `spacing` is given, the resolution of the grid's regular grid will be used. Defaults to None.
+        spacing (Union[float, Sequence, None], optional): Distance between topography nodes. Defaults to None.
+        method (str, optional): 'nearest', 'linear' or 'idw'. Defaults to 'nearest'.
+        **kwargs: Further arguments of :func:`gempy.modules.grids.rasterize_points.rasterize_points`, e.g.
+            `n_neighbors` and `power` of the inverse distance weighting or `chunk_size`.
+
+    Returns:
+        The topography object that was set on the grid.
+    """
+    grid.topography = Topography.from_unstructured_mesh(grid.regular_grid, xyz_vertices, resolution=resolution,
+                                                        spacing=spacing, method=method, **kwargs)
     set_active_grid(grid, [Grid.GridTypes.TOPOGRAPHY])
     return grid.topography
 
 
-def set_topography_from_file(grid: Grid, filepath: str, crop_to_extent: Union[Sequence, None] = None):
+def set_topography_from_file(grid: Grid, filepath: str, crop_to_extent: Union[Sequence, None] = None,
+                             tiled: bool = False, **tiled_kwargs):
+    """
+    Sets the topography of the grid from a raster file.
+
+    Args:
+        grid (Grid): The grid object on which to set the topography.
+        filepath (str): Path of the raster.
+        crop_to_extent (Union[Sequence, None], optional): [x_min, x_max, y_min, y_max] to crop the raster to.
+            Defaults to None, i.e. the whole raster or, if `tiled`, the extent of the regular grid.
+        tiled (bool, optional): If True, the raster is memory-mapped and the voxel mask is computed by tiles, see
+            :class:`TiledTopography`. Use it for DEMs that do not fit in memory. Defaults to False.
+        **tiled_kwargs: Arguments of :meth:`TiledTopography.from_file`, e.g. `tile_size`, or `origin` and
+            `spacing` for ``.npy`` rasters.
+
+    Returns:
+        The topography object that was set on the grid.
+    """
+    if tiled:
+        grid.topography = TiledTopography.from_file(grid.regular_grid, filepath, crop_to_extent=crop_to_extent, **tiled_kwargs)
+        set_active_grid(grid, [Grid.GridTypes.TOPOGRAPHY])
+        return grid.topography
+
     ss = require_subsurface()
     struct: ss.StructuredData = ss.modules.reader.read_structured_topography(
         path=filepath,
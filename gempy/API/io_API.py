@@ -4,7 +4,9 @@ import numpy as np
 
 from gempy.core.data.orientations import OrientationsTable
 from gempy.core.data.surface_points import SurfacePointsTable
-from gempy.optional_dependencies import require_pandas
+from gempy.optional_dependencies import require_pandas, require_pyarrow
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
 
 
 def read_surface_points(path: str,
@@ -14,20 +16,28 @@ def read_surface_points(path: str,
                         surface_name="formation",
                         name_id_map: Optional[dict[str, int]] = None,
                         pandas_kwargs: dict = None) -> SurfacePointsTable:
-    
-    pandas_kwargs = pandas_kwargs or {}
-    if 'sep' not in pandas_kwargs:
-        pandas_kwargs['sep'] = ','
+    """Read surface points from a CSV or Parquet file.
+
+    Columns are parsed into arrays once and converted to the table in bulk: names are mapped to ids per distinct
+    name, not per row. Parquet files (``.parquet``/``.pq``) are read with pyarrow.
+
+    Args:
+        path (str): Path of the file.
+        coord_x_name, coord_y_name, coord_z_name (str): Standardized names of the coordinate columns.
+        surface_name (str): Standardized name of the column with the surface of each point.
+        name_id_map (Optional[dict[str, int]]): Mapping between surface names and ids. Generated if None.
+        pandas_kwargs (dict): Extra arguments of ``pandas.read_csv``. Not used for Parquet files.
 
-    pd = require_pandas()
-    csv = pd.read_csv(path, **pandas_kwargs)
-    csv = _standardize(csv)
+    Returns:
+        SurfacePointsTable: The surface points.
+    """
+    columns = _read_columns(path, pandas_kwargs)
 
     surface_points: SurfacePointsTable = SurfacePointsTable.from_arrays(
-        x=csv[coord_x_name].values,
-        y=csv[coord_y_name].values,
-        z=csv[coord_z_name].values,
-        names=csv[surface_name].values,  # TODO: This we will have to map it with StructuralFrame
+        x=columns[coord_x_name],
+        y=columns[coord_y_name],
+        z=columns[coord_z_name],
+        names=columns[surface_name],  # TODO: This we will have to map it with StructuralFrame
         name_id_map=name_id_map
     )
 
@@ -46,30 +56,58 @@ def read_orientations(
         name_id_map: Optional[dict[str, int]] = None,
         pandas_kwargs: dict = None
         ) -> OrientationsTable:
-    
-    pandas_kwargs = pandas_kwargs or {}
-    if 'sep' not in pandas_kwargs:
-        pandas_kwargs['sep'] = ','
-        
-    pd = require_pandas()
-    csv = pd.read_csv(path, **pandas_kwargs)
-    csv_standardized = _standardize(csv)
-    csv_with_gradient = _add_gradient_columns(csv_standardized)
+    """Read orientations from a CSV or Parquet file.
+
+    Same as :func:`read_surface_points`. If the file has azimuth, dip and polarity columns the gradients are
+    computed from them.
+
+    Args:
+        path (str): Path of the file.
+        coord_x_name, coord_y_name, coord_z_name (str): Standardized names of the coordinate columns.
+        gx_name, gy_name, gz_name (str): Standardized names of the gradient columns.
+        surface_name (str): Standardized name of the column with the surface of each orientation.
+        name_id_map (Optional[dict[str, int]]): Mapping between surface names and ids. Generated if None.
+        pandas_kwargs (dict): Extra arguments of ``pandas.read_csv``. Not used for Parquet files.
+
+    Returns:
+        OrientationsTable: The orientations.
+    """
+    columns = _add_gradient_columns(_read_columns(path, pandas_kwargs))
 
     orientations: OrientationsTable = OrientationsTable.from_arrays(
-        x=csv_with_gradient[coord_x_name].values,
-        y=csv_with_gradient[coord_y_name].values,
-        z=csv_with_gradient[coord_z_name].values,
-        G_x=csv_with_gradient[gx_name].values,
-        G_y=csv_with_gradient[gy_name].values,
-        G_z=csv_with_gradient[gz_name].values,
-        names=csv_with_gradient[surface_name].values,  # TODO: This we will have to map it with StructuralFrame
+        x=columns[coord_x_name],
+        y=columns[coord_y_name],
+        z=columns[coord_z_name],
+        G_x=columns[gx_name],
+        G_y=columns[gy_name],
+        G_z=columns[gz_name],
+        names=columns[surface_name],  # TODO: This we will have to map it with StructuralFrame
         name_id_map=name_id_map
     )
 
     return orientations
 
 
+def _read_columns(path: str, pandas_kwargs: Optional[dict]) -> dict[str, np.ndarray]:
+    if str(path).lower().endswith(PARQUET_EXTENSIONS):
+        pa = require_pyarrow()
+        table = pa.parquet.read_table(path)
+        columns = {}
+        for name, column in zip(table.column_names, table.columns):
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            columns[name] = column.to_numpy()
+    else:
+        pandas_kwargs = dict(pandas_kwargs or {})
+        pandas_kwargs.setdefault('sep', ',')
+
+        pd = require_pandas()
+        csv = pd.read_csv(path, **pandas_kwargs)
+        columns = {name: csv[name].to_numpy() for name in csv.columns}
+
+    return _standardize(columns)
+
+
 COLUMN_NAME_MAPPING = {
     "X"        : ["X", "x"],
     "Y"        : ["Y", "y"],
@@ -84,20 +122,28 @@ COLUMN_NAME_MAPPING = {
 }
 
 
-def _standardize(df: 'pandas.DataFrame'):
-    for column in df.columns:
-        for standard_name, possible_names in COLUMN_NAME_MAPPING.items():
-            if column in possible_names:
-                df.rename(columns={column: standard_name}, inplace=True)
+STANDARD_COLUMN_NAMES = {name: standard_name for standard_name, possible_names in COLUMN_NAME_MAPPING.items() for name in possible_names}
+
 
-    return df
+def _standardize(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    standardized = {}
+    source_names = {}
+    for name, values in columns.items():
+        standard_name = STANDARD_COLUMN_NAMES.get(name, name)
+        if standard_name in standardized:
+            raise ValueError(f"Columns '{source_names[standard_name]}' and '{name}' both map to '{standard_name}'. "
+                             f"Drop or rename one of them.")
+        standardized[standard_name] = values
+        source_names[standard_name] = name
+    return standardized
 
 
-def _add_gradient_columns(df):
-    if "azimuth" in df.columns and "dip" in df.columns and "polarity" in df.columns:
+def _add_gradient_columns(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    if "azimuth" in columns and "dip" in columns and "polarity" in columns:
         # Convert azimuth, dip, polarity to gradient
-        df['G_x'] = np.sin(np.deg2rad(df['dip'])) * np.sin(np.deg2rad(df['azimuth'])) * df['polarity']
-        df['G_y'] = np.sin(np.deg2rad(df['dip'])) * np.cos(np.deg2rad(df['azimuth'])) * df['polarity']
-        df['G_z'] = np.cos(np.deg2rad(df['dip'])) * df['polarity']
+        dip, azimuth, polarity = np.deg2rad(columns['dip']), np.deg2rad(columns['azimuth']), columns['polarity']
+        columns['G_x'] = np.sin(dip) * np.sin(azimuth) * polarity
+        columns['G_y'] = np.sin(dip) * np.cos(azimuth) * polarity
+        columns['G_z'] = np.cos(dip) * polarity
 
-    return df
+    return columns
@@ -88,5 +88,5 @@ def _move_element(structural_groups: list[StructuralGroup], element_name: str, f
         raise ValueError(f"Element '{element_name}' not found in group '{from_group_name}'.")
 
     # Remove the element from the source group and add it to the destination group
-    from_group.elements.remove(element)
-    to_group.elements.append(element)
+    from_group.remove_element(element)
+    to_group.append_element(element)
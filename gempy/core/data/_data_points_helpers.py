@@ -1,21 +1,98 @@
-﻿from typing import Sequence
+﻿import hashlib
+from typing import Optional, Sequence
 
 import numpy as np
 
 
 def structural_element_hasher(i: int, name: str, hash_length: int = 8) -> int:
-    # Get the last 'hash_length' digits from the hash
-    name_hash = abs(hash(name)) % (10 ** hash_length)
+    """Deterministic id of the i-th element named `name`, the same in every process.
+
+    The builtin `hash` of a string is salted per process (PYTHONHASHSEED), so a digest of the name is used instead.
+    """
+    # Get the last 'hash_length' digits from the digest
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    name_hash = int.from_bytes(digest, "little") % (10 ** hash_length)
 
     return i * (10 ** hash_length) + name_hash
 
 
 def generate_ids_from_names(name_id_map, names, x):
-    name_id_map = name_id_map or {name: structural_element_hasher(i, name) for i, name in enumerate(np.unique(names))}
     if isinstance(names, str):
-        ids = np.array([name_id_map[names]] * len(x))
-    elif isinstance(names, Sequence) or isinstance(names, np.ndarray):
-        ids = np.array([name_id_map[name] for name in names])
-    else:
+        name_id_map = name_id_map or {names: structural_element_hasher(0, names)}
+        return np.full(len(x), name_id_map[names]), name_id_map
+    if not isinstance(names, (Sequence, np.ndarray)):
         raise TypeError(f"Names should be a string or a NumPy array, not {type(names)}")
-    return ids, name_id_map
+
+    unique_names, inverse = _unique_names(names)
+    name_id_map = name_id_map or {name: structural_element_hasher(i, name) for i, name in enumerate(unique_names)}
+    return _scatter_ids(unique_names, inverse, name_id_map), name_id_map
+
+
+def ids_from_names(names, name_id_map: dict, n_rows: int) -> np.ndarray:
+    """Vectorized ``[name_id_map[name] for name in names]``: the map is queried once per distinct name and the ids
+    are scattered back to the rows with the inverse of `np.unique`."""
+    if isinstance(names, str):
+        return np.full(n_rows, name_id_map[names])
+    return _scatter_ids(*_unique_names(names), name_id_map)
+
+
+def _unique_names(names) -> tuple[np.ndarray, np.ndarray]:
+    names = np.asarray(names)
+    if names.dtype == object:
+        names = names.astype(str)  # * Sorting fixed width strings is several times faster than Python objects
+    unique_names, inverse = np.unique(names, return_inverse=True)
+    return unique_names, inverse.reshape(-1)
+
+
+def _scatter_ids(unique_names: np.ndarray, inverse: np.ndarray, name_id_map: dict) -> np.ndarray:
+    unique_ids = np.array([name_id_map[name] for name in unique_names], dtype=int)
+    return unique_ids[inverse]
+
+
+def columns_view(data: np.ndarray, first_field: str, n_columns: int = 3) -> np.ndarray:
+    """Zero-copy (n, n_columns) float64 view over consecutive float64 fields of a structured array.
+
+    Writing into the view writes into `data`.
+    """
+    names = data.dtype.names
+    start = names.index(first_field)
+    first_offset = data.dtype.fields[first_field][1]
+    for i, name in enumerate(names[start:start + n_columns]):
+        field_dtype, offset = data.dtype.fields[name][:2]
+        if field_dtype != np.float64 or offset != first_offset + 8 * i:
+            raise ValueError(f"Fields from {first_field} are not {n_columns} consecutive float64 columns")
+
+    first_column = data[first_field]
+    return np.lib.stride_tricks.as_strided(
+        first_column,
+        shape=(data.shape[0], n_columns),
+        strides=(first_column.strides[0], 8)
+    )
+
+
+def append_rows(storage: Optional[np.ndarray], data: np.ndarray, new_rows: np.ndarray,
+                min_capacity: int = 16) -> tuple[np.ndarray, np.ndarray]:
+    """Appends `new_rows` to `data`, where `data` may be a prefix view of a larger `storage` array.
+
+    The storage grows by doubling, so appending rows one at a time costs amortized O(1) per row. If `data` is not
+    a prefix of `storage` anymore (it was replaced, e.g. by a view into a shared buffer) new storage is allocated.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The storage and the new data, a prefix view of the storage.
+    """
+    n_rows = len(data)
+    required = n_rows + len(new_rows)
+
+    is_prefix = (
+            storage is not None
+            and data.base is storage
+            and data.__array_interface__['data'][0] == storage.__array_interface__['data'][0]
+    )
+    if not is_prefix or len(storage) < required:
+        current_capacity = len(storage) if is_prefix else n_rows
+        new_storage = np.empty(max(required, 2 * current_capacity, min_capacity), dtype=data.dtype)
+        new_storage[:n_rows] = data
+        storage = new_storage
+
+    storage[n_rows:required] = new_rows
+    return storage, storage[:required]
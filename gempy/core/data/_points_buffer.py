@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class ContiguousPointsBuffer:
+    """
+    Contiguous structured array shared by the point tables of the structural elements of a frame.
+
+    Once the buffer is built, the data of every element table is a view over its own row range, so the
+    frame-level table is read with a single copy and written back in place. Any element table whose data
+    was replaced (appending points, reordering elements, unpickling...) is detected on the next access and
+    the buffer is rebuilt from the element tables.
+    """
+
+    table_attribute: str  #: Name of the element attribute holding the table, i.e. `surface_points` or `orientations`.
+    dtype: np.dtype  #: Structured data type of the table.
+    buffer: Optional[np.ndarray] = field(default=None, repr=False)  #: Rows of every element, in element order.
+    offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=int), repr=False)  #: Start row of each element plus the total number of rows.
+
+    def sync(self, elements: Sequence["StructuralElement"]) -> np.ndarray:
+        """
+        Return the shared buffer, rebuilding it if any element table does not view its row range anymore.
+
+        Args:
+            elements (Sequence[StructuralElement]): Elements of the frame, in order.
+
+        Returns:
+            np.ndarray: The shared structured array. Writing into it modifies the element tables.
+        """
+        tables = [getattr(element, self.table_attribute) for element in elements]
+        if not self._is_consistent(tables):
+            self._rebuild(tables)
+        return self.buffer
+
+    def remove_rows(self, elements: Sequence["StructuralElement"], mask: np.ndarray) -> int:
+        """
+        Remove the rows selected by `mask` from the buffer and from every element table in a single pass.
+
+        Args:
+            elements (Sequence[StructuralElement]): Elements of the frame, in order.
+            mask (np.ndarray): Boolean array with one entry per buffer row. True rows are removed.
+
+        Returns:
+            int: Number of removed rows.
+        """
+        buffer = self.sync(elements)
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(buffer),):
+            raise ValueError(f"The mask must have one entry per row ({len(buffer)}), but it has shape {mask.shape}.")
+
+        keep = ~mask
+        kept_before_row = np.concatenate([[0], np.cumsum(keep, dtype=int)])
+        self.offsets = kept_before_row[self.offsets]
+        self.buffer = buffer[keep]
+
+        tables = [getattr(element, self.table_attribute) for element in elements]
+        for table, start, stop in zip(tables, self.offsets[:-1], self.offsets[1:]):
+            table.data = self.buffer[start:stop]
+        return int(np.count_nonzero(mask))
+
+    def _is_consistent(self, tables: list) -> bool:
+        if self.buffer is None or len(tables) + 1 != len(self.offsets):
+            return False
+
+        buffer_address = self.buffer.__array_interface__['data'][0]
+        itemsize = self.dtype.itemsize
+        for table, start, stop in zip(tables, self.offsets[:-1], self.offsets[1:]):
+            data = table.data
+            if len(data) != stop - start:
+                return False
+            if len(data) == 0:
+                continue
+            if (data.base is not self.buffer
+                    or data.strides[0] != itemsize
+                    or data.__array_interface__['data'][0] != buffer_address + start * itemsize):
+                return False
+        return True
+
+    def _rebuild(self, tables: list) -> None:
+        lengths = [len(table.data) for table in tables]
+        self.offsets = np.concatenate([[0], np.cumsum(lengths, dtype=int)])
+        self.buffer = np.concatenate([table.data for table in tables]) if tables else np.zeros(0, dtype=self.dtype)
+
+        for table, start, stop in zip(tables, self.offsets[:-1], self.offsets[1:]):
+            table.data = self.buffer[start:stop]
@@ -10,4 +10,8 @@ class GemPyEngineConfig:
     backend: AvailableBackends = config.DEFAULT_BACKEND # ? This can be grabbed from gempy.config file?
     use_gpu: bool = False
     dtype: Optional[str] = None  #: The data type used in the engine. If None, the default data type of the backend is used.
-    
\ No newline at end of file
+    incremental_solve: bool = False  #: If True, kriging systems are solved by updating the factorization of the previous solve of each group (numpy backend only).
+    reuse_scalar_fields: bool = False  #: If True, the scalar fields of every group are kept between calls and groups whose input did not change are not evaluated again (numpy backend only). Holds the fields of the last call in memory.
+    
+    solutions_cache_dir: Optional[str] = None  #: If set, solutions are cached on disk in this directory, keyed by the model content (numpy backend only).
+    solutions_cache_max_bytes: int = 2 ** 30  #: Size cap of the on-disk solutions cache. Least recently used entries are evicted above it.
@@ -19,6 +19,10 @@ from .surface_points import SurfacePointsTable
 from .structural_frame import StructuralFrame
 from .grid import Grid
 from ...modules.data_manipulation.engine_factory import interpolation_input_from_structural_frame
+from ...modules.data_manipulation.interpolation_input_cache import InterpolationInputCache
+from ...modules.data_manipulation.kriging_weights_cache import KrigingWeightsCache
+from ...modules.data_manipulation.incremental_kriging_solver import IncrementalKrigingSolver
+from ...modules.data_manipulation.scalar_field_cache import ScalarFieldCache
 
 """
 TODO:
@@ -64,8 +68,10 @@ class GeoModel:
     input_transform: Transform = None  #: The transformation used in the geological model for input points.
 
     interpolation_grid: EngineGrid = None  #: Optional grid used for interpolation. Can be seen as a cache field.
-    _interpolationInput: InterpolationInput = None  #: Input data for interpolation. Fed by the structural frame and can be seen as a cache field.
-    _input_data_descriptor: InputDataDescriptor = None  #: Descriptor of the input data. Fed by the structural frame and can be seen as a cache field.
+    _interpolation_input_cache: InterpolationInputCache = None  #: Per-component cache of the engine input (points, orientations, grid and descriptor) fed by the structural frame.
+    _kriging_weights_cache: KrigingWeightsCache = None  #: Solved kriging weights per structural group, reused while the group input does not change.
+    _incremental_solver: IncrementalKrigingSolver = None  #: Factorizations of the last kriging systems, updated instead of re-solved when `GemPyEngineConfig.incremental_solve` is set.
+    _scalar_field_cache: ScalarFieldCache = None  #: Scalar fields of the last engine call per structural group, reused for groups whose input and upstream faults did not change when `GemPyEngineConfig.reuse_scalar_fields` is set.
 
     # endregion
     _solutions: Solutions = field(init=False, default=None)  #: The computed solutions of the geological model. 
@@ -85,6 +91,10 @@ class GeoModel:
 
         self.grid = grid
         self._interpolation_options = interpolation_options
+        self._interpolation_input_cache = InterpolationInputCache()
+        self._kriging_weights_cache = KrigingWeightsCache()
+        self._incremental_solver = IncrementalKrigingSolver()
+        self._scalar_field_cache = ScalarFieldCache()
         self.input_transform = Transform.from_input_points(
             surface_points=self.surface_points_copy,
             orientations=self.orientations_copy
@@ -94,6 +104,14 @@ class GeoModel:
         # TODO: Improve this
         return pprint.pformat(self.__dict__)
 
+    def __getstate__(self):
+        # * Caches and runtime state are not pickled nor saved. The cache properties rebuild them empty on access
+        state = self.__dict__.copy()
+        for name in ("legacy_model", "taped_interpolation_input", "interpolation_grid", "_interpolation_input_cache",
+                     "_kriging_weights_cache", "_incremental_solver", "_scalar_field_cache"):
+            state.pop(name, None)
+        return state
+
     def update_transform(self, auto_anisotropy: GlobalAnisotropy = GlobalAnisotropy.NONE, anisotropy_limit: Optional[np.ndarray] = None):
         """Update the transformation of the geological model.
 
@@ -117,23 +135,7 @@ class GeoModel:
     def interpolation_options(self) -> InterpolationOptions:
         n_octree_lvl = self._interpolation_options.number_octree_levels  # * we access the private one because we do not care abot the extract mesh octree level
 
-        octrees_set: bool = Grid.GridTypes.OCTREE in self.grid.active_grids
-        dense_set: bool = Grid.GridTypes.DENSE in self.grid.active_grids
-
-        # Create a tuple representing the conditions
-        match (octrees_set, dense_set):
-            case (True, False):
-                self._interpolation_options.block_solutions_type = RawArraysSolution.BlockSolutionType.OCTREE
-            case (True, True):
-                warnings.warn("Both octree levels and resolution are set. The default grid for the `raw_array_solution`"
-                              "and plots will be the dense regular grid. To use octrees instead, set resolution to None in the "
-                              "regular grid.")
-                self._interpolation_options.block_solutions_type = RawArraysSolution.BlockSolutionType.DENSE_GRID
-            case (False, True):
-                self._interpolation_options.block_solutions_type = RawArraysSolution.BlockSolutionType.DENSE_GRID
-            case (False, False):
-                self._interpolation_options.block_solutions_type = RawArraysSolution.BlockSolutionType.NONE
-
+        self._interpolation_options.block_solutions_type = self.grid.block_solution_type
         self._interpolation_options.cache_model_name = self.meta.name
         return self._interpolation_options
 
@@ -250,24 +252,44 @@ class GeoModel:
                                 transformed[:, 2].min(), transformed[:, 2].max()])
         return new_extents
 
+    @property
+    def interpolation_input_cache(self) -> InterpolationInputCache:
+        """Cache of the engine input. Components are only rebuilt when the data they depend on changed."""
+        if self._interpolation_input_cache is None:
+            self._interpolation_input_cache = InterpolationInputCache()
+        return self._interpolation_input_cache
+
+    @property
+    def kriging_weights_cache(self) -> KrigingWeightsCache:
+        """Kriging weights of the last solve per structural group."""
+        if self._kriging_weights_cache is None:
+            self._kriging_weights_cache = KrigingWeightsCache()
+        return self._kriging_weights_cache
+
+    @property
+    def incremental_solver(self) -> IncrementalKrigingSolver:
+        """Factorizations of the last kriging system of each structural group."""
+        if self._incremental_solver is None:
+            self._incremental_solver = IncrementalKrigingSolver()
+        return self._incremental_solver
+
+    @property
+    def scalar_field_cache(self) -> ScalarFieldCache:
+        """Scalar fields of the last engine call per structural group."""
+        if self._scalar_field_cache is None:
+            self._scalar_field_cache = ScalarFieldCache()
+        return self._scalar_field_cache
+
     @property
     def interpolation_input_copy(self):
         warnings.warn("This property is deprecated. Use directly "
                       "`interpolation_input_from_structural_frame` instead.", DeprecationWarning)
 
-        if self.structural_frame.is_dirty is False:
-            return self._interpolationInput
-
-        self._interpolationInput = interpolation_input_from_structural_frame(
-            geo_model=self
-        )
-
-        return self._interpolationInput
+        return self.interpolation_input_cache.get_interpolation_input(geo_model=self)
 
     @property
     def input_data_descriptor(self) -> InputDataDescriptor:
-        # TODO: This should have the exact same dirty logic as interpolation_input
-        return self.structural_frame.input_data_descriptor
+        return self.interpolation_input_cache.get_input_data_descriptor(self.structural_frame)
 
     def add_surface_points(self, X: Sequence[float], Y: Sequence[float], Z: Sequence[float],
                            surface: Sequence[str], nugget: Optional[Sequence[float]] = None) -> None:
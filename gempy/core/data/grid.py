@@ -7,6 +7,7 @@ from typing import Optional
 
 from gempy_engine.core.data.centered_grid import CenteredGrid
 from gempy_engine.core.data.options import EvaluationOptions
+from gempy_engine.core.data.raw_arrays_solution import RawArraysSolution
 from gempy_engine.core.data.transforms import Transform
 from .grid_modules import RegularGrid, CustomGrid, Sections
 from .grid_modules.topography import Topography
@@ -25,9 +26,6 @@ class Grid:
 
     # ? What should we do with the extent?
 
-    values: np.ndarray
-    length: np.ndarray
-    
     _octree_grid: Optional[RegularGrid] = None
     _dense_grid: Optional[RegularGrid] = None
     _custom_grid: Optional[CustomGrid] = None
@@ -40,11 +38,9 @@ class Grid:
 
     _octree_levels: int = -1
 
+    _values_cache: Optional[tuple[list[np.ndarray], np.ndarray]] = None  #: Materialized `values` together with the sub-grid arrays it was built from, kept alive so their ids are not reused.
+
     def __init__(self, extent=None, resolution=None):
-        
-        self.values = np.empty((0, 3))
-        self.length = np.empty(0)
-        
         # Init basic grid empty
         if extent is not None and resolution is not None:
             self.dense_grid = RegularGrid(extent, resolution)
@@ -65,6 +61,12 @@ class Grid:
     def init_dense_grid(cls, extent, resolution):
         return cls(extent, resolution)
 
+    def __getstate__(self):
+        # * `values` is materialized again on first access
+        state = self.__dict__.copy()
+        state.pop('_values_cache', None)
+        return state
+
     def __str__(self):
         active_grid_types_str = [g_type for g_type in self.GridTypes if self.active_grids & g_type]
 
@@ -126,6 +128,26 @@ class Grid:
         self._active_grids = value
         self._update_values()
 
+    @property
+    def block_solution_type(self) -> RawArraysSolution.BlockSolutionType:
+        """Grid used to fill the block solutions of `raw_arrays`, depending on the active grids."""
+        octrees_set: bool = self.GridTypes.OCTREE in self.active_grids
+        dense_set: bool = self.GridTypes.DENSE in self.active_grids
+
+        # Create a tuple representing the conditions
+        match (octrees_set, dense_set):
+            case (True, False):
+                return RawArraysSolution.BlockSolutionType.OCTREE
+            case (True, True):
+                warnings.warn("Both octree levels and resolution are set. The default grid for the `raw_array_solution`"
+                              "and plots will be the dense regular grid. To use octrees instead, set resolution to None in the "
+                              "regular grid.")
+                return RawArraysSolution.BlockSolutionType.DENSE_GRID
+            case (False, True):
+                return RawArraysSolution.BlockSolutionType.DENSE_GRID
+            case _:
+                return RawArraysSolution.BlockSolutionType.NONE
+
     @property
     def dense_grid(self) -> RegularGrid:
         return self._dense_grid
@@ -232,32 +254,53 @@ class Grid:
         else:
             return None
 
+    @property
+    def values(self) -> np.ndarray:
+        """Coordinates of all active grids stacked in the order of `GridTypes`.
+
+        This is a virtual view: the sub-grids are only concatenated when this property is read, and the result is
+        reused while every active sub-grid returns the same array object as in the last read. Editing a sub-grid
+        array in place is not detected: assign a new array, or set the sub-grid again, to refresh it.
+        """
+        sub_grids_values = self._active_values()
+        if self._values_cache is None or not _same_arrays(self._values_cache[0], sub_grids_values):
+            values = np.concatenate(sub_grids_values) if sub_grids_values else np.empty((0, 3))
+            self._values_cache = (sub_grids_values, values)
+        return self._values_cache[1]
+
+    @property
+    def length(self) -> np.ndarray:
+        """Offsets of every active grid in `values`, i.e. grid `i` spans ``values[length[i]:length[i + 1]]``."""
+        return np.cumsum([0] + [values.shape[0] for values in self._active_values()])
+
+    def _active_values(self) -> list[np.ndarray]:
+        sub_grids = [
+                (self.GridTypes.OCTREE, self.octree_grid),
+                (self.GridTypes.DENSE, self.dense_grid),
+                (self.GridTypes.CUSTOM, self.custom_grid),
+                (self.GridTypes.TOPOGRAPHY, self.topography),
+                (self.GridTypes.SECTIONS, self.sections),
+                (self.GridTypes.CENTERED, self.centered_grid)
+        ]
+        return [sub_grid.values for grid_type, sub_grid in sub_grids if grid_type in self.active_grids and sub_grid is not None]
+
     # noinspection t
     def _update_values(self):
-        values = []
-
+        """Validates the active grids. Values are not materialized here anymore, see `values`."""
         if self.GridTypes.OCTREE in self.active_grids:
             if self.octree_grid is None: raise AttributeError('Octree grid is active but not defined')
-            values.append(self.octree_grid.values)
         if self.GridTypes.DENSE in self.active_grids:
             if self.dense_grid is None: raise AttributeError('Dense grid is active but not defined')
-            values.append(self.dense_grid.values)
         if self.GridTypes.CUSTOM in self.active_grids:
             if self.custom_grid is None: raise AttributeError('Custom grid is active but not defined')
-            values.append(self.custom_grid.values)
         if self.GridTypes.TOPOGRAPHY in self.active_grids:
             if self.topography is None: raise AttributeError('Topography grid is active but not defined')
-            values.append(self.topography.values)
         if self.GridTypes.SECTIONS in self.active_grids:
             if self.sections is None: raise AttributeError('Sections grid is active but not defined')
-            values.append(self.sections.values)
         if self.GridTypes.CENTERED in self.active_grids:
             if self.centered_grid is None: raise AttributeError('Centered grid is active but not defined')
-            values.append(self.centered_grid.values)
 
-        self.values = np.concatenate(values)
-
-        return self.values
+        self._values_cache = None
 
     def get_section_args(self, section_name: str):
         # TODO: This method should be part of the sections
@@ -265,3 +308,7 @@ class Grid:
         l0, l1 = self.get_grid_args('sections')
         where = np.where(self.sections.names == section_name)[0][0]
         return l0 + self.sections.length[where], l0 + self.sections.length[where + 1]
+
+
+def _same_arrays(cached: list[np.ndarray], current: list[np.ndarray]) -> bool:
+    return len(cached) == len(current) and all(a is b for a, b in zip(cached, current))
@@ -1,2 +1,3 @@
 from .grid_types import Sections, RegularGrid, CustomGrid
 from .topography import Topography
+from .tiled_topography import TiledTopography
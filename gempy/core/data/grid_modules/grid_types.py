@@ -1,6 +1,6 @@
 import dataclasses
 
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Iterator
 
 import numpy as np
 
@@ -18,19 +18,37 @@ class RegularGrid:
     """
     resolution: np.ndarray
     extent: np.ndarray  #: this is the ORTHOGONAL extent. If the grid is rotated, the extent will be different
-    values: np.ndarray
     mask_topo: np.ndarray
     _transform: Transform  #: If a transform exists, it will be applied to the grid
+    _values: Optional[np.ndarray]  #: Cell centers, built on first access of `values`
 
     def __init__(self, extent: np.ndarray, resolution: np.ndarray, transform: Optional[Transform] = None):
         self.resolution = np.ones((0, 3), dtype='int64')
         self.extent = np.zeros(6, dtype='float64')
-        self.values = np.zeros((0, 3))
+        self._values = None
         self.mask_topo = np.zeros((0, 3), dtype=bool)
 
         self.set_regular_grid(extent, resolution, transform)
 
-    def _create_regular_grid_3d(self):
+    def __getstate__(self):
+        # * The cell centers follow from the extent and resolution, see `__setstate__`
+        state = self.__dict__.copy()
+        state.pop('_values', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._values = None
+
+    @property
+    def values(self) -> np.ndarray:
+        """(n, 3) coordinates of the cell centers. They are only built on first access, so a grid that is only
+        computed in chunks, see :meth:`iter_values`, never holds them."""
+        if self._values is None:
+            self._values = self._create_regular_grid_3d()
+        return self._values
+
+    def _create_regular_grid_3d(self) -> np.ndarray:
         coords = self.x_coord, self.y_coord, self.z_coord
 
         g = np.meshgrid(*coords, indexing="ij")
@@ -38,12 +56,35 @@ class RegularGrid:
 
         # Transform the values
         if self.transform is not None:
-            self.values = self.transform.apply_inverse_with_pivot(
+            values = self.transform.apply_inverse_with_pivot(
                 points=values,
                 pivot=np.array([self.extent[0], self.extent[2], self.extent[4]])
             )
-        else:
-            self.values = values
+        return values
+
+    def iter_values(self, chunk_size: int, orthogonal: bool = False) -> Iterator[tuple[slice, np.ndarray]]:
+        """
+        Lazily generate the grid values in chunks, in the same order as `values`.
+
+        Args:
+            chunk_size (int): Maximum number of points per chunk.
+            orthogonal (bool): If True the grid transform is not applied.
+
+        Yields:
+            tuple[slice, np.ndarray]: The slice of the chunk in `values` and its (n, 3) coordinates.
+        """
+        coords = self.x_coord, self.y_coord, self.z_coord
+        n_points = int(np.prod(self.resolution))
+        pivot = np.array([self.extent[0], self.extent[2], self.extent[4]])
+
+        for start in range(0, n_points, chunk_size):
+            stop = min(start + chunk_size, n_points)
+            indices = np.unravel_index(np.arange(start, stop), tuple(self.resolution))
+            values = np.stack([coord[index] for coord, index in zip(coords, indices)], axis=1)
+
+            if self._transform is not None and orthogonal is False:
+                values = self.transform.apply_inverse_with_pivot(points=values, pivot=pivot)
+            yield slice(start, stop), values
 
     def set_regular_grid(self, extent: Sequence[float], resolution: Sequence[int], transform: Optional[Transform] = None):
         """
@@ -57,12 +98,11 @@ class RegularGrid:
         resolution_equal = np.array_equal(resolution, self.resolution)
 
         if extent_equal and resolution_equal:
-            return self.values
+            return
 
         self.extent = np.asarray(extent, dtype='float64')
         self.resolution = np.asarray(resolution)
         self.transform = transform
-        self._create_regular_grid_3d()
 
     @property
     def transform(self) -> Transform:
@@ -73,6 +113,7 @@ class RegularGrid:
     @transform.setter
     def transform(self, value: Transform):
         self._transform = value
+        self._values = None
 
     @classmethod
     def from_corners_box(cls, pivot: tuple, point_x_axis: tuple, distance_point3: float,
@@ -0,0 +1,94 @@
+import os
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .grid_types import RegularGrid
+from .topography import Topography
+from ....modules.grids.read_dem import read_dem
+
+
+class TiledTopography(Topography):
+    """
+    Topography backed by a, usually memory-mapped, raster of heights.
+
+    The topography is sampled at the voxel columns by tiles of the regular grid, reading only the pixels around the
+    voxel columns of the tile, so peak memory depends on `tile_size` and the grid and not on the size of the raster.
+
+    Notes:
+        Unlike :class:`Topography`, heights are sampled at the voxel centers by their coordinates, so the raster
+        does not need to fit the extent of the regular grid.
+    """
+
+    def __init__(self, regular_grid: RegularGrid, z: np.ndarray, origin: Sequence[float], spacing: Sequence[float],
+                 tile_size: int = 256):
+        super().__init__(regular_grid)
+        self.tile_size = tile_size  #: Number of voxel columns per axis sampled at once.
+        self.set_z(z, origin, spacing)
+
+    @classmethod
+    def from_file(cls, regular_grid: RegularGrid, path: str, crop_to_extent: Optional[Sequence[float]] = None,
+                  origin: Optional[Sequence[float]] = None, spacing: Optional[Sequence[float]] = None,
+                  tile_size: int = 256, cache_dir: Optional[str] = None) -> "TiledTopography":
+        """Creates a tiled topography from a raster file, cropped to the regular grid extent by default. See
+        :func:`gempy.modules.grids.read_dem.read_dem` for the arguments."""
+        if crop_to_extent is None:
+            crop_to_extent = regular_grid.extent[:4]
+        z, origin, spacing = read_dem(path, crop_to_extent=crop_to_extent, origin=origin, spacing=spacing,
+                                      cache_dir=cache_dir)
+        topography = cls(regular_grid, z, origin, spacing, tile_size=tile_size)
+        topography.source = path
+
+        # * The raster is not digested: the file and the crop identify the heights
+        stat = os.stat(path)
+        topography._dem_source_key = (
+            os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+            tuple(topography.origin.tolist()), tuple(topography.spacing.tolist()), topography.z.shape
+        )
+        return topography
+
+    def _sample_surface(self, regular_grid: RegularGrid) -> np.ndarray:
+        x_coord, y_coord = regular_grid.x_coord, regular_grid.y_coord
+        surface = np.empty((len(x_coord), len(y_coord)))
+        for x_start in range(0, len(x_coord), self.tile_size):
+            x_tile = slice(x_start, x_start + self.tile_size)
+            for y_start in range(0, len(y_coord), self.tile_size):
+                y_tile = slice(y_start, y_start + self.tile_size)
+                surface[x_tile, y_tile] = self.sample(x_coord[x_tile], y_coord[y_tile])
+        return surface
+
+    def sample(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Bilinear heights at the nodes of the grid spanned by the axes `x` and `y`. Coordinates outside the raster
+        take the height of the closest edge.
+
+        Only the raster rows and columns bracketing the coordinates are read.
+
+        Returns:
+            np.ndarray: Heights of shape (len(x), len(y)).
+        """
+        x_lower, x_weight = _axis_position(x, self.origin[0], self.spacing[0], self.z.shape[0])
+        y_lower, y_weight = _axis_position(y, self.origin[1], self.spacing[1], self.z.shape[1])
+        x_upper = np.minimum(x_lower + 1, self.z.shape[0] - 1)
+        y_upper = np.minimum(y_lower + 1, self.z.shape[1] - 1)
+
+        rows, row_index = np.unique(np.concatenate([x_lower, x_upper]), return_inverse=True)
+        columns, column_index = np.unique(np.concatenate([y_lower, y_upper]), return_inverse=True)
+        window = np.asarray(self.z[np.ix_(rows, columns)], dtype="float64")
+
+        lower_rows, upper_rows = np.split(row_index, 2)
+        lower_columns, upper_columns = np.split(column_index, 2)
+        x_weight, y_weight = x_weight[:, None], y_weight[None, :]
+        return (
+                window[np.ix_(lower_rows, lower_columns)] * (1 - x_weight) * (1 - y_weight) +
+                window[np.ix_(upper_rows, lower_columns)] * x_weight * (1 - y_weight) +
+                window[np.ix_(lower_rows, upper_columns)] * (1 - x_weight) * y_weight +
+                window[np.ix_(upper_rows, upper_columns)] * x_weight * y_weight
+        )
+
+
+def _axis_position(coords: np.ndarray, origin: float, spacing: float, n: int) -> tuple[np.ndarray, np.ndarray]:
+    position = np.clip((np.asarray(coords) - origin) / spacing, 0, n - 1)
+    lower = np.minimum(np.floor(position).astype(np.intp), max(n - 2, 0))
+    return lower, position - lower
+
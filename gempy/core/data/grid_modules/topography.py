@@ -1,10 +1,12 @@
 import warnings
-from typing import Optional
+from typing import Hashable, Iterator, Optional, Sequence, Union
 
 import numpy as np
 
 from .grid_types import RegularGrid
+from .topography_mask_cache import TopographyMaskCache, dem_digest
 from ....modules.grids.create_topography import _LoadDEMArtificial
+from ....modules.grids.rasterize_points import rasterize_points
 
 from ....optional_dependencies import require_skimage
 
@@ -13,6 +15,14 @@ class Topography:
     """
     Object to include topography in the model.
 
+    The topography is a regular raster: only the 2D array of heights `z` is stored, X and Y follow from `origin`,
+    the coordinates of the first node, and `spacing`. The (n, 3) `values` are built on first access, or in chunks with
+    :meth:`iter_values`.
+
+    The engine still takes the topography as one (n, 3) array of transformed coordinates. Computing a model fills
+    that array from :meth:`iter_values` chunk by chunk, so `values` itself is not built, but the full array of the
+    engine exists for the length of the computation.
+
     Notes:
         This always assumes that the topography we pass fits perfectly the extent
 
@@ -20,31 +30,60 @@ class Topography:
 
     def __init__(self, regular_grid: RegularGrid, values_2d: Optional[np.ndarray] = None):
 
-        self._mask_topo = None
+        self._mask_cache = TopographyMaskCache()
+        self._dem_digest = None
+        self._dem_source_key = None
         self._regular_grid = regular_grid
 
-        # Values (n, 3)
-        self.values = np.zeros((0, 3))
+        # Heights (n, m) and position of the nodes
+        self.z = np.zeros((0, 0))
+        self.origin = np.zeros(2)
+        self.spacing = np.ones(2)
 
-        # Values (n, n, 3)
-        self.values_2d = np.zeros((0, 0, 3))
+        # Values (n, 3), built from z on first access
+        self._values = None
 
         # Shape original
         self.raster_shape = tuple()
 
-        # Topography Resolution
-        self.resolution = np.zeros((0, 3))
-
         # Source for the
         self.source = None
 
         # Coords
-        self._x = None
-        self._y = None
+        self._x = np.zeros(0)
+        self._y = np.zeros(0)
 
         if values_2d is not None:
             self.set_values(values_2d)
 
+    def __getstate__(self):
+        # * The (n, 3) values and the masks are rebuilt from `z`, see `__setstate__`
+        state = self.__dict__.copy()
+        for name in ('_values', '_dem_digest', '_mask_cache'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._values = None
+        self._dem_digest = None
+        self._mask_cache = TopographyMaskCache()
+
+    @classmethod
+    def from_z(cls, regular_grid: RegularGrid, z: np.ndarray, origin: Sequence[float], spacing: Sequence[float]):
+        """Creates a topography object from a 2D array of heights indexed as [x, y]
+
+        Args:
+            z (numpy.ndarray[float, float]): Heights
+            origin (Sequence[float]): X and Y of ``z[0, 0]``
+            spacing (Sequence[float]): Distance between nodes in X and Y
+
+        Returns:
+            :class:`gempy.core.grid_modules.topography.Topography`
+
+        """
+        return cls(regular_grid=regular_grid).set_z(z, origin, spacing)
+
     @classmethod
     def from_subsurface_structured_data(cls, structured_data: 'subsurface.StructuredData', regular_grid: RegularGrid):
         """Creates a topography object from a subsurface structured data object
@@ -66,52 +105,45 @@ class Topography:
         return cls.from_arrays(regular_grid, x_coordinates, y_coordinates, height_values)
 
     @classmethod
-    def from_unstructured_mesh(cls, regular_grid, xyz_vertices):
+    def from_unstructured_mesh(cls, regular_grid, xyz_vertices, resolution: Optional[Sequence[int]] = None,
+                               spacing: Union[float, Sequence[float], None] = None, method: str = 'nearest', **kwargs):
         """Creates a topography object from an unstructured mesh of XYZ vertices.
 
         Args:
             regular_grid (RegularGrid): The regular grid object.
             xyz_vertices (numpy.ndarray): Array of XYZ vertices of the unstructured mesh.
+            resolution (Sequence[int], optional): Number of topography nodes in X and Y. Defaults to the resolution
+                of the regular grid unless `spacing` is given.
+            spacing (float or Sequence[float], optional): Distance between topography nodes, e.g. to follow the
+                point density instead of the model resolution.
+            method (str): 'nearest', 'linear' or 'idw'. See :func:`gempy.modules.grids.rasterize_points.rasterize_points`,
+                which also takes the remaining keyword arguments.
 
         Returns:
             :class:`gempy.core.grid_modules.topography.Topography`
         """
-        # Perform Delaunay triangulation on the vertices
-
-        # Generate the regular grid points
-        from scipy.interpolate import griddata
-        
-        x_regular, y_regular = np.meshgrid(
-            np.linspace(regular_grid.extent[0], regular_grid.extent[1], regular_grid.resolution[0]),
-            np.linspace(regular_grid.extent[2], regular_grid.extent[3], regular_grid.resolution[1]),
-            indexing='ij'
-        )
-
-        # Interpolate the z-values onto the regular grid
-        z_regular = griddata(
-            points=xyz_vertices[:, :2],
-            values=xyz_vertices[:, 2],
-            xi=(x_regular, y_regular),
-            method='nearest',
-            fill_value=np.nan  # You can choose a different fill value or method
+        if resolution is None and spacing is None:
+            resolution = regular_grid.resolution[:2]
+
+        z, origin, spacing = rasterize_points(
+            xyz=xyz_vertices,
+            extent=regular_grid.extent[:4],
+            resolution=resolution,
+            spacing=spacing,
+            method=method,
+            **kwargs
         )
+        return cls.from_z(regular_grid=regular_grid, z=z, origin=origin, spacing=spacing)
 
-        # Reshape the grid for compatibility with existing structure
-        values_2d = np.stack((x_regular, y_regular, z_regular), axis=-1)
-
-        return cls(regular_grid=regular_grid, values_2d=values_2d)
-    
-    
     @classmethod
     def from_arrays(cls, regular_grid, x_coordinates, y_coordinates, height_values,):
-        x_vals, y_vals = np.meshgrid(x_coordinates, y_coordinates, indexing='ij')
-        # Reshape arrays for stacking
-        x_vals = x_vals[:, :, np.newaxis]  # shape (73, 34, 1)
-        y_vals = y_vals[:, :, np.newaxis]  # shape (73, 34, 1)
-        topography_vals = height_values.values[:, :, np.newaxis]  # shape (73, 34, 1)
-        # Stack along the last dimension
-        result = np.concatenate([x_vals, y_vals, topography_vals], axis=2)  # shape (73, 34, 3)
-        return cls(regular_grid=regular_grid, values_2d=result)
+        x_coordinates, y_coordinates = np.asarray(x_coordinates), np.asarray(y_coordinates)
+        return cls.from_z(
+            regular_grid=regular_grid,
+            z=np.asarray(height_values),
+            origin=(x_coordinates[0], y_coordinates[0]),
+            spacing=(_regular_step(x_coordinates), _regular_step(y_coordinates))
+        )
 
     @property
     def extent(self):
@@ -123,25 +155,83 @@ class Topography:
 
     @property
     def x(self):
-        if self._x is not None:
-            return self._x
-        else:
-            val = self.values[:, 0].copy()
-            val.sort()
-            return np.unique(val)
+        return self._x
 
     @property
     def y(self):
-        if self._y is not None:
-            return self._y
-        else:
-            val = self.values[:, 1].copy()
-            val.sort()
-            return np.unique(val)
+        return self._y
+
+    @property
+    def resolution(self):
+        return self.z.shape
+
+    @property
+    def values(self):
+        """(n, 3) XYZ of every node in C order. Built on first access and kept until the heights change."""
+        if self._values is None:
+            values = np.empty((self.z.size, 3))
+            values_2d = values.reshape((*self.z.shape, 3))
+            values_2d[..., 0] = self._x[:, None]
+            values_2d[..., 1] = self._y[None, :]
+            values_2d[..., 2] = self.z
+            self._values = values
+        return self._values
+
+    @property
+    def values_2d(self):
+        """(n, m, 3) view of `values`"""
+        return self.values.reshape((*self.z.shape, 3))
+
+    def iter_values(self, chunk_size: int) -> Iterator[tuple[slice, np.ndarray]]:
+        """
+        Lazily generate the XYZ of the nodes in chunks, in the same order as `values`, without building `values`.
+
+        Args:
+            chunk_size (int): Maximum number of points per chunk.
+
+        Yields:
+            tuple[slice, np.ndarray]: The slice of the chunk in `values` and its (n, 3) coordinates.
+        """
+        z = self.z.reshape(-1)
+        for start in range(0, z.size, chunk_size):
+            stop = min(start + chunk_size, z.size)
+            x_index, y_index = np.unravel_index(np.arange(start, stop), self.z.shape)
+            yield slice(start, stop), np.stack([self._x[x_index], self._y[y_index], z[start:stop]], axis=1)
+
+    def set_z(self, z: np.ndarray, origin: Sequence[float], spacing: Sequence[float]):
+        """Sets the heights of the nodes ``origin + spacing * [i, j]``
+
+        `z` is kept as a read-only view, so the heights are only changed through this method, which is also when
+        the masks are recomputed. Changes made to `z` through another reference are not detected.
+
+        Args:
+            z (numpy.ndarray[float, float]): Heights indexed as [x, y]
+            origin (Sequence[float]): X and Y of ``z[0, 0]``
+            spacing (Sequence[float]): Distance between nodes in X and Y
+
+        Returns:
+            :class:`gempy.core.grid_modules.topography.Topography`
+
+        """
+        self.z = z.view()
+        self.z.flags.writeable = False
+        self.origin = np.asarray(origin, dtype="float64")
+        self.spacing = np.asarray(spacing, dtype="float64")
+        self.raster_shape = z.shape
+
+        self._x = self.origin[0] + self.spacing[0] * np.arange(z.shape[0])
+        self._y = self.origin[1] + self.spacing[1] * np.arange(z.shape[1])
+        self._values = None
+        self._dem_digest = None
+        self._dem_source_key = None
+        self._mask_cache.clear()
+        return self
 
     def set_values(self, values_2d: np.ndarray):
         """General method to set topography
 
+        Only the heights are kept, X and Y must form a regular grid.
+
         Args:
             values_2d (numpy.ndarray[float,float, 3]): array with the XYZ values
              in 2D
@@ -151,13 +241,12 @@ class Topography:
 
 
         """
-        # Original topography data
-        self.values_2d = values_2d
-        self.resolution = values_2d.shape[:2]
-
-        # n,3 array
-        self.values = values_2d.reshape((-1, 3), order='C')
-        return self
+        x, y = values_2d[:, 0, 0], values_2d[0, :, 1]
+        return self.set_z(
+            z=np.ascontiguousarray(values_2d[:, :, 2]),
+            origin=(x[0], y[0]),
+            spacing=(_regular_step(x), _regular_step(y))
+        )
 
     @property
     def topography_mask(self):
@@ -165,48 +254,66 @@ class Topography:
          grid and creates a mask of voxels
 
         """
+        return self.mask(self._regular_grid)
 
-        # * Check if the topography is the same as the cached one and if so, return the cached mask
-        if self._mask_topo is not None:
-            return self._mask_topo
+    def mask(self, regular_grid: RegularGrid) -> np.ndarray:
+        """Mask of the voxels of a regular grid above the topography
 
-        # interpolate topography values to the regular grid
-        skimage = require_skimage()
-        regular_grid_topo = skimage.transform.resize(
-            image=self.values_2d,
-            output_shape=(self.regular_grid_resolution[0], self.regular_grid_resolution[1]),
-            mode='constant',
-            anti_aliasing=False,
-            preserve_range=True
-        )
+        Masks are cached on a fingerprint of the heights and of the grid, so they stay correct when either changes.
+        If only the vertical extent or resolution of the grid changed, the resampled topography is reused.
+
+        Args:
+            regular_grid (RegularGrid): Grid of the voxels, with the same extent as the topography
 
-        # Adjust the topography to be lower by half a voxel height
-        # Assumes your voxel heights are uniform and can be calculated as the total height divided by resolution
-        voxel_height = self._regular_grid.dz * 2
-        regular_grid_topo = regular_grid_topo - voxel_height
+        Returns:
+            numpy.ndarray[bool]: Mask of shape `regular_grid.resolution`, True above the topography
 
-        # Reshape the Z values of the regular grid to 3d
-        values_3d = self._regular_grid.values[:, 2].reshape(self.regular_grid_resolution)
-        if regular_grid_topo.ndim == 3:
-            regular_grid_topo_z = regular_grid_topo[:, :, [2]]
-        elif regular_grid_topo.ndim == 2:
-            regular_grid_topo_z = regular_grid_topo
-        else:
-            raise ValueError()
-        mask = np.greater(values_3d[:, :, :], regular_grid_topo_z)
+        """
+        return self._mask_cache.get(self.dem_key, regular_grid, self._sample_surface)
 
-        self._mask_topo = mask
-        return self._mask_topo
+    def octree_masks(self, octree_grid: RegularGrid) -> list[np.ndarray]:
+        """Masks of every octree level, from the coarsest (2 voxels per axis) to `octree_grid`
+
+        Args:
+            octree_grid (RegularGrid): Grid of the finest octree level, e.g. ``grid.octree_grid``
+
+        Returns:
+            list[numpy.ndarray[bool]]: One mask per octree level
+
+        """
+        n_levels = int(np.log2(octree_grid.resolution[0]))
+        return [
+            self.mask(RegularGrid(
+                extent=octree_grid.extent,
+                resolution=octree_grid.resolution // 2 ** (n_levels - level),
+                transform=octree_grid._transform
+            ))
+            for level in range(1, n_levels + 1)
+        ]
 
     def resize_topo(self):
+        return self._sample_surface(self._regular_grid)
+
+    def _sample_surface(self, regular_grid: RegularGrid) -> np.ndarray:
+        # interpolate topography values to the regular grid
         skimage = require_skimage()
-        regular_grid_topo = skimage.transform.resize(
-            self.values_2d,
-            (self.regular_grid_resolution[0], self.regular_grid_resolution[1]),
+        return skimage.transform.resize(
+            image=self.z,
+            output_shape=(regular_grid.resolution[0], regular_grid.resolution[1]),
             mode='constant',
-            anti_aliasing=False, preserve_range=True)
+            anti_aliasing=False,
+            preserve_range=True
+        )
 
-        return regular_grid_topo
+    @property
+    def dem_key(self) -> Hashable:
+        """Fingerprint of the heights and of their position. Heights read from a file are keyed on the file, its
+        modification time and size, and the crop. Other heights are digested once per :meth:`set_z`."""
+        if self._dem_source_key is not None:
+            return self._dem_source_key
+        if self._dem_digest is None:
+            self._dem_digest = dem_digest(self.z, self.origin, self.spacing)
+        return self._dem_digest
 
     def load_random_hills(self, **kwargs):
         warnings.warn('This function is deprecated. Use load_from_random instead', DeprecationWarning)
@@ -219,7 +326,6 @@ class Topography:
         dem = _LoadDEMArtificial(extent=self.extent,
                                  resolution=self.regular_grid_resolution, **kwargs)
 
-        self._x, self._y = dem.x, dem.y
         self.set_values(dem.get_values())
 
     def save(self, path):
@@ -227,8 +333,16 @@ class Topography:
 
     def load(self, path):
         self.set_values(np.load(path))
-        self._x, self._y = None, None
         return self.values
 
     def load_from_saved(self, *args, **kwargs):
         self.load(*args, **kwargs)
+
+
+def _regular_step(coords: np.ndarray) -> float:
+    if len(coords) < 2:
+        return 1.0
+    steps = np.diff(coords)
+    if not np.allclose(steps, steps[0], rtol=1e-6, atol=0):
+        raise ValueError("Topography coordinates must be regularly spaced.")
+    return float(steps[0])
@@ -0,0 +1,119 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+
+from .grid_types import RegularGrid
+
+
+@dataclass
+class TopographyMaskCache:
+    """
+    Voxel masks of a topography keyed on a fingerprint of the DEM and of the regular grid.
+
+    The topography sampled at the voxel columns is kept on its own, keyed on the DEM and on the horizontal definition
+    of the grid (extent and resolution in X and Y, and transform). A grid that only changes its vertical extent or
+    resolution reuses it, and only the comparison with the voxel centers runs again. Masks of several grids, e.g.
+    the dense grid and every octree level, are kept at the same time.
+    """
+
+    max_entries: int = 16  #: Maximum number of masks, and of sampled surfaces, kept. The least recently used are dropped.
+    surfaces: OrderedDict[Hashable, np.ndarray] = field(default_factory=OrderedDict, repr=False)  #: (DEM key, horizontal grid key) -> topography at the voxel columns.
+    masks: OrderedDict[Hashable, np.ndarray] = field(default_factory=OrderedDict, repr=False)  #: (DEM key, grid key) -> voxel mask.
+
+    n_hits: int = 0  #: Number of masks served from the cache.
+    n_surface_hits: int = 0  #: Number of masks computed from a cached surface.
+    n_misses: int = 0  #: Number of masks computed from the DEM.
+
+    def get(self, dem_key: Hashable, regular_grid: RegularGrid,
+            sample_surface: Callable[[RegularGrid], np.ndarray]) -> np.ndarray:
+        """
+        Mask of the voxels of `regular_grid` above the topography.
+
+        Args:
+            dem_key (Hashable): Fingerprint of the DEM.
+            regular_grid (RegularGrid): Grid of the voxels.
+            sample_surface (Callable[[RegularGrid], np.ndarray]): Computes the (nx, ny) topography at the voxel
+                columns of a grid. Only called if no surface of the same DEM and horizontal grid is cached.
+
+        Returns:
+            np.ndarray: Boolean mask of shape `regular_grid.resolution`, True above the topography.
+        """
+        horizontal_key = _horizontal_grid_key(regular_grid)
+        mask_key = (dem_key, horizontal_key, _vertical_grid_key(regular_grid))
+
+        mask = _lookup(self.masks, mask_key)
+        if mask is not None:
+            self.n_hits += 1
+            return mask
+
+        surface_key = (dem_key, horizontal_key)
+        surface = _lookup(self.surfaces, surface_key)
+        if surface is None:
+            self.n_misses += 1
+            surface = sample_surface(regular_grid)
+            self._store(self.surfaces, surface_key, surface)
+        else:
+            self.n_surface_hits += 1
+
+        mask = _mask_from_surface(regular_grid, surface)
+        self._store(self.masks, mask_key, mask)
+        return mask
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+        self.masks.clear()
+
+    def _store(self, entries: OrderedDict, key: Hashable, value: np.ndarray) -> None:
+        entries[key] = value
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+
+def dem_digest(z: np.ndarray, origin: np.ndarray, spacing: np.ndarray, block_rows: int = 256) -> bytes:
+    """Fingerprint of the heights and of their position. The heights are read `block_rows` rows at a time, so a
+    memory-mapped or cropped DEM is never copied whole."""
+    digest = hashlib.blake2b(digest_size=16)
+    for start in range(0, z.shape[0], block_rows):
+        digest.update(np.ascontiguousarray(z[start:start + block_rows]).data)
+    for array in (origin, spacing):
+        digest.update(np.ascontiguousarray(array, dtype="float64").data)
+    digest.update(str((z.dtype, z.shape)).encode())
+    return digest.digest()
+
+
+def _lookup(entries: OrderedDict, key: Hashable) -> Optional[np.ndarray]:
+    value = entries.get(key)
+    if value is not None:
+        entries.move_to_end(key)
+    return value
+
+
+def _horizontal_grid_key(regular_grid: RegularGrid) -> tuple:
+    transform = regular_grid._transform
+    return (
+        tuple(np.asarray(regular_grid.extent[:4], dtype=float).tolist()),
+        tuple(int(n) for n in regular_grid.resolution[:2]),
+        None if transform is None else tuple(
+            np.asarray(value, dtype=float).tobytes() for value in (transform.position, transform.rotation, transform.scale)
+        )
+    )
+
+
+def _vertical_grid_key(regular_grid: RegularGrid) -> tuple:
+    return tuple(np.asarray(regular_grid.extent[4:], dtype=float).tolist()), int(regular_grid.resolution[2])
+
+
+def _mask_from_surface(regular_grid: RegularGrid, surface: np.ndarray) -> np.ndarray:
+    # Adjust the topography to be lower by half a voxel height
+    # Assumes your voxel heights are uniform and can be calculated as the total height divided by resolution
+    topography_z = surface - regular_grid.dz * 2
+
+    if regular_grid._transform is None:
+        values_z = regular_grid.z_coord[np.newaxis, np.newaxis, :]
+    else:
+        # * A rotated grid moves the voxel centers in Z as well
+        values_z = regular_grid.values[:, 2].reshape(regular_grid.resolution)
+    return np.greater(values_z, topography_z[:, :, np.newaxis])
@@ -1,9 +1,9 @@
-﻿from dataclasses import dataclass
+﻿from dataclasses import dataclass, field
 from typing import Optional, Sequence, Union
 
 import numpy as np
 
-from gempy.core.data._data_points_helpers import generate_ids_from_names
+from gempy.core.data._data_points_helpers import generate_ids_from_names, ids_from_names, columns_view, append_rows
 from gempy_engine.core.data.transforms import Transform
 from gempy.optional_dependencies import require_pandas
 
@@ -25,6 +25,7 @@ class OrientationsTable:
     dt = np.dtype([('X', 'f8'), ('Y', 'f8'), ('Z', 'f8'), ('G_x', 'f8'), ('G_y', 'f8'), ('G_z', 'f8'), ('id', 'i4'), ('nugget', 'f8')])  #: The custom data type for the data array.
 
     _model_transform: Optional[Transform] = None
+    _storage: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)  #: Capacity-backed array `data` is a prefix view of, see `append`.
 
     def __post_init__(self):
         # Check if the data array has the correct data type
@@ -64,7 +65,7 @@ class OrientationsTable:
         if name_id_map is None:
             ids, name_id_map = generate_ids_from_names(name_id_map, names, x)
         else:
-            ids = np.array([name_id_map[name] for name in names])
+            ids = ids_from_names(names, name_id_map, len(x))
         data = np.zeros(len(x), dtype=OrientationsTable.dt)
         data['X'], data['Y'], data['Z'], data['G_x'], data['G_y'], data['G_z'], data['id'], data['nugget'] = x, y, z, G_x, G_y, G_z, ids, nugget
         return data, name_id_map
@@ -75,12 +76,12 @@ class OrientationsTable:
 
     @property
     def xyz(self) -> np.ndarray:
-        """Get the XYZ coordinates.
+        """Get the XYZ coordinates as a zero-copy view. Writing into it modifies the table.
 
         Returns:
-            np.ndarray: The XYZ coordinates.
+            np.ndarray: The (n, 3) XYZ coordinates.
         """
-        return np.array([self.data['X'], self.data['Y'], self.data['Z']]).T
+        return columns_view(self.data, 'X')
 
     @property
     def xyz_view(self) -> np.ndarray:
@@ -98,16 +99,16 @@ class OrientationsTable:
         Args:
             value (np.ndarray): The new XYZ coordinates.
         """
-        self.data['X'], self.data['Y'], self.data['Z'] = value.T
+        self.xyz[:] = value
 
     @property
     def grads(self) -> np.ndarray:
-        """Get the gradient components.
+        """Get the gradient components as a zero-copy view. Writing into it modifies the table.
 
         Returns:
-            np.ndarray: The gradient components.
+            np.ndarray: The (n, 3) gradient components.
         """
-        return np.array([self.data['G_x'], self.data['G_y'], self.data['G_z']]).T
+        return columns_view(self.data, 'G_x')
 
     @property
     def grads_view(self) -> np.ndarray:
@@ -125,7 +126,7 @@ class OrientationsTable:
         Args:
             value (np.ndarray): The new gradient components.
         """
-        self.data['G_x'], self.data['G_y'], self.data['G_z'] = value.T
+        self.grads[:] = value
 
     @property
     def nugget(self) -> np.ndarray:
@@ -234,6 +235,12 @@ class OrientationsTable:
         pd = require_pandas()
         return pd.DataFrame(self.data)
 
+    def __getstate__(self):
+        # * Only the rows in `data` are pickled or saved, not the spare capacity of `_storage`
+        state = self.__dict__.copy()
+        state.pop('_storage', None)
+        return state
+
     def __str__(self):
         return "\n" + np.array2string(self.data, precision=2, separator=',', suppress_small=True)
 
@@ -256,5 +263,18 @@ class OrientationsTable:
         html += "</table>"
         return html
 
+    def append(self, data: np.ndarray) -> None:
+        """Append rows to the table in amortized O(1) per row.
+
+        `data` is kept as a view over a larger array that grows by doubling, so `len` and every accessor only
+        see the appended rows.
+
+        Args:
+            data (np.ndarray): Structured array with the rows to append. It must have the OrientationsTable dtype.
+        """
+        if data.dtype != OrientationsTable.dt:
+            raise ValueError(f"Data array must have the following data type: {OrientationsTable.dt}")
+        self._storage, self.data = append_rows(self._storage, self.data, data)
+
     def __len__(self):
         return len(self.data)
@@ -1,17 +1,20 @@
 ﻿import numpy as np
 import warnings
 from dataclasses import dataclass
-from typing import Generator
+from typing import Callable, Optional, TypeVar
 
 from gempy_engine.core.data.input_data_descriptor import InputDataDescriptor
 from gempy_engine.core.data.kernel_classes.faults import FaultsData
 from gempy_engine.core.data.stack_relation_type import StackRelationType
+from ._points_buffer import ContiguousPointsBuffer
 from .orientations import OrientationsTable
 from .structural_element import StructuralElement
 from .structural_group import StructuralGroup, FaultsRelationSpecialCase
 from .surface_points import SurfacePointsTable
 from ..color_generator import ColorsGenerator
 
+T = TypeVar("T")
+
 
 @dataclass
 class StructuralFrame:
@@ -32,35 +35,85 @@ class StructuralFrame:
     def __init__(self, structural_groups: list[StructuralGroup], color_gen: ColorsGenerator):
         self.structural_groups = structural_groups  # ? This maybe could be optional
         self.color_generator = color_gen
+        self._init_buffers_and_caches()
+
+    def __getstate__(self):
+        # * The buffers and cached views are rebuilt from the elements, see `__setstate__`
+        state = self.__dict__.copy()
+        for name in ("_surface_points_buffer", "_orientations_buffer", "_structure_cache", "_structure_cache_key", "_structure_cache_refs"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_buffers_and_caches()
+
+    def _init_buffers_and_caches(self) -> None:
+        self._surface_points_buffer = ContiguousPointsBuffer('surface_points', SurfacePointsTable.dt)
+        self._orientations_buffer = ContiguousPointsBuffer('orientations', OrientationsTable.dt)
+
+        # * Views derived from the group/element layout. See `_cached`
+        self._structure_cache: dict = {}
+        self._structure_cache_key: tuple = ()
+        self._structure_cache_refs: tuple = ()
 
     def get_element_by_name(self, element_name: str) -> StructuralElement:
-        elements: Generator = (group.get_element_by_name(element_name) for group in self.structural_groups)
-        valid_elements: Generator = (element for element in elements if element is not None)
-        element = next(valid_elements, None)
+        element = self._lookup('elements_by_name', self._build_elements_by_name, element_name, lambda e: e.name == element_name)
         if element is None:
             raise ValueError(f"Element with name {element_name} not found in the structural frame.")
         return element
+
+    def get_element_by_id(self, element_id: int) -> StructuralElement:
+        element = self._lookup('elements_by_id', self._build_elements_by_id, element_id, lambda e: e.id == element_id)
+        if element is None:
+            raise ValueError(f"Element with id {element_id} not found in the structural frame.")
+        return element
     
     def get_group_by_name(self, group_name: str) -> StructuralGroup:
-        groups: Generator = (group for group in self.structural_groups if group.name == group_name)
-        group = next(groups, None)
+        group = self._lookup('groups_by_name', self._build_groups_by_name, group_name, lambda g: g.name == group_name)
         if group is None:
             raise ValueError(f"Group with name {group_name} not found in the structural frame.")
         return group
     
     def get_group_by_element(self, element: StructuralElement) -> StructuralGroup:
-        groups: Generator = (group for group in self.structural_groups if element in group.elements)
-        group = next(groups, None)
+        group = self._cached('groups_by_element', self._build_groups_by_element).get(id(element))
         if group is None:
             raise ValueError(f"Element {element.name} not found in any group in the structural frame.")
         return group
         
-
     def append_group(self, group: StructuralGroup):
         self.structural_groups.append(group)
+        self.invalidate_cache()
 
     def insert_group(self, index: int, group: StructuralGroup):
         self.structural_groups.insert(index, group)
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drops the cached element list and basement element. Call it after mutating the groups in place."""
+        self._structure_cache = {}
+        self._structure_cache_key = ()
+        self._structure_cache_refs = ()
+
+    def _cached(self, name: str, factory: Callable[[], T]) -> T:
+        """Returns the view `name` derived from the current group/element layout, building it with `factory` if needed.
+
+        The cache is keyed on the identity and length of the group list and of every element list, plus the version
+        each group bumps in `append_element`/`remove_element`, so checking it costs O(n_groups). The keyed lists are
+        kept alive to prevent their ids from being reused.
+        """
+        key = (
+            id(self.structural_groups),
+            tuple((id(group), id(group.elements), len(group.elements), group.elements_version) for group in self.structural_groups)
+        )
+        if key != self._structure_cache_key:
+            self._structure_cache = {}
+            self._structure_cache_key = key
+            self._structure_cache_refs = (self.structural_groups, [group.elements for group in self.structural_groups])
+
+        if name not in self._structure_cache:
+            self._structure_cache[name] = factory()
+        return self._structure_cache[name]
 
     @classmethod
     def from_data_tables(cls, surface_points: SurfacePointsTable, orientations: OrientationsTable):
@@ -175,13 +228,57 @@ class StructuralFrame:
         """
         return html
 
+    def _lookup(self, index_name: str, build_index: Callable[[], dict], key, is_match: Callable) -> Optional:
+        """Looks `key` up in one of the name/id indices, rebuilding the index once if the entry is missing or stale.
+
+        Names and ids are plain attributes of groups and elements, so renaming one does not change the layout key
+        of `_cached`; every hit is therefore checked with `is_match`.
+        """
+        found = self._cached(index_name, build_index).get(key)
+        if found is None or not is_match(found):
+            self._structure_cache.pop(index_name, None)
+            found = self._cached(index_name, build_index).get(key)
+        return found
+
+    def _build_elements_by_name(self) -> dict[str, StructuralElement]:
+        index = {}
+        for group in self.structural_groups:
+            for element in group.elements:
+                index.setdefault(element.name, element)  # * First match wins, as in a linear scan
+        return index
+
+    def _build_elements_by_id(self) -> dict[int, StructuralElement]:
+        index = {}
+        for group in self.structural_groups:
+            for element in group.elements:
+                index.setdefault(element.id, element)
+        return index
+
+    def _build_groups_by_name(self) -> dict[str, StructuralGroup]:
+        index = {}
+        for group in self.structural_groups:
+            index.setdefault(group.name, group)
+        return index
+
+    def _build_groups_by_element(self) -> dict[int, StructuralGroup]:
+        index = {}
+        for group in self.structural_groups:
+            for element in group.elements:
+                index.setdefault(id(element), group)
+        return index
+
     @property
     def structural_elements(self) -> list[StructuralElement]:
         """Returns a list of all structural elements across the structural groups."""
+        elements = list(self._cached('structural_elements', self._build_structural_elements))
+        elements[-1].color = self._checked_basement_color()
+        return elements
+
+    def _build_structural_elements(self) -> list[StructuralElement]:
         elements = []
         for group in self.structural_groups:
             elements.extend(group.elements)
-        elements.append(self._basement_element)
+        elements.append(self._cached('basement_element', self._build_basement_element))
         return elements
     
     @property
@@ -190,30 +287,40 @@ class StructuralFrame:
         return len(self.structural_elements)
 
     basement_color: str = None
+    _generated_basement_color: str = None  #: Last basement color taken from the color generator, not set by the user.
     
     @property
     def _basement_element(self) -> StructuralElement:
-        # Check if the basement color is already defined
-        elements = []
-        for group in self.structural_groups:
-            elements.extend(group.elements)
-        basement_color_in_elements = self.basement_color in [element.color for element in elements]
-        
-        if self.basement_color is None or basement_color_in_elements:
-            self.basement_color = self.color_generator.up_next()
-            
-        if basement_color_in_elements:
-            warnings.warn(f"The basement color was already used in the structural elements."
-                          f"Changing the basement color to {self.basement_color}.")
-        
-        basement = StructuralElement(
+        basement = self._cached('basement_element', self._build_basement_element)
+        basement.color = self._checked_basement_color()
+        return basement
+
+    def _build_basement_element(self) -> StructuralElement:
+        return StructuralElement(
             name="basement",
             surface_points=SurfacePointsTable(data=np.zeros(0, dtype=SurfacePointsTable.dt)),
             orientations=OrientationsTable(data=np.zeros(0, dtype=OrientationsTable.dt)),
-            color=self.basement_color
+            color=self._checked_basement_color()
         )
 
-        return basement
+    def _checked_basement_color(self) -> str:
+        # * Checked on every read since element colors can change without changing the cached layout
+        elements_colors = [element.color for group in self.structural_groups for element in group.elements]
+        previous_color = self.basement_color
+
+        if self.basement_color is None:
+            self.basement_color = self.color_generator.up_next()
+        # * The color coming up next may be in use already, colors are taken until a free one comes
+        while self.basement_color in elements_colors:
+            self.basement_color = next(self.color_generator)
+
+        # * Only a color chosen by the user is worth a warning, a generated one is just moved along
+        if previous_color not in (None, self.basement_color, self._generated_basement_color):
+            warnings.warn(f"The basement color was already used in the structural elements."
+                          f"Changing the basement color to {self.basement_color}.")
+        if previous_color in (None, self._generated_basement_color):
+            self._generated_basement_color = self.basement_color
+        return self.basement_color
 
     # ? Should I move this property to StructuralGroup?
     @property
@@ -347,7 +454,7 @@ class StructuralFrame:
     @property
     def surface_points_copy(self) -> SurfacePointsTable:
         """Returns a SurfacePointsTable for all surface points across the structural elements. This is a copy!"""
-        all_data: np.ndarray = np.concatenate([element.surface_points.data for element in self.structural_elements])
+        all_data: np.ndarray = self._surface_points_buffer.sync(self.structural_elements).copy()
         return SurfacePointsTable(data=all_data, name_id_map=self.element_name_id_map)
 
     @property
@@ -357,17 +464,27 @@ class StructuralFrame:
 
     @surface_points.setter
     def surface_points(self, modified_surface_points: SurfacePointsTable) -> None:
-        """Distributes the modified surface points back to the structural elements."""
-        start = 0
-        for element in self.structural_elements:
-            length = len(element.surface_points.data)
-            element.surface_points.data = modified_surface_points.data[start:start + length]
-            start += length
+        """Writes the modified surface points back to the structural elements."""
+        _write_into_buffer(self._surface_points_buffer.sync(self.structural_elements), modified_surface_points.data)
+
+    @property
+    def surface_points_offsets(self) -> np.ndarray:
+        """Returns the start row of each structural element in `surface_points_copy`, followed by the total number of rows."""
+        self._surface_points_buffer.sync(self.structural_elements)
+        return self._surface_points_buffer.offsets.copy()
+
+    def remove_surface_points(self, mask: np.ndarray) -> int:
+        """Removes the rows of `surface_points_copy` selected by the boolean `mask` from the structural elements.
+
+        Returns:
+            int: Number of removed surface points.
+        """
+        return self._surface_points_buffer.remove_rows(self.structural_elements, mask)
 
     @property
     def orientations_copy(self) -> OrientationsTable:
         """Returns an OrientationsTable for all orientations across the structural elements."""
-        all_data: np.ndarray = np.concatenate([element.orientations.data for element in self.structural_elements])
+        all_data: np.ndarray = self._orientations_buffer.sync(self.structural_elements).copy()
         return OrientationsTable(data=all_data)
 
     @property
@@ -377,18 +494,46 @@ class StructuralFrame:
     
     @orientations.setter
     def orientations(self, modified_orientations: OrientationsTable) -> None:
-        """Distributes the modified orientations back to the structural elements."""
-        start = 0
-        for element in self.structural_elements:
-            length = len(element.orientations.data)
-            element.orientations.data = modified_orientations.data[start:start + length]
-            start += length
+        """Writes the modified orientations back to the structural elements."""
+        _write_into_buffer(self._orientations_buffer.sync(self.structural_elements), modified_orientations.data)
+
+    @property
+    def orientations_offsets(self) -> np.ndarray:
+        """Returns the start row of each structural element in `orientations_copy`, followed by the total number of rows."""
+        self._orientations_buffer.sync(self.structural_elements)
+        return self._orientations_buffer.offsets.copy()
+
+    def remove_orientations(self, mask: np.ndarray) -> int:
+        """Removes the rows of `orientations_copy` selected by the boolean `mask` from the structural elements.
+
+        Returns:
+            int: Number of removed orientations.
+        """
+        return self._orientations_buffer.remove_rows(self.structural_elements, mask)
 
     @property
     def element_id_name_map(self) -> dict[int, str]:
         """Returns a dictionary mapping element IDs to names."""
         return {element.id: element.name for i, element in enumerate(self.structural_elements)}
 
+    @property
+    def element_id_registry(self) -> dict[int, str]:
+        """Returns the id of every structural element, basement included, mapped to its name.
+
+        Ids derived from names are stable across processes, so the registry can key caches and merge results of
+        different workers.
+
+        Raises:
+            ValueError: If two elements with different names share an id.
+        """
+        registry: dict[int, str] = {}
+        for element in self.structural_elements:
+            registered_name = registry.setdefault(element.id, element.name)
+            if registered_name != element.name:
+                raise ValueError(f"Elements {registered_name} and {element.name} share the id {element.id}. "
+                                 f"Set an explicit id on one of them.")
+        return registry
+
     @property
     def element_name_id_map(self) -> dict[str, int]:
         """Returns a dictionary mapping element names to IDs."""
@@ -460,3 +605,9 @@ class StructuralFrame:
                 raise ValueError("The fault relations matrix is not given")
             if self.fault_relations.shape != (len(self.structural_groups), len(self.structural_groups)):
                 raise ValueError("The fault relations matrix is not the right shape")
+
+
+def _write_into_buffer(buffer: np.ndarray, modified_data: np.ndarray) -> None:
+    if len(modified_data) != len(buffer):
+        raise ValueError(f"Expected {len(buffer)} rows to distribute across the structural elements, but got {len(modified_data)}.")
+    buffer[...] = modified_data
@@ -32,6 +32,7 @@ class StructuralGroup(ABC):
     faults_input_data: Optional[FaultsData] = field(default=None, repr=False)
     
     solution: Optional[RawArraysSolution] = field(init=False, default=None, repr=False)  #: Solution related to this group from geological computations.
+    elements_version: int = field(init=False, default=0, repr=False, compare=False)  #: Bumped every time an element is added or removed.
     
     
     def __post_init__(self):
@@ -62,9 +63,11 @@ class StructuralGroup(ABC):
     
     def append_element(self, element: StructuralElement):
         self.elements.append(element)
+        self.elements_version += 1
     
     def remove_element(self, element: StructuralElement):
         self.elements.remove(element)
+        self.elements_version += 1
 
     @property
     def id(self):
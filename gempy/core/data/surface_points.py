@@ -1,8 +1,8 @@
-﻿from dataclasses import dataclass
+﻿from dataclasses import dataclass, field
 from typing import Optional, Union, Sequence
 import numpy as np
 
-from gempy.core.data._data_points_helpers import generate_ids_from_names
+from gempy.core.data._data_points_helpers import generate_ids_from_names, ids_from_names, columns_view, append_rows
 from gempy_engine.core.data.transforms import Transform
 from gempy.optional_dependencies import require_pandas
 
@@ -25,12 +25,19 @@ class SurfacePointsTable:
 
     dt = np.dtype([('X', 'f8'), ('Y', 'f8'), ('Z', 'f8'), ('id', 'i4'), ('nugget', 'f8')])  #: The custom data type for the data array.
     _model_transform: Optional[Transform] = None
+    _storage: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)  #: Capacity-backed array `data` is a prefix view of, see `append`.
 
     def __post_init__(self):
         # Check if the data array has the correct data type
         if self.data.dtype != SurfacePointsTable.dt:
             raise ValueError(f"Data array must have the following data type: {SurfacePointsTable.dt}")
 
+    def __getstate__(self):
+        # * Only the rows in `data` are pickled or saved, not the spare capacity of `_storage`
+        state = self.__dict__.copy()
+        state.pop('_storage', None)
+        return state
+
     def __str__(self):
         return "\n" + np.array2string(self.data, precision=2, separator=',', suppress_small=True)
 
@@ -84,7 +91,7 @@ class SurfacePointsTable:
         if name_id_map is None:
             ids, name_id_map = generate_ids_from_names(name_id_map, names, x)
         else:
-            ids = np.array([name_id_map[name] for name in names])
+            ids = ids_from_names(names, name_id_map, len(x))
 
         data = np.zeros(len(x), dtype=SurfacePointsTable.dt)
         data['X'], data['Y'], data['Z'], data['id'], data['nugget'] = x, y, z, ids, nugget
@@ -112,7 +119,8 @@ class SurfacePointsTable:
 
     @property
     def xyz(self) -> np.ndarray:
-        return np.array([self.data['X'], self.data['Y'], self.data['Z']]).T
+        """Zero-copy (n, 3) view of the coordinates. Writing into it modifies the table."""
+        return columns_view(self.data, 'X')
 
     @property
     def xyz_view(self) -> np.ndarray:
@@ -120,7 +128,7 @@ class SurfacePointsTable:
 
     @xyz_view.setter
     def xyz_view(self, value: np.ndarray):
-        self.data['X'], self.data['Y'], self.data['Z'] = value.T
+        self.xyz[:] = value
 
     @property
     def nugget(self) -> np.ndarray:
@@ -140,6 +148,19 @@ class SurfacePointsTable:
     def model_transform(self, value: Transform):
         self._model_transform = value
 
+    def append(self, data: np.ndarray) -> None:
+        """Append rows to the table in amortized O(1) per row.
+
+        `data` is kept as a view over a larger array that grows by doubling, so `len` and every accessor only
+        see the appended rows.
+
+        Args:
+            data (np.ndarray): Structured array with the rows to append. It must have the SurfacePointsTable dtype.
+        """
+        if data.dtype != SurfacePointsTable.dt:
+            raise ValueError(f"Data array must have the following data type: {SurfacePointsTable.dt}")
+        self._storage, self.data = append_rows(self._storage, self.data, data)
+
     def __len__(self):
         return len(self.data)
 
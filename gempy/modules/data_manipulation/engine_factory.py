@@ -3,6 +3,7 @@ from typing import Optional
 import numpy as np
 
 from ...core.data.grid import Grid
+from ...core.data.grid_modules.topography import Topography
 from ...core.data.structural_frame import StructuralFrame
 
 from gempy_engine.core.data import SurfacePoints, Orientations
@@ -18,38 +19,63 @@ def interpolation_input_from_structural_frame(geo_model: "gempy.data.GeoModel")
     _legacy_factor = 0
 
     structural_frame: StructuralFrame = geo_model.structural_frame
-    input_transform: Transform = geo_model.input_transform
-    grid: Grid = geo_model.grid
 
-    total_transform: Transform = input_transform + grid.transform
+    interpolation_input: InterpolationInput = InterpolationInput(
+        surface_points=surface_points_from_geo_model(geo_model),
+        orientations=orientations_from_geo_model(geo_model),
+        grid=engine_grid_from_geo_model(geo_model),
+        unit_values=structural_frame.elements_ids  # TODO: Here we will need to pass densities etc.
+    )
+
+    return interpolation_input
 
+
+def surface_points_from_geo_model(geo_model: "gempy.data.GeoModel") -> SurfacePoints:
     surface_points_copy_transformed = geo_model.surface_points_copy_transformed
     surface_points: SurfacePoints = SurfacePoints(
-        sp_coords=geo_model.surface_points_copy_transformed.xyz,
+        sp_coords=surface_points_copy_transformed.xyz,
         nugget_effect_scalar=surface_points_copy_transformed.nugget
     )
+    return surface_points
+
 
+def orientations_from_geo_model(geo_model: "gempy.data.GeoModel") -> Orientations:
     orientations_copy_transformed = geo_model.orientations_copy_transformed
     orientations: Orientations = Orientations(
         dip_positions=orientations_copy_transformed.xyz,
         dip_gradients=orientations_copy_transformed.grads,
         nugget_effect_grad=orientations_copy_transformed.nugget
     )
+    return orientations
 
+
+def engine_grid_from_geo_model(geo_model: "gempy.data.GeoModel") -> engine_grid.EngineGrid:
     grid: engine_grid.EngineGrid = _apply_input_transform_to_grids(
-        grid=grid,
-        input_transform=input_transform,
+        grid=geo_model.grid,
+        input_transform=geo_model.input_transform,
         extent_transformed=geo_model.extent_transformed_transformed_by_input
     )
+    return grid
 
-    interpolation_input: InterpolationInput = InterpolationInput(
-        surface_points=surface_points,
-        orientations=orientations,
+
+def engine_grid_from_grid(geo_model: "gempy.data.GeoModel", grid: Grid) -> engine_grid.EngineGrid:
+    """Builds the engine grid of an arbitrary grid in the interpolation space of the model."""
+    has_regular_grid = grid.dense_grid is not None or grid.octree_grid is not None
+    return _apply_input_transform_to_grids(
         grid=grid,
-        unit_values=structural_frame.elements_ids  # TODO: Here we will need to pass densities etc.
+        input_transform=geo_model.input_transform,
+        extent_transformed=(
+            _transformed_extent(geo_model.input_transform, grid.bounding_box) if has_regular_grid
+            else geo_model.extent_transformed_transformed_by_input
+        )
     )
 
-    return interpolation_input
+
+def _transformed_extent(input_transform: Transform, bounding_box: np.ndarray) -> np.ndarray:
+    transformed = input_transform.apply(bounding_box)
+    return np.array([transformed[:, 0].min(), transformed[:, 0].max(),
+                     transformed[:, 1].min(), transformed[:, 1].max(),
+                     transformed[:, 2].min(), transformed[:, 2].max()])
 
 
 def _apply_input_transform_to_grids(grid: Grid, input_transform: Transform, extent_transformed: np.ndarray) -> engine_grid.EngineGrid:
@@ -70,7 +96,7 @@ def _apply_input_transform_to_grids(grid: Grid, input_transform: Transform, exte
     if grid.GridTypes.CUSTOM in grid.active_grids and grid.custom_grid is not None:
         custom_values = engine_grid.GenericGrid(values=input_transform.apply(grid.custom_grid.values))
     if grid.GridTypes.TOPOGRAPHY in grid.active_grids and grid.topography is not None:
-        topography_values = engine_grid.GenericGrid(values=input_transform.apply(grid.topography.values))
+        topography_values = engine_grid.GenericGrid(values=_transformed_topography_values(grid.topography, input_transform))
     if grid.GridTypes.SECTIONS in grid.active_grids and grid.sections is not None:
         section_values = engine_grid.GenericGrid(values=input_transform.apply(grid.sections.values))
     if grid.GridTypes.CENTERED in grid.active_grids and grid.centered_grid is not None:
@@ -92,3 +118,13 @@ def _apply_input_transform_to_grids(grid: Grid, input_transform: Transform, exte
         geophysics_grid=centered_grid
     )
     return grid
+
+
+def _transformed_topography_values(topography: Topography, input_transform: Transform,
+                                   chunk_size: int = 2 ** 20) -> np.ndarray:
+    # * Filled from the heights chunk by chunk: `Topography.values` is not built, only the transformed copy the
+    # * engine needs
+    values = np.empty((topography.z.size, 3))
+    for chunk, xyz in topography.iter_values(chunk_size):
+        values[chunk] = input_transform.apply(xyz)
+    return values
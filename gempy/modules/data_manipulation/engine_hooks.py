@@ -0,0 +1,68 @@
+import contextlib
+import contextvars
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+from gempy_engine.API.interp_single import _interp_scalar_field, _interp_single_feature
+from gempy_engine.core.data.exported_fields import ExportedFields
+from gempy_engine.core.data.internal_structs import SolverInput
+from gempy_engine.core.data.options import KernelOptions, InterpolationOptions
+
+#: Solves the kriging system of one group. Gets the engine solver as last argument to fall back on.
+SolveHook = Callable[[SolverInput, KernelOptions, Callable[[SolverInput, KernelOptions], np.ndarray]], np.ndarray]
+
+_EngineInterpolate = Callable[[SolverInput, InterpolationOptions, Optional[int]], tuple[np.ndarray, ExportedFields]]
+#: Solves one group and evaluates its scalar field. Gets the engine function as last argument to fall back on.
+InterpolateHook = Callable[[SolverInput, InterpolationOptions, Optional[int], _EngineInterpolate], tuple[np.ndarray, ExportedFields]]
+
+
+@dataclass(frozen=True)
+class EngineHooks:
+    """
+    Functions of GemPy that replace steps of the engine during one engine call.
+
+    The engine has no extension points, so its solver and its scalar field interpolation are replaced once, when
+    this module is imported, by dispatchers that call the hooks bound with :func:`engine_hooks` in the current
+    thread or context, and the engine itself otherwise. Concurrent engine calls in other threads never see the
+    hooks of this one.
+    """
+
+    solve: Optional[SolveHook] = None  #: Replaces the kriging solve of every structural group.
+    interpolate_scalar_field: Optional[InterpolateHook] = None  #: Replaces the solve and evaluation of every structural group. The engine function it falls back on still goes through `solve`.
+
+
+_active_hooks: contextvars.ContextVar[Optional[EngineHooks]] = contextvars.ContextVar("gempy_engine_hooks", default=None)
+
+
+@contextlib.contextmanager
+def engine_hooks(hooks: EngineHooks) -> Iterator[None]:
+    """Route the engine calls made in the current thread or context through `hooks` while the context is active."""
+    token = _active_hooks.set(hooks)
+    try:
+        yield
+    finally:
+        _active_hooks.reset(token)
+
+
+def _solve_interpolation(interp_input: SolverInput, kernel_options: KernelOptions) -> np.ndarray:
+    hooks = _active_hooks.get()
+    if hooks is None or hooks.solve is None:
+        return _engine_solve(interp_input, kernel_options)
+    return hooks.solve(interp_input, kernel_options, _engine_solve)
+
+
+def _interpolate_scalar_field(solver_input: SolverInput, options: InterpolationOptions,
+                              stack_number: Optional[int]) -> tuple[np.ndarray, ExportedFields]:
+    hooks = _active_hooks.get()
+    if hooks is None or hooks.interpolate_scalar_field is None:
+        return _engine_interpolate(solver_input, options, stack_number)
+    return hooks.interpolate_scalar_field(solver_input, options, stack_number, _engine_interpolate)
+
+
+# * Installed once. Without bound hooks the dispatchers only forward to the engine
+_engine_solve = _interp_scalar_field._solve_interpolation
+_interp_scalar_field._solve_interpolation = _solve_interpolation
+_engine_interpolate = _interp_single_feature.interpolate_scalar_field
+_interp_single_feature.interpolate_scalar_field = _interpolate_scalar_field
@@ -0,0 +1,231 @@
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+
+import gempy_engine.config
+from gempy_engine.core.backend_tensor import BackendTensor
+from gempy_engine.core.data import Solutions
+from gempy_engine.core.data.internal_structs import SolverInput
+from gempy_engine.core.data.kernel_classes.solvers import Solvers
+from gempy_engine.core.data.options import KernelOptions
+from gempy_engine.config import AvailableBackends
+from gempy_engine.modules.kernel_constructor import kernel_constructor_interface as kernel_constructor
+
+from ...optional_dependencies import require_scipy
+
+
+@dataclass
+class _Factorization:
+    labels: dict[Hashable, int]  #: Row label -> row of the factorized matrix.
+    matrix: np.ndarray  #: Covariance matrix that was factorized.
+    lu_and_piv: tuple  #: Output of `scipy.linalg.lu_factor`.
+
+
+@dataclass
+class IncrementalKrigingSolver:
+    """
+    Solves the kriging system of a structural group by updating the LU factorization of a previous solve.
+
+    Every row of the covariance matrix is labelled by what it represents (a gradient component of an orientation, a
+    reference-rest pair of surface points, a drift or a fault drift term). When a group is solved again, rows are
+    matched by label with the last factorized matrix of that group, and rows that were added, removed or whose values
+    changed form a rank-2k correction applied with the Woodbury identity. Solving then costs O(n^2 k) instead of
+    O(n^3). The group is factorized from scratch when more than `max_update_fraction` of the rows changed or when the
+    residual of the updated solution is above `residual_tolerance`.
+
+    Only used with the numpy backend and the default dense solver; any other configuration falls back to the engine.
+    The engine calls it through :attr:`EngineHooks.solve`, bound to :meth:`solve_hook` for one engine call.
+    """
+
+    max_update_fraction: float = 0.25  #: Fraction of changed rows above which the matrix is factorized again.
+    residual_tolerance: float = 1e-8  #: Relative residual above which an updated solution is discarded.
+    max_factorizations: int = 32  #: Number of factorizations kept, one per structural group.
+
+    factorizations: list[_Factorization] = field(default_factory=list, repr=False)  #: Most recently used first.
+    n_full_solves: int = 0  #: Number of systems solved by a full factorization.
+    n_updated_solves: int = 0  #: Number of systems solved by updating a previous factorization.
+
+    def solve_hook(self, interp_input: SolverInput, kernel_options: KernelOptions,
+                   engine_solve: Callable[[SolverInput, KernelOptions], np.ndarray]) -> np.ndarray:
+        """Solve hook of :class:`EngineHooks`: solves supported systems with :meth:`solve`, the rest with the engine."""
+        if not _is_supported(kernel_options):
+            return engine_solve(interp_input, kernel_options)
+        return self.solve(interp_input, kernel_options)
+
+    def solve(self, interp_input: SolverInput, kernel_options: KernelOptions) -> np.ndarray:
+        """
+        Solve the kriging system of one structural group.
+
+        Args:
+            interp_input (SolverInput): Engine input of the group.
+            kernel_options (KernelOptions): Kernel options of the interpolation.
+
+        Returns:
+            np.ndarray: The kriging weights.
+        """
+        cov = np.asarray(kernel_constructor.yield_covariance(interp_input, kernel_options))
+        b = np.asarray(kernel_constructor.yield_b_vector(interp_input.ori_internal, cov.shape[0]))[:, 0]
+        dtype = BackendTensor.dtype
+        cov = cov.astype(dtype)
+
+        if gempy_engine.config.DEBUG_MODE:
+            # * Same debug data the engine solver saves
+            Solutions.debug_input_data["A_matrix"] = cov
+            Solutions.debug_input_data["b_vector"] = b[:, None]
+
+        labels = _row_labels(interp_input, cov.shape[0])
+        base = self._closest_factorization(labels)
+        if base is not None:
+            weights = _updated_solve(base, cov, b, labels, self.max_update_fraction)
+            if weights is not None and _relative_residual(cov, weights, b) <= self.residual_tolerance:
+                self.n_updated_solves += 1
+                return _debug_weights(weights.astype(dtype))
+
+        scipy = require_scipy()
+        lu_and_piv = scipy.linalg.lu_factor(cov)
+        weights = scipy.linalg.lu_solve(lu_and_piv, b)
+        if base is not None:
+            self.factorizations.remove(base)
+        self.factorizations.insert(0, _Factorization(labels=labels, matrix=cov, lu_and_piv=lu_and_piv))
+        del self.factorizations[self.max_factorizations:]
+        self.n_full_solves += 1
+        return _debug_weights(weights.astype(dtype))
+
+    def clear(self) -> None:
+        self.factorizations.clear()
+
+    def _closest_factorization(self, labels: Optional[dict]) -> Optional[_Factorization]:
+        if labels is None:
+            return None
+        overlaps = [sum(label in factorization.labels for label in labels) for factorization in self.factorizations]
+        if not overlaps or max(overlaps) == 0:
+            return None
+        return self.factorizations[int(np.argmax(overlaps))]
+
+
+def _debug_weights(weights: np.ndarray) -> np.ndarray:
+    if gempy_engine.config.DEBUG_MODE:
+        Solutions.debug_input_data["weights"] = weights
+    return weights
+
+
+def _is_supported(kernel_options: KernelOptions) -> bool:
+    return (
+            BackendTensor.engine_backend == AvailableBackends.numpy
+            and not BackendTensor.pykeops_enabled
+            and kernel_options.kernel_solver == Solvers.DEFAULT
+            and not kernel_options.optimizing_condition_number
+            and not kernel_options.compute_condition_number
+    )
+
+
+def _row_labels(interp_input: SolverInput, cov_size: int) -> Optional[dict[Hashable, int]]:
+    # * Row layout of the engine covariance: gradient components (all x, then y, then z), ref-rest surface point
+    # * pairs, universal drift and fault drift
+    ori = interp_input.ori_internal
+    sp = interp_input.sp_internal
+    n_ori, ori_size = ori.n_orientations, ori.n_orientations_tiled
+    dip_positions = np.asarray(ori.dip_positions_tiled)
+    ref_rest = np.hstack([np.asarray(sp.ref_surface_points), np.asarray(sp.rest_surface_points)])
+
+    labels = [("g", k // max(n_ori, 1), dip_positions[k].tobytes()) for k in range(ori_size)]
+    labels += [("s", row.tobytes()) for row in ref_rest]
+    labels += [("d", i) for i in range(cov_size - len(labels))]
+
+    index = {label: i for i, label in enumerate(labels)}
+    if len(index) != cov_size:
+        return None  # * Duplicated points: rows cannot be matched unambiguously
+    return index
+
+
+def _updated_solve(base: _Factorization, cov: np.ndarray, b: np.ndarray, labels: dict,
+                   max_update_fraction: float) -> Optional[np.ndarray]:
+    """Solve `cov` w = b as a rank-2k correction of the factorized `base` matrix (Woodbury identity).
+
+    The correction works on the union of the old rows and the new ones: old rows without a match are kept as
+    decoupled identity rows with a zero right hand side, new rows without a match are appended to the old matrix
+    as identity rows, and every row touched by either change is collected in the index set J.
+    """
+    scipy = require_scipy()
+    n_old, n_new = base.matrix.shape[0], cov.shape[0]
+
+    # * Position of every new row in the union of old and new rows
+    union_index = np.empty(n_new, dtype=int)
+    n_added = 0
+    for label, new_row in labels.items():
+        old_row = base.labels.get(label)
+        if old_row is None:
+            old_row = n_old + n_added
+            n_added += 1
+        union_index[new_row] = old_row
+    n_union = n_old + n_added
+
+    kept = union_index < n_old
+    removed = np.ones(n_old, dtype=bool)
+    removed[union_index[kept]] = False
+
+    # * Rows kept by label whose values changed
+    kept_rows = np.flatnonzero(kept)
+    old_block = base.matrix[np.ix_(union_index[kept_rows], union_index[kept_rows])]
+    new_block = cov[np.ix_(kept_rows, kept_rows)]
+    scale = max(np.abs(old_block).max(initial=0), 1.)
+    changed = ~np.all(np.isclose(old_block, new_block, rtol=1e-12, atol=1e-12 * scale), axis=1)
+
+    changed_union = np.concatenate([
+        np.flatnonzero(removed),
+        union_index[kept_rows[changed]],
+        np.arange(n_old, n_union)
+    ])
+    n_changed = len(changed_union)
+    if n_changed > max_update_fraction * n_new:
+        return None
+
+    # * Target matrix on the union minus the base (base factorization extended with identity rows)
+    target_columns = np.zeros((n_union, n_changed))
+    base_columns = np.zeros((n_union, n_changed))
+    position_in_union = {u: j for j, u in enumerate(changed_union)}
+    new_row_of_union = np.full(n_union, -1)
+    new_row_of_union[union_index] = np.arange(n_new)
+
+    for j, u in enumerate(changed_union):
+        new_row = new_row_of_union[u]
+        if new_row >= 0:
+            target_columns[union_index, j] = cov[:, new_row]
+        else:
+            target_columns[u, j] = 1.  # * Removed row: decoupled identity
+        if u < n_old:
+            base_columns[:n_old, j] = base.matrix[:, u]
+        else:
+            base_columns[u, j] = 1.
+    delta_columns = target_columns - base_columns  # * ΔA[:, J], symmetric so ΔA[J, :] = delta_columns.T
+
+    selector = np.zeros((n_union, n_changed))
+    selector[changed_union, np.arange(n_changed)] = 1.
+    delta_columns_outside = delta_columns.copy()
+    delta_columns_outside[changed_union, :] = 0.
+
+    # * ΔA = E_J ΔA[J, :] + ΔA[:, J]' E_J^T  ->  U = [E_J, ΔA[:, J]'], V = [ΔA[:, J], E_J]
+    u_matrix = np.hstack([selector, delta_columns_outside])
+    v_matrix = np.hstack([delta_columns, selector])
+
+    def _base_solve(rhs: np.ndarray) -> np.ndarray:
+        solution = rhs.copy()
+        solution[:n_old] = scipy.linalg.lu_solve(base.lu_and_piv, rhs[:n_old])
+        return solution
+
+    b_union = np.zeros(n_union)
+    b_union[union_index] = b
+
+    base_solution = _base_solve(b_union)
+    base_u = _base_solve(u_matrix)
+    capacitance = np.eye(2 * n_changed) + v_matrix.T @ base_u
+    try:
+        correction = base_u @ np.linalg.solve(capacitance, v_matrix.T @ base_solution)
+    except np.linalg.LinAlgError:
+        return None
+    return (base_solution - correction)[union_index]
+
+
+def _relative_residual(cov: np.ndarray, weights: np.ndarray, b: np.ndarray) -> float:
+    return float(np.linalg.norm(cov @ weights - b) / max(np.linalg.norm(b), np.finfo(float).tiny))
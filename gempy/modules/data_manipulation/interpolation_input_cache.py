@@ -0,0 +1,171 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Hashable, Optional
+
+import numpy as np
+
+from gempy_engine.core.backend_tensor import BackendTensor
+from gempy_engine.core.data import SurfacePoints, Orientations
+from gempy_engine.core.data.engine_grid import EngineGrid
+from gempy_engine.core.data.input_data_descriptor import InputDataDescriptor
+from gempy_engine.core.data.interpolation_input import InterpolationInput
+from gempy_engine.core.data.transforms import Transform
+
+from .engine_factory import surface_points_from_geo_model, orientations_from_geo_model, engine_grid_from_geo_model
+from ...core.data.grid import Grid
+from ...core.data.structural_frame import StructuralFrame
+
+
+@dataclass
+class InterpolationInputCache:
+    """
+    Per-component cache of the engine input generated from a GeoModel.
+
+    Every component (surface points, orientations, grid and input data descriptor) is stored together with a
+    fingerprint of the GeoModel state it was built from. On each request only the components whose fingerprint
+    changed are rebuilt. Setting ``StructuralFrame.is_dirty`` to True forces a full rebuild on the next request.
+    """
+
+    surface_points: Optional[SurfacePoints] = None
+    orientations: Optional[Orientations] = None
+    grid: Optional[EngineGrid] = None
+    input_data_descriptor: Optional[InputDataDescriptor] = None
+
+    _keys: dict[str, Hashable] = field(default_factory=dict, repr=False)
+
+    def invalidate(self, *components: str) -> None:
+        """Drop the given components (``"surface_points"``, ``"orientations"``, ``"grid"``,
+        ``"input_data_descriptor"``) or all of them if none is given."""
+        if not components:
+            self._keys.clear()
+            return
+        for component in components:
+            self._keys.pop(component, None)
+
+    def get_interpolation_input(self, geo_model: "gempy.data.GeoModel", grid: Optional[EngineGrid] = None) -> InterpolationInput:
+        """Returns an InterpolationInput reusing every component whose source data has not changed.
+
+        Args:
+            geo_model (GeoModel): The model the input is built from.
+            grid (Optional[EngineGrid]): Grid to interpolate on instead of the grid of the model, e.g. a chunk of
+                coordinates. The grid of the model is then neither built nor cached.
+        """
+        self._check_dirty(geo_model.structural_frame)
+
+        backend_key = _backend_key()
+        transform_key = (_transform_key(geo_model.input_transform), _transform_key(geo_model.grid.transform))
+
+        points_key = (backend_key, transform_key, _surface_points_key(geo_model.structural_frame))
+        if self._is_stale("surface_points", points_key):
+            self.surface_points = surface_points_from_geo_model(geo_model)
+
+        orientations_key = (backend_key, transform_key, _orientations_key(geo_model.structural_frame))
+        if self._is_stale("orientations", orientations_key):
+            self.orientations = orientations_from_geo_model(geo_model)
+
+        if grid is None:
+            grid_key = (backend_key, transform_key, _grid_key(geo_model.grid))
+            if self._is_stale("grid", grid_key):
+                self.grid = engine_grid_from_geo_model(geo_model)
+            grid = self.grid
+
+        return InterpolationInput(
+            surface_points=self.surface_points,
+            orientations=self.orientations,
+            grid=grid,
+            unit_values=geo_model.structural_frame.elements_ids
+        )
+
+    def get_input_data_descriptor(self, structural_frame: StructuralFrame) -> InputDataDescriptor:
+        """Returns the InputDataDescriptor of the structural frame, rebuilding it only if the topology changed."""
+        self._check_dirty(structural_frame)
+
+        descriptor_key = _descriptor_key(structural_frame)
+        if self._is_stale("input_data_descriptor", descriptor_key):
+            self.input_data_descriptor = structural_frame.input_data_descriptor
+
+        return self.input_data_descriptor
+
+    def _check_dirty(self, structural_frame: StructuralFrame) -> None:
+        if structural_frame.is_dirty:
+            self.invalidate()
+            structural_frame.is_dirty = False
+
+    def _is_stale(self, component: str, key: Hashable) -> bool:
+        # * Gradients need fresh leaves on every call so nothing is reused while taping
+        if BackendTensor.COMPUTE_GRADS is False and self._keys.get(component) == key:
+            return False
+        self._keys[component] = key
+        return True
+
+
+def _array_digest(array: Optional[np.ndarray]) -> Optional[bytes]:
+    if array is None:
+        return None
+    array = np.ascontiguousarray(array)
+    return hashlib.blake2b(array.data, digest_size=16).digest() + str(array.shape).encode()
+
+
+def _backend_key() -> tuple:
+    return BackendTensor.engine_backend, BackendTensor.dtype
+
+
+def _transform_key(transform: Transform) -> tuple:
+    return (
+        _array_digest(np.asarray(transform.position, dtype=float)),
+        _array_digest(np.asarray(transform.rotation, dtype=float)),
+        _array_digest(np.asarray(transform.scale, dtype=float)),
+        _array_digest(None if transform.cached_pivot is None else np.asarray(transform.cached_pivot, dtype=float))
+    )
+
+
+def _surface_points_key(structural_frame: StructuralFrame) -> tuple:
+    return tuple(
+        (element.name, _array_digest(element.surface_points.data))
+        for group in structural_frame.structural_groups
+        for element in group.elements
+    )
+
+
+def _orientations_key(structural_frame: StructuralFrame) -> tuple:
+    return tuple(
+        (element.name, _array_digest(element.orientations.data))
+        for group in structural_frame.structural_groups
+        for element in group.elements
+    )
+
+
+def _regular_grid_key(regular_grid) -> Optional[tuple]:
+    if regular_grid is None:
+        return None
+    return _array_digest(np.asarray(regular_grid.extent, dtype=float)), _array_digest(np.asarray(regular_grid.resolution))
+
+
+def _grid_key(grid: Grid) -> tuple:
+    centered_grid = grid.centered_grid
+    return (
+        grid.active_grids,
+        _regular_grid_key(grid.dense_grid),
+        _regular_grid_key(grid.octree_grid),
+        _array_digest(grid.custom_grid.values if grid.custom_grid is not None else None),
+        None if grid.topography is None else grid.topography.dem_key,
+        _array_digest(grid.sections.values if grid.sections is not None else None),
+        None if centered_grid is None else (
+            _array_digest(np.asarray(centered_grid.centers, dtype=float)),
+            _array_digest(np.asarray(centered_grid.radius, dtype=float)),
+            _array_digest(np.asarray(centered_grid.resolution, dtype=float))
+        )
+    )
+
+
+def _descriptor_key(structural_frame: StructuralFrame) -> tuple:
+    groups_key = tuple(
+        (
+            group.name,
+            group.structural_relation,
+            id(group.faults_input_data),
+            tuple((element.name, element.number_of_points, element.number_of_orientations) for element in group.elements)
+        )
+        for group in structural_frame.structural_groups
+    )
+    return groups_key, _array_digest(structural_frame.fault_relations)
@@ -0,0 +1,104 @@
+from dataclasses import dataclass, field
+from typing import Hashable
+
+import numpy as np
+
+from gempy_engine.core.data import InterpolationOptions
+from gempy_engine.modules.weights_cache.weights_cache_interface import WeightCache
+
+from .interpolation_input_cache import _array_digest, _backend_key, _transform_key
+from ...core.data.structural_frame import StructuralFrame
+
+
+@dataclass
+class KrigingWeightsCache:
+    """
+    Solved kriging weights of every structural group of a GeoModel.
+
+    Each entry is keyed by a digest of the group input (points, orientations and nuggets of the group and of the
+    faults acting on it), the transforms, the backend and the kernel options. Before every engine call the
+    matching entries are loaded into the engine weights cache, so the covariance system is only solved again for
+    groups whose input changed. Stale engine entries are dropped, which protects against the engine hash being
+    computed on truncated array representations.
+    """
+
+    entries: dict[str, tuple[Hashable, dict]] = field(default_factory=dict)  #: Group name -> (input digest, engine weights entry).
+    _pending_keys: list[tuple[str, Hashable]] = field(default_factory=list, repr=False)  #: Group keys of the input of the ongoing engine call.
+
+    def restore(self, geo_model: "gempy.data.GeoModel") -> int:
+        """
+        Load the cached weights of every unchanged group into the engine weights cache.
+
+        Returns:
+            int: Number of groups whose weights were restored.
+        """
+        options: InterpolationOptions = geo_model.interpolation_options
+        if not _caching_enabled(options):
+            return 0
+
+        # * Keys are taken before the engine call since setting the solutions may reorder the elements
+        self._pending_keys = _group_keys(geo_model)
+
+        restored = 0
+        for stack_number, (group_name, key) in enumerate(self._pending_keys):
+            engine_key = _engine_key(options, stack_number)
+            entry = self.entries.get(group_name)
+            if entry is not None and entry[0] == key:
+                WeightCache.memory_cache[engine_key] = entry[1]
+                restored += 1
+            else:
+                WeightCache.memory_cache.pop(engine_key, None)
+        return restored
+
+    def store(self, geo_model: "gempy.data.GeoModel") -> None:
+        """Collect the weights solved by the engine call that followed the last `restore` for every group."""
+        options: InterpolationOptions = geo_model.interpolation_options
+        if not _caching_enabled(options):
+            return
+
+        entries = {}
+        for stack_number, (group_name, key) in enumerate(self._pending_keys or _group_keys(geo_model)):
+            engine_entry = WeightCache.memory_cache.get(_engine_key(options, stack_number))
+            if engine_entry is not None:
+                entries[group_name] = (key, engine_entry)
+        self.entries = entries
+        self._pending_keys = []
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+def _caching_enabled(options: InterpolationOptions) -> bool:
+    return options.cache_mode in (InterpolationOptions.CacheMode.CACHE, InterpolationOptions.CacheMode.IN_MEMORY_CACHE)
+
+
+def _engine_key(options: InterpolationOptions, stack_number: int) -> str:
+    # * Same key the engine uses in `interpolate_scalar_field`
+    return f"{options.cache_model_name}.{stack_number}"
+
+
+def _group_keys(geo_model: "gempy.data.GeoModel") -> list[tuple[str, Hashable]]:
+    structural_frame: StructuralFrame = geo_model.structural_frame
+    shared_key = (
+        _backend_key(),
+        _transform_key(geo_model.input_transform),
+        _transform_key(geo_model.grid.transform),
+        repr(geo_model.interpolation_options.kernel_options)
+    )
+
+    fault_relations = structural_frame.fault_relations
+    keys: list[tuple[str, Hashable]] = []
+    for i, group in enumerate(structural_frame.structural_groups):
+        own_key = tuple(
+            (
+                element.name,
+                _array_digest(element.surface_points.data),
+                _array_digest(element.orientations.data)
+            )
+            for element in group.elements
+        )
+
+        # * The fault values on the surface points depend on the input of every fault offsetting this group
+        faults_key = tuple(keys[j][1] for j in np.flatnonzero(fault_relations[:i, i]))
+        keys.append((group.name, (shared_key, group.structural_relation, id(group.faults_input_data), own_key, faults_key)))
+    return keys
@@ -1,4 +1,4 @@
-﻿from typing import Sequence, Optional, Union
+﻿from typing import Iterator, Sequence, Optional, Union
 
 import numpy as np
 
@@ -53,40 +53,71 @@ def add_surface_points(
     elements_names = np.array(elements_names)
     nugget = np.array(nugget)
 
-    unique_names = np.unique(elements_names)
-    grouped_data = {}
-
-    for name in unique_names:
-        mask = (elements_names == name)
-        grouped_data[name] = {
-                'x'     : x[mask],
-                'y'     : y[mask],
-                'z'     : z[mask],
-                'nugget': nugget[mask]
-        }
-
     # * Loop per element_name
-    for element_name, data in grouped_data.items():
+    for element_name, rows in _group_rows_by_name(elements_names):
         formatted_data, _ = SurfacePointsTable._data_from_arrays(
-            x=data['x'],
-            y=data['y'],
-            z=data['z'],
-            names=[element_name] * len(data['x']),
-            nugget=data['nugget'],
+            x=x[rows],
+            y=y[rows],
+            z=z[rows],
+            names=element_name,
+            nugget=nugget[rows],
             name_id_map=None
         )
 
         element: StructuralElement = geo_model.structural_frame.get_element_by_name(element_name)
-        element.surface_points.data = np.concatenate([
-                element.surface_points.data,
-                formatted_data
-        ])
+        element.surface_points.append(formatted_data)
 
     return geo_model.structural_frame
 
 
-def delete_surface_points():
-    raise NotImplementedError
+def delete_surface_points(
+        geo_model: GeoModel,
+        indices: Optional[Union[int, slice, Sequence[int], np.ndarray]] = None,
+        elements_names: Optional[Union[str, Sequence[str]]] = None,
+        extent: Optional[Sequence[float]] = None,
+        polygon: Optional[Union[Sequence[Sequence[float]], np.ndarray]] = None,
+        center: Optional[Sequence[float]] = None,
+        radius: Optional[float] = None
+) -> StructuralFrame:
+    """Delete surface points from the geological model.
+
+    The points to delete are selected by any combination of the criteria below; only points matching all of the
+    given criteria are deleted. The selection is evaluated vectorized over all surface points of the structural
+    frame and the rows are removed in a single pass, without rebuilding the frame. Cached interpolation inputs and
+    kriging weights are keyed on the point data, so they are refreshed on the next computation.
+
+    Args:
+        geo_model (GeoModel): The geological model from which the surface points will be deleted.
+        indices (Optional[Union[int, slice, Sequence[int], np.ndarray]]): Global indices of the points, i.e. rows of
+            `geo_model.surface_points_copy`.
+        elements_names (Optional[Union[str, Sequence[str]]]): Names of the elements whose points are selected.
+        extent (Optional[Sequence[float]]): Bounding box [x_min, x_max, y_min, y_max, z_min, z_max]. Points inside it,
+            bounds included, are selected.
+        polygon (Optional[Union[Sequence[Sequence[float]], np.ndarray]]): Vertices (n, 2) of a polygon in the XY plane.
+            Points whose XY coordinates fall inside it are selected.
+        center (Optional[Sequence[float]]): Center of a sphere. Must be given together with `radius`.
+        radius (Optional[float]): Points closer than or at `radius` from `center` are selected.
+
+    Returns:
+        StructuralFrame: The updated structural frame of the geological model.
+
+    Raises:
+        ValueError: If no selection criterion is given or only one of `center` and `radius` is given.
+    """
+    structural_frame = geo_model.structural_frame
+    mask = _select_points(
+        xyz=structural_frame.surface_points_copy.xyz,
+        offsets=structural_frame.surface_points_offsets,
+        structural_frame=structural_frame,
+        indices=indices,
+        elements_names=elements_names,
+        extent=extent,
+        polygon=polygon,
+        center=center,
+        radius=radius
+    )
+    structural_frame.remove_surface_points(mask)
+    return structural_frame
 
 
 def add_orientations(geo_model: GeoModel,
@@ -152,37 +183,21 @@ def add_orientations(geo_model: GeoModel,
     pole_vector = np.array(pole_vector)
     nugget = np.array(nugget)
 
-    unique_names = np.unique(elements_names)
-    grouped_data = {}
-
-    for name in unique_names:
-        mask = (elements_names == name)
-        grouped_data[name] = {
-                'x'          : x[mask],
-                'y'          : y[mask],
-                'z'          : z[mask],
-                'pole_vector': pole_vector[mask],
-                'nugget'     : nugget[mask]
-        }
-
     # * Loop per element_name
-    for element_name, data in grouped_data.items():
+    for element_name, rows in _group_rows_by_name(elements_names):
         formatted_data, _ = OrientationsTable._data_from_arrays(
-            x=data['x'],
-            y=data['y'],
-            z=data['z'],
-            G_x=data['pole_vector'][..., 0],
-            G_y=data['pole_vector'][..., 1],
-            G_z=data['pole_vector'][..., 2],
-            names=[element_name] * len(data['x']),
-            nugget=data['nugget'],
+            x=x[rows],
+            y=y[rows],
+            z=z[rows],
+            G_x=pole_vector[rows, 0],
+            G_y=pole_vector[rows, 1],
+            G_z=pole_vector[rows, 2],
+            names=element_name,
+            nugget=nugget[rows],
         )
 
         element: StructuralElement = geo_model.structural_frame.get_element_by_name(element_name)
-        element.orientations.data = np.concatenate([
-                element.orientations.data,
-                formatted_data
-        ])
+        element.orientations.append(formatted_data)
 
     return geo_model.structural_frame
 
@@ -307,8 +322,50 @@ def modify_surface_points(geo_model: GeoModel,
     return geo_model.structural_frame
 
 
-def delete_orientations():
-    raise NotImplementedError
+def delete_orientations(
+        geo_model: GeoModel,
+        indices: Optional[Union[int, slice, Sequence[int], np.ndarray]] = None,
+        elements_names: Optional[Union[str, Sequence[str]]] = None,
+        extent: Optional[Sequence[float]] = None,
+        polygon: Optional[Union[Sequence[Sequence[float]], np.ndarray]] = None,
+        center: Optional[Sequence[float]] = None,
+        radius: Optional[float] = None
+) -> StructuralFrame:
+    """Delete orientations from the geological model.
+
+    Works as :func:`delete_surface_points`: only orientations matching all of the given criteria are deleted, in a
+    single pass over all orientations of the structural frame.
+
+    Args:
+        geo_model (GeoModel): The geological model from which the orientations will be deleted.
+        indices (Optional[Union[int, slice, Sequence[int], np.ndarray]]): Global indices of the orientations, i.e. rows
+            of `geo_model.orientations_copy`.
+        elements_names (Optional[Union[str, Sequence[str]]]): Names of the elements whose orientations are selected.
+        extent (Optional[Sequence[float]]): Bounding box [x_min, x_max, y_min, y_max, z_min, z_max].
+        polygon (Optional[Union[Sequence[Sequence[float]], np.ndarray]]): Vertices (n, 2) of a polygon in the XY plane.
+        center (Optional[Sequence[float]]): Center of a sphere. Must be given together with `radius`.
+        radius (Optional[float]): Orientations closer than or at `radius` from `center` are selected.
+
+    Returns:
+        StructuralFrame: The updated structural frame of the geological model.
+
+    Raises:
+        ValueError: If no selection criterion is given or only one of `center` and `radius` is given.
+    """
+    structural_frame = geo_model.structural_frame
+    mask = _select_points(
+        xyz=structural_frame.orientations_copy.xyz,
+        offsets=structural_frame.orientations_offsets,
+        structural_frame=structural_frame,
+        indices=indices,
+        elements_names=elements_names,
+        extent=extent,
+        polygon=polygon,
+        center=center,
+        radius=radius
+    )
+    structural_frame.remove_orientations(mask)
+    return structural_frame
 
 
 def convert_orientation_to_pole_vector(azimuth: Sequence[float], dip: Sequence[float], polarity: Sequence[float]) -> Sequence[np.ndarray]:
@@ -347,6 +404,67 @@ def compute_adp_from_gradients(G_x: np.ndarray, G_y: np.ndarray, G_z: np.ndarray
     return azimuth, dip, polarity
 
 
+def _select_points(xyz: np.ndarray, offsets: np.ndarray, structural_frame: StructuralFrame,
+                   indices=None, elements_names=None, extent=None, polygon=None, center=None, radius=None) -> np.ndarray:
+    """Boolean mask of the rows matching all the given criteria. `offsets` are the element row offsets of `xyz`."""
+    if (center is None) != (radius is None):
+        raise ValueError("center and radius must be provided together.")
+    if all(criterion is None for criterion in (indices, elements_names, extent, polygon, center)):
+        raise ValueError("At least one of indices, elements_names, extent, polygon or center and radius must be provided.")
+
+    n_points = len(xyz)
+    mask = np.ones(n_points, dtype=bool)
+
+    if indices is not None:
+        selected = np.zeros(n_points, dtype=bool)
+        selected[indices] = True
+        mask &= selected
+
+    if elements_names is not None:
+        if isinstance(elements_names, str):
+            elements_names = [elements_names]
+        element_index = {id(element): i for i, element in enumerate(structural_frame.structural_elements)}
+        selected = np.zeros(n_points, dtype=bool)
+        for name in elements_names:
+            i = element_index[id(structural_frame.get_element_by_name(name))]
+            selected[offsets[i]:offsets[i + 1]] = True
+        mask &= selected
+
+    if extent is not None:
+        bounds = np.asarray(extent, dtype=float).reshape(3, 2)
+        mask &= np.all((xyz >= bounds[:, 0]) & (xyz <= bounds[:, 1]), axis=1)
+
+    if polygon is not None:
+        mask &= _points_in_polygon(xyz[:, :2], np.asarray(polygon, dtype=float))
+
+    if center is not None:
+        distance_squared = np.sum((xyz - np.asarray(center, dtype=float)) ** 2, axis=1)
+        mask &= distance_squared <= radius ** 2
+
+    return mask
+
+
+def _points_in_polygon(xy: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Even-odd rule test of every point against every polygon edge at once."""
+    x, y = xy[:, 0, None], xy[:, 1, None]
+    x0, y0 = polygon[:, 0], polygon[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+
+    spans_y = (y0 > y) != (y1 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_crossing = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+    crossings = spans_y & (x < x_crossing)
+    return np.count_nonzero(crossings, axis=1) % 2 == 1
+
+
+def _group_rows_by_name(elements_names: np.ndarray) -> Iterator[tuple[str, np.ndarray]]:
+    """Yields every unique name, in sorted order, with the input rows that belong to it, keeping their input order."""
+    unique_names, inverse = np.unique(elements_names, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    rows_per_name = np.split(order, np.cumsum(np.bincount(inverse, minlength=len(unique_names)))[:-1])
+    return zip(unique_names.tolist(), rows_per_name)
+
+
 def _validate_args(elements_names, *args):
     if isinstance(elements_names, str):
         elements_names = np.array([elements_names] * len(args[0]))
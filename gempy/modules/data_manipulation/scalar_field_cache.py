@@ -0,0 +1,176 @@
+import collections
+import contextlib
+import copy
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Iterator, Optional
+
+import numpy as np
+
+from gempy_engine.API.interp_single import _interp_scalar_field
+from gempy_engine.config import AvailableBackends
+from gempy_engine.core.backend_tensor import BackendTensor
+from gempy_engine.core.data import InterpolationOptions
+from gempy_engine.core.data.exported_fields import ExportedFields
+from gempy_engine.core.data.internal_structs import SolverInput
+
+from .engine_hooks import InterpolateHook
+from .kriging_weights_cache import _caching_enabled, _group_keys
+
+_FIELD_NAMES = ("_scalar_field", "_gx_field", "_gy_field", "_gz_field")
+
+
+@dataclass
+class _GroupFields:
+    key: Hashable  #: Digest of the group input, see `kriging_weights_cache._group_keys`.
+    xyz: np.ndarray  #: Coordinates the fields were evaluated at.
+    weights: np.ndarray  #: Kriging weights of the group.
+    fields: tuple[Optional[np.ndarray], ...]  #: Scalar field and gradients at `xyz`.
+
+
+@dataclass
+class ScalarFieldCache:
+    """
+    Scalar fields of every structural group evaluated by the last engine call, reused by the next one.
+
+    A group is recomputed only if its own input changed or the input of a fault offsetting it changed: the group key
+    follows the fault relation matrix, so editing one formation leaves older faults and unrelated series untouched.
+    For an unchanged group the weights are reused and the fields are only evaluated at coordinates that were not
+    evaluated before (e.g. octree cells refined around a moved boundary, or new surface points), the rest is
+    copied from the previous call. Stack masking and segmentation are still done by the engine on the merged fields.
+
+    The fields and their coordinates are kept between calls, for octree grids several times the size of the
+    solutions, so the cache is only used when `GemPyEngineConfig.reuse_scalar_fields` is set. The engine calls it
+    through :attr:`EngineHooks.interpolate_scalar_field`, bound for one engine call. A GeoModel must not be
+    computed from several threads at the same time: the hook of each call fills the entries of the same cache.
+    """
+
+    entries: dict[tuple[str, int], _GroupFields] = field(default_factory=dict, repr=False)  #: (group name, call number within the engine call) -> fields.
+    n_reused_groups: int = 0  #: Number of group evaluations served from the cache in the last engine call.
+    n_evaluated_points: int = 0  #: Number of coordinates evaluated for reused groups in the last engine call.
+
+    @contextlib.contextmanager
+    def interpolate_hook(self, geo_model: "gempy.data.GeoModel") -> Iterator[Optional[InterpolateHook]]:
+        """
+        Yields the :attr:`EngineHooks.interpolate_scalar_field` hook serving unchanged groups from the cache during one
+        engine call. The fields evaluated by the call replace the entries when the context exits.
+
+        Yields:
+            Optional[InterpolateHook]: The hook, or None if the configuration is not supported.
+        """
+        options: InterpolationOptions = geo_model.interpolation_options
+        if not _is_supported(options):
+            yield None
+            return
+
+        # * Keys are taken before the engine call since setting the solutions may reorder the elements
+        group_keys = _group_keys(geo_model)
+        calls_per_stack = collections.Counter()
+        new_entries: dict[tuple[str, int], _GroupFields] = {}
+        self.n_reused_groups = self.n_evaluated_points = 0
+
+        def _interpolate(solver_input: SolverInput, options: InterpolationOptions, stack_number: Optional[int],
+                         engine_interpolate: Callable) -> tuple[np.ndarray, ExportedFields]:
+            if stack_number is None or stack_number >= len(group_keys):
+                return engine_interpolate(solver_input, options, stack_number)
+
+            group_name, group_key = group_keys[stack_number]
+            entry_key = (group_name, calls_per_stack[stack_number])
+            calls_per_stack[stack_number] += 1
+            key = (group_key, options.number_dimensions)
+            xyz = np.asarray(solver_input.xyz_to_interpolate)
+
+            # * The engine toggles the gradients between calls, cached fields without them can only serve calls that
+            # * do not need them
+            cached = self.entries.get(entry_key)
+            if cached is not None and cached.key == key and (cached.fields[1] is not None or not options.compute_scalar_gradient):
+                weights = cached.weights
+                exported_fields = self._merge_fields(cached, solver_input, weights, options)
+                self.n_reused_groups += 1
+            else:
+                weights, exported_fields = engine_interpolate(solver_input, options, stack_number)
+
+            new_entries[entry_key] = _GroupFields(
+                key=key,
+                xyz=xyz.copy(),
+                weights=weights,
+                fields=tuple(_copy_or_none(getattr(exported_fields, name)) for name in _FIELD_NAMES)
+            )
+            return weights, exported_fields
+
+        yield _interpolate
+        self.entries = new_entries
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def _merge_fields(self, cached: _GroupFields, solver_input: SolverInput, weights: np.ndarray,
+                      options: InterpolationOptions) -> ExportedFields:
+        xyz = np.asarray(solver_input.xyz_to_interpolate)
+        new_rows, old_rows = _match_rows(xyz, cached.xyz)
+
+        missing_rows = np.ones(len(xyz), dtype=bool)
+        missing_rows[new_rows] = False
+        missing_rows = np.flatnonzero(missing_rows)
+        self.n_evaluated_points += len(missing_rows)
+
+        if len(missing_rows) > 0:
+            evaluated = _interp_scalar_field._evaluate_sys_eq(_solver_input_subset(solver_input, missing_rows), weights, options)
+        else:
+            evaluated = None
+
+        merged = []
+        for name, cached_field in zip(_FIELD_NAMES, cached.fields):
+            if cached_field is None or (name != "_scalar_field" and not options.compute_scalar_gradient):
+                merged.append(None)
+                continue
+            values = np.empty(len(xyz), dtype=cached_field.dtype)
+            values[new_rows] = cached_field[old_rows]
+            if evaluated is not None:
+                values[missing_rows] = getattr(evaluated, name)
+            merged.append(values)
+        return ExportedFields(*merged)
+
+
+def _is_supported(options: InterpolationOptions) -> bool:
+    return (
+            _caching_enabled(options)
+            and BackendTensor.engine_backend == AvailableBackends.numpy
+            and not BackendTensor.pykeops_enabled
+            and not BackendTensor.COMPUTE_GRADS
+    )
+
+
+def _match_rows(xyz: np.ndarray, cached_xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Rows of `xyz` found in `cached_xyz` and their position there. Octree grids repeat shared cell corners, so
+    every occurrence of a row is matched, not only the first one."""
+    cached_rows, first_occurrence = np.unique(_row_bytes(cached_xyz), return_index=True)
+    if len(cached_rows) == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+    rows = _row_bytes(xyz)
+    position = np.minimum(np.searchsorted(cached_rows, rows), len(cached_rows) - 1)
+    found = cached_rows[position] == rows
+    return np.flatnonzero(found), first_occurrence[position[found]]
+
+
+def _row_bytes(xyz: np.ndarray) -> np.ndarray:
+    xyz = np.ascontiguousarray(xyz)
+    return xyz.view(np.dtype((np.void, xyz.dtype.itemsize * xyz.shape[1]))).ravel()
+
+
+def _solver_input_subset(solver_input: SolverInput, rows: np.ndarray) -> SolverInput:
+    fault_internal = solver_input._fault_internal
+    if fault_internal is not None and fault_internal.fault_values_everywhere is not None and fault_internal.n_faults > 0:
+        fault_internal = copy.copy(fault_internal)
+        fault_internal.fault_values_everywhere = fault_internal.fault_values_everywhere[:, rows]
+
+    return SolverInput(
+        sp_internal=solver_input.sp_internal,
+        ori_internal=solver_input.ori_internal,
+        xyz_to_interpolate=solver_input.xyz_to_interpolate[rows],
+        fault_internal=fault_internal
+    )
+
+
+def _copy_or_none(array: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    return None if array is None else np.array(array, copy=True)
@@ -0,0 +1,205 @@
+import dataclasses
+import enum
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+import gempy_engine
+from gempy_engine.core.data import Solutions
+
+from .interpolation_input_cache import _array_digest, _backend_key, _grid_key, _transform_key
+from ..serialization.binary_model_file import _Decoder, _Encoder
+
+_FORMAT_VERSION = 2
+_MANIFEST = "__manifest__"
+
+
+@dataclass
+class SolutionsDiskCache:
+    """
+    Content-addressed cache of computed solutions on disk.
+
+    Every entry is a single ``.npz`` file named after a stable hash of everything the solutions depend on: surface
+    points, orientations, structural frame topology, grid definition, transforms, interpolation options, backend and
+    engine version. Entries hold the whole solutions, octree levels included, encoded like the model files of
+    :func:`gempy.save_model`. The least recently used entries are evicted once the directory is over `max_bytes`.
+    """
+
+    directory: str  #: Directory of the cache files. Created on first store.
+    max_bytes: int = 2 ** 30  #: Maximum total size of the cache files.
+
+    n_hits: int = 0  #: Number of solutions loaded from disk.
+    n_misses: int = 0  #: Number of lookups without a matching entry.
+
+    def key(self, geo_model: "gempy.data.GeoModel") -> str:
+        """Stable hash of the model content the solutions depend on."""
+        return hashlib.blake2b(repr(_model_fingerprint(geo_model)).encode(), digest_size=20).hexdigest()
+
+    def load(self, key: str) -> Optional[Solutions]:
+        """
+        Load the solutions stored under `key`.
+
+        Args:
+            key (str): Content key of the model, see :meth:`key`.
+
+        Returns:
+            Optional[Solutions]: The cached solutions, or None if there is no entry.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                solutions = _solutions_from_npz(npz)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self.n_misses += 1
+            return None
+
+        os.utime(path)  # * The modification time is the recency of the entry
+        self.n_hits += 1
+        return solutions
+
+    def store(self, key: str, solutions: Solutions) -> None:
+        """
+        Write the solutions under `key` and evict the least recently used entries above the size cap.
+
+        Args:
+            key (str): Content key of the model, taken before the computation since setting the solutions reorders
+                the elements of the model.
+            solutions (Solutions): The computed solutions.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # * Written under a temporary name so a concurrent reader never sees a partial file
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                np.savez(file, **_solutions_to_arrays(solutions))
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Remove the least recently used entries until the cache fits in `max_bytes`.
+
+        Args:
+            keep (Optional[str]): Key of an entry that is never evicted, e.g. the one just written.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total_bytes = sum(stat.st_size for _, stat in entries)
+
+        n_removed = 0
+        for path, stat in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            if keep is not None and path == self._path(keep):
+                continue
+            os.remove(path)
+            total_bytes -= stat.st_size
+            n_removed += 1
+        return n_removed
+
+    def clear(self) -> None:
+        for path, _ in self._entries():
+            os.remove(path)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _entries(self) -> list[tuple[str, os.stat_result]]:
+        if not os.path.isdir(self.directory):
+            return []
+        with os.scandir(self.directory) as scanned:
+            return [(entry.path, entry.stat()) for entry in scanned if entry.name.endswith(".npz")]
+
+
+def _model_fingerprint(geo_model: "gempy.data.GeoModel") -> tuple:
+    structural_frame = geo_model.structural_frame
+    options = geo_model.interpolation_options
+
+    groups_key = tuple(
+        (
+            group.name,
+            group.structural_relation.name,
+            # * Only the user given fault data, the fault values are written by the engine
+            None if group.faults_input_data is None else (
+                _fingerprint(group.faults_input_data.thickness),
+                _fingerprint(group.faults_input_data.finite_fault_data)
+            ),
+            tuple(
+                (element.name, element.id, _array_digest(element.surface_points.data), _array_digest(element.orientations.data))
+                for element in group.elements
+            )
+        )
+        for group in structural_frame.structural_groups
+    )
+
+    return (
+        _FORMAT_VERSION,
+        gempy_engine.__version__,
+        str(_backend_key()),
+        groups_key,
+        _array_digest(structural_frame.fault_relations),
+        _transform_key(geo_model.input_transform),
+        _transform_key(geo_model.grid.transform),
+        _grid_key(geo_model.grid),
+        _fingerprint(options.kernel_options),
+        _fingerprint(options.evaluation_options),
+        options.block_solutions_type.name,
+        options.sigmoid_slope,
+        _fingerprint(geo_model.geophysics_input)
+    )
+
+
+def _fingerprint(value: Any) -> Any:
+    """Process independent representation of `value`: arrays are digested, containers are walked."""
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, enum.Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, np.ndarray) or hasattr(value, "__array__"):
+        return _array_digest(np.asarray(value))
+    if dataclasses.is_dataclass(value):
+        return type(value).__name__, tuple(
+            (field.name, _fingerprint(getattr(value, field.name))) for field in dataclasses.fields(value)
+        )
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _fingerprint(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint(item) for item in value)
+    return repr(value)
+
+
+# region Serialization
+
+def _solutions_to_arrays(solutions: Solutions) -> dict[str, np.ndarray]:
+    # * Same encoding as the model files: a JSON description of the object graph and its arrays stored apart
+    arrays: list[np.ndarray] = []
+    root = _Encoder(arrays).encode(solutions)
+    stored = {f"arrays/{i}": array for i, array in enumerate(arrays)}
+    stored[_MANIFEST] = np.array(json.dumps({"n_arrays": len(arrays), "root": root}))
+    return stored
+
+
+def _solutions_from_npz(npz) -> Solutions:
+    manifest = json.loads(str(npz[_MANIFEST]))
+    arrays = [npz[f"arrays/{i}"] for i in range(manifest["n_arrays"])]
+    return _Decoder(arrays).decode(manifest["root"])
+
+# endregion
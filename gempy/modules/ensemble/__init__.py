@@ -0,0 +1,3 @@
+from .ensemble_runner import run_ensemble, geo_model_snapshot
+
+__all__ = ['run_ensemble', 'geo_model_snapshot']
@@ -0,0 +1,147 @@
+﻿import copy
+import math
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ...API.compute_API import compute_model_batch
+from ...core.data.gempy_engine_config import GemPyEngineConfig
+from ...core.data.geo_model import GeoModel
+
+# * State of each worker process. Set once by `_init_worker` so the model is unpickled once per worker, not per task
+_worker_geo_model: Optional[GeoModel] = None
+_worker_engine_config: Optional[GemPyEngineConfig] = None
+
+
+def geo_model_snapshot(geo_model: GeoModel) -> bytes:
+    """
+    Pickle the minimal state of a GeoModel needed to compute it.
+
+    Solutions are dropped. The legacy model, the taped interpolation input and the caches are left out by
+    `GeoModel.__getstate__`. The original GeoModel is not modified.
+
+    Args:
+        geo_model (GeoModel): The model to snapshot.
+
+    Returns:
+        bytes: The pickled snapshot.
+    """
+    snapshot = copy.copy(geo_model)
+    snapshot._solutions = None
+    return pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def run_ensemble(geo_model: GeoModel, realizations: np.ndarray, orientation_realizations: Optional[np.ndarray] = None,
+                 fields: Sequence[str] = ("lith_block", "scalar_field_matrix"), max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None, engine_config: Optional[GemPyEngineConfig] = None) -> dict[str, np.ndarray]:
+    """
+    Compute an ensemble of realizations in parallel over a process pool.
+
+    The realizations follow the conventions of :func:`gempy.compute_model_batch`. A snapshot of the model is sent
+    once to every worker, which then computes chunks of realizations and writes the requested
+    ``Solutions.raw_arrays`` fields directly into shared memory blocks allocated by the caller. As in the batch,
+    the kriging system of every realization is solved, also when a worker computes several of them in a row.
+
+    Args:
+        geo_model (GeoModel): The model to compute. It is not modified.
+        realizations (np.ndarray): Surface point offsets of shape (n_realizations, n_points, 3).
+        orientation_realizations (Optional[np.ndarray]): Orientation position offsets of shape
+            (n_realizations, n_orientations, 3). Defaults to None.
+        fields (Sequence[str]): Names of the ``RawArraysSolution`` attributes to collect.
+        max_workers (Optional[int]): Number of worker processes. Defaults to the ``ProcessPoolExecutor`` default.
+        chunk_size (Optional[int]): Realizations per task. Defaults to spreading the work in four chunks per worker.
+        engine_config (Optional[GemPyEngineConfig]): Configuration for the computational engine.
+
+    Raises:
+        ValueError: If a requested field is not available in the solutions.
+
+    Returns:
+        dict[str, np.ndarray]: For every field an array of shape (n_realizations, \\*field_shape).
+    """
+    realizations = np.asarray(realizations, dtype=float)
+    n_realizations = realizations.shape[0]
+    engine_config = engine_config or GemPyEngineConfig(use_gpu=False)
+
+    # * The first realization runs here to validate the input and learn the shape of every field
+    first_solution = compute_model_batch(
+        gempy_model=geo_model,
+        realizations=realizations[:1],
+        orientation_realizations=None if orientation_realizations is None else orientation_realizations[:1],
+        engine_config=engine_config
+    )[0]
+
+    blocks: dict[str, shared_memory.SharedMemory] = {}
+    specs: dict[str, tuple[str, tuple, str]] = {}
+    try:
+        for name in fields:
+            value = getattr(first_solution.raw_arrays, name, None)
+            if value is None:
+                raise ValueError(f"Field {name} is not available in the solutions of this model.")
+            value = np.asarray(value)
+            shape = (n_realizations, *value.shape)
+            block = shared_memory.SharedMemory(create=True, size=max(1, math.prod(shape) * value.dtype.itemsize))
+            blocks[name] = block
+            specs[name] = (block.name, shape, value.dtype.str)
+            np.ndarray(shape, dtype=value.dtype, buffer=block.buf)[0] = value
+
+        if n_realizations > 1:
+            workers = max_workers or os.cpu_count() or 1
+            chunk_size = chunk_size or max(1, math.ceil((n_realizations - 1) / (workers * 4)))
+            with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(geo_model_snapshot(geo_model), engine_config)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _compute_chunk,
+                        start,
+                        realizations[start:start + chunk_size],
+                        None if orientation_realizations is None else orientation_realizations[start:start + chunk_size],
+                        specs
+                    )
+                    for start in range(1, n_realizations, chunk_size)
+                ]
+                for future in futures:
+                    future.result()
+
+        return {
+            name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=blocks[name].buf).copy()
+            for name, (_, shape, dtype) in specs.items()
+        }
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def _init_worker(snapshot: bytes, engine_config: GemPyEngineConfig) -> None:
+    global _worker_geo_model, _worker_engine_config
+    _worker_geo_model = pickle.loads(snapshot)
+    _worker_engine_config = engine_config
+
+
+def _compute_chunk(start: int, realizations: np.ndarray, orientation_realizations: Optional[np.ndarray],
+                   specs: dict[str, tuple[str, tuple, str]]) -> int:
+    solutions = compute_model_batch(
+        gempy_model=_worker_geo_model,
+        realizations=realizations,
+        orientation_realizations=orientation_realizations,
+        engine_config=_worker_engine_config
+    )
+
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        try:
+            output = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+            for i, solution in enumerate(solutions):
+                output[start + i] = getattr(solution.raw_arrays, name)
+            del output
+        finally:
+            block.close()
+
+    return len(solutions)
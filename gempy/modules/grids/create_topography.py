@@ -5,20 +5,21 @@ Created on 16.04.2019
 
 @author: Elisa Heim
 """
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 import numpy as np
 
-from gempy.optional_dependencies import require_scipy
+RandomSeed = Union[None, int, np.random.Generator]
 
 
 def create_random_topography(extent: np.array, resolution: np.array, dz: Optional[np.array] = None,
-                             fractal_dimension: Optional[float] = 2.0) -> np.array:
+                             fractal_dimension: Optional[float] = 2.0, seed: RandomSeed = None) -> np.array:
     dem = _LoadDEMArtificial(
         extent=extent,
         resolution=resolution,
         d_z=dz,
-        fd=fractal_dimension
+        fd=fractal_dimension,
+        seed=seed
     )
 
     return dem.get_values()
@@ -26,7 +27,7 @@ def create_random_topography(extent: np.array, resolution: np.array, dz: Optiona
 
 class _LoadDEMArtificial:  # * Cannot think of a good reason to be a class
 
-    def __init__(self, grid=None, fd=2.0, extent=None, resolution=None, d_z=None):
+    def __init__(self, grid=None, fd=2.0, extent=None, resolution=None, d_z=None, seed: RandomSeed = None):
         """Class to create a random topography based on a fractal grid algorithm.
 
         Args:
@@ -34,9 +35,10 @@ class _LoadDEMArtificial:  # * Cannot think of a good reason to be a class
             d_z:        maximum height difference. If none, last 20% of the model in z direction
             extent:     extent in xy direction. If none, geo_model.grid.extent
             resolution: desired resolution of the topography array. If none, geo_model.grid.resolution
+            seed:       seed or `np.random.Generator` of the random spectrum. If none, a fresh generator is used
         """
         self.values_2d = np.array([])
-        self.resolution = grid.resolution[:2] if resolution is None else resolution
+        self.resolution = np.asarray(grid.resolution[:2] if resolution is None else resolution)[:2]
 
         assert all(np.asarray(self.resolution) >= 2), 'The regular grid needs to be at least of size 2 on all directions.'
         self.extent = grid.extent if extent is None else extent
@@ -47,14 +49,14 @@ class _LoadDEMArtificial:  # * Cannot think of a good reason to be a class
         else:
             self.d_z = d_z
 
-        topo = self.fractalGrid(fd, n=self.resolution.max())
-        topo = np.interp(topo, (topo.min(), topo.max()), self.d_z)
-
-        self.dem_zval = topo[:self.resolution[0], :self.resolution[1]]  # crop fractal grid with resolution
+        topo = self.fractalGrid(fd, n=tuple(int(r) for r in self.resolution), rng=seed)
+        # * The fractal grid spans [0, 1], so this is the same as interpolating to d_z but stays in float32
+        self.dem_zval = topo * topo.dtype.type(self.d_z[1] - self.d_z[0]) + topo.dtype.type(self.d_z[0])
         self.create_topo_array()
 
     @staticmethod
-    def fractalGrid(fd, n=256):
+    def fractalGrid(fd, n: Union[int, Sequence[int]] = 256, rng: RandomSeed = None, use_rfft: bool = True,
+                    dtype=np.float32) -> np.ndarray:
         """
         Modified after https://github.com/samthiele/pycompass/blob/master/examples/3_Synthetic%20Examples.ipynb
 
@@ -65,55 +67,46 @@ class _LoadDEMArtificial:  # * Cannot think of a good reason to be a class
         The Science of Fractal Images, 1988
 
         (cf. http://shortrecipes.blogspot.com.au/2008/11/python-isotropic-fractal-surface.html)
+
+        The whole spectrum is drawn at once: amplitudes follow the power law of the wave number times a normal
+        deviate and phases are uniform. With `use_rfft` only the non-negative half of the last axis is drawn and
+        `irfft2` enforces the Hermitian symmetry, otherwise the real part of the full inverse transform is taken.
+
         **Arguments**:
          -fd = the fractal dimension
-         -N = the size of the fractal surface/image
+         -n = the size of the fractal surface/image, an int for a square image or (nx, ny)
+         -rng = seed or `np.random.Generator`
+         -use_rfft = draw only half of the spectrum and invert it with `irfft2`
+         -dtype = data type of the returned image
 
+        **Returns**:
+         The fractal surface scaled to [0, 1].
         """
+        shape = (n, n) if np.isscalar(n) else tuple(n)
+        rng = np.random.default_rng(rng)
+
         h = 1 - (fd - 2)
-        # X = np.zeros((N, N), complex)
-        a = np.zeros((n, n), complex)
         powerr = -(h + 1.0) / 2.0
 
-        for i in range(int(n / 2) + 1):
-            for j in range(int(n / 2) + 1):
-                phase = 2 * np.pi * np.random.rand()
-
-                if i != 0 or j != 0:
-                    rad = (i * i + j * j) ** powerr * np.random.normal()
-                else:
-                    rad = 0.0
-
-                a[i, j] = complex(rad * np.cos(phase), rad * np.sin(phase))
+        # * Wave numbers in cycles per cell, so the surface stays isotropic for rectangular shapes
+        k_x = np.fft.fftfreq(shape[0])[:, None]
+        k_y = (np.fft.rfftfreq(shape[1]) if use_rfft else np.fft.fftfreq(shape[1]))[None, :]
+        k_squared = k_x ** 2 + k_y ** 2
+        k_squared[0, 0] = 1.0
 
-                if i == 0:
-                    i0 = 0
-                else:
-                    i0 = n - i
+        rad = k_squared ** powerr * rng.standard_normal(k_squared.shape)
+        rad[0, 0] = 0.0  # * No mean component
+        phase = 2 * np.pi * rng.random(k_squared.shape)
+        spectrum = rad * np.exp(1j * phase)
 
-                if j == 0:
-                    j0 = 0
-                else:
-                    j0 = n - j
-
-                a[i0, j0] = complex(rad * np.cos(phase), -rad * np.sin(phase))
-
-                a.imag[int(n / 2)][0] = 0.0
-                a.imag[0, int(n / 2)] = 0.0
-                a.imag[int(n / 2)][int(n / 2)] = 0.0
-
-        for i in range(1, int(n / 2)):
-            for j in range(1, int(n / 2)):
-                phase = 2 * np.pi * np.random.rand()
-                rad = (i * i + j * j) ** powerr * np.random.normal()
-                a[i, n - j] = complex(rad * np.cos(phase), rad * np.sin(phase))
-                a[n - i, j] = complex(rad * np.cos(phase), -rad * np.sin(phase))
-
-        scipy = require_scipy()
-        itemp = scipy.fftpack.ifft2(a)
-        itemp = itemp - itemp.min()
+        if use_rfft:
+            surface = np.fft.irfft2(spectrum, s=shape)
+        else:
+            surface = np.fft.ifft2(spectrum).real
 
-        return itemp.real / itemp.real.max()
+        surface -= surface.min()
+        surface /= surface.max()
+        return surface.astype(dtype, copy=False)
 
     def create_topo_array(self):
         """for masking the lith block"""
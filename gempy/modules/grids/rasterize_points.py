@@ -0,0 +1,98 @@
+from typing import Literal, Optional, Sequence, Union
+
+import numpy as np
+
+from ...optional_dependencies import require_scipy
+
+
+def rasterize_points(xyz: np.ndarray, extent: Sequence[float], resolution: Optional[Sequence[int]] = None,
+                     spacing: Union[float, Sequence[float], None] = None,
+                     method: Literal["nearest", "linear", "idw"] = "nearest", n_neighbors: int = 8,
+                     power: float = 2.0, chunk_size: int = 2 ** 20) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Interpolate scattered XYZ points, e.g. a LiDAR point cloud or mesh vertices, onto a regular raster of heights.
+
+    The raster nodes are generated and interpolated `chunk_size` at a time, so only the points and the output raster
+    are held in memory. Nearest and inverse distance weighted queries use a KD-tree on all cores.
+
+    Args:
+        xyz (np.ndarray): (n, 3) points.
+        extent (Sequence[float]): [x_min, x_max, y_min, y_max] of the raster. The nodes include the edges.
+        resolution (Optional[Sequence[int]]): Number of nodes in X and Y.
+        spacing (Union[float, Sequence[float], None]): Distance between nodes, used if `resolution` is None. The
+            nodes start at the minimum of the extent.
+        method (str): "nearest" takes the closest point, "linear" interpolates in the Delaunay triangulation of the
+            points, falling back to the closest point outside their convex hull, and "idw" weights the
+            `n_neighbors` closest points by the inverse of their distance to the power `power`.
+        n_neighbors (int): Number of points of the inverse distance weighting.
+        power (float): Power of the inverse distance weighting.
+        chunk_size (int): Number of raster nodes interpolated at once.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Heights indexed as [x, y], origin and spacing of the nodes.
+    """
+    if method not in ("nearest", "linear", "idw"):
+        raise ValueError(f"Unknown interpolation method {method}. Use 'nearest', 'linear' or 'idw'.")
+
+    extent = np.asarray(extent[:4], dtype="float64")
+    lengths = extent[1::2] - extent[0::2]
+    if resolution is not None:
+        resolution = np.asarray(resolution[:2], dtype=int)
+        spacing = np.divide(lengths, np.maximum(resolution - 1, 1))
+    elif spacing is not None:
+        spacing = np.broadcast_to(np.asarray(spacing, dtype="float64"), (2,))
+        resolution = np.floor(lengths / spacing + 1e-9).astype(int) + 1
+    else:
+        raise ValueError("Either resolution or spacing is required.")
+
+    scipy = require_scipy()
+    xy, values = xyz[:, :2], xyz[:, 2]
+    tree = scipy.spatial.cKDTree(xy, balanced_tree=False, compact_nodes=False)
+    triangulation = scipy.spatial.Delaunay(xy) if method == "linear" else None
+
+    origin = extent[0::2]
+    z = np.empty(tuple(resolution), dtype="float64")
+    z_flat = z.reshape(-1)
+    for start in range(0, z.size, chunk_size):
+        stop = min(start + chunk_size, z.size)
+        x_index, y_index = np.unravel_index(np.arange(start, stop), z.shape)
+        nodes = np.stack([origin[0] + spacing[0] * x_index, origin[1] + spacing[1] * y_index], axis=1)
+
+        if method == "idw":
+            z_flat[start:stop] = _inverse_distance(tree, values, nodes, n_neighbors, power)
+            continue
+
+        _, closest = tree.query(nodes, k=1, workers=-1)
+        z_flat[start:stop] = values[closest]
+        if method == "linear":
+            inside = _linear(triangulation, values, nodes)
+            z_flat[start:stop][~np.isnan(inside)] = inside[~np.isnan(inside)]
+
+    return z, origin, np.asarray(spacing, dtype="float64")
+
+
+def _inverse_distance(tree, values: np.ndarray, nodes: np.ndarray, n_neighbors: int, power: float) -> np.ndarray:
+    n_neighbors = min(n_neighbors, len(values))
+    distances, neighbors = tree.query(nodes, k=n_neighbors, workers=-1)
+    distances, neighbors = distances.reshape(len(nodes), -1), neighbors.reshape(len(nodes), -1)
+
+    with np.errstate(divide="ignore"):
+        weights = distances ** -power
+    # * A node on top of a point takes its value
+    exact = np.isinf(weights)
+    weights = np.where(exact.any(axis=1, keepdims=True), exact.astype(float), weights)
+    return np.sum(weights * values[neighbors], axis=1) / np.sum(weights, axis=1)
+
+
+def _linear(triangulation, values: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Barycentric interpolation in the triangles containing the nodes, NaN outside the convex hull."""
+    simplices = triangulation.find_simplex(nodes)
+    inside = simplices >= 0
+
+    transforms = triangulation.transform[simplices[inside]]
+    barycentric = np.einsum("nij,nj->ni", transforms[:, :2], nodes[inside] - transforms[:, 2])
+    weights = np.column_stack([barycentric, 1 - barycentric.sum(axis=1)])
+
+    result = np.full(len(nodes), np.nan)
+    result[inside] = np.sum(weights * values[triangulation.simplices[simplices[inside]]], axis=1)
+    return result
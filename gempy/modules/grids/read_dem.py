@@ -0,0 +1,93 @@
+import os
+import tempfile
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ...optional_dependencies import require_rasterio
+
+
+def read_dem(path: str, crop_to_extent: Optional[Sequence[float]] = None, origin: Optional[Sequence[float]] = None,
+             spacing: Optional[Sequence[float]] = None, block_rows: int = 1024,
+             cache_dir: Optional[str] = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Open a DEM as a memory-mapped array of heights without reading the whole raster.
+
+    ``.npy`` files are memory-mapped directly. Any other file is read with rasterio: only the window covering
+    `crop_to_extent` is read, `block_rows` raster rows at a time, into a temporary memory-mapped file.
+
+    Args:
+        path (str): Path of the raster.
+        crop_to_extent (Optional[Sequence[float]]): [x_min, x_max, y_min, y_max]. Pixels outside the extent, apart
+            from a one pixel margin for interpolation, are not read. If None, the whole raster is used.
+        origin (Optional[Sequence[float]]): X and Y of the center of the first pixel of a ``.npy`` file.
+        spacing (Optional[Sequence[float]]): Pixel size in X and Y of a ``.npy`` file.
+        block_rows (int): Number of raster rows read at once by rasterio.
+        cache_dir (Optional[str]): Directory of the temporary file holding the cropped raster. Defaults to the
+            system temporary directory.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Heights indexed as [x, y] with both axes increasing, origin and
+        spacing of the pixel centers.
+    """
+    if os.path.splitext(path)[1].lower() == ".npy":
+        if origin is None or spacing is None:
+            raise ValueError("A .npy DEM has no georeference: origin and spacing are required.")
+        z = np.load(path, mmap_mode="r")
+        origin, spacing = np.asarray(origin, dtype="float64"), np.asarray(spacing, dtype="float64")
+        if crop_to_extent is None:
+            return z, origin, spacing
+
+        # * Slicing a memory map is a view, nothing is read here
+        window = _crop_window(z.shape, origin, spacing, crop_to_extent)
+        return z[window], origin + spacing * [window[0].start, window[1].start], spacing
+
+    return _read_raster(path, crop_to_extent, block_rows, cache_dir)
+
+
+def _crop_window(shape: tuple, origin: np.ndarray, spacing: np.ndarray, extent: Sequence[float]) -> tuple[slice, slice]:
+    window = []
+    for axis in range(2):
+        start = int(np.floor((extent[2 * axis] - origin[axis]) / spacing[axis]))
+        stop = int(np.ceil((extent[2 * axis + 1] - origin[axis]) / spacing[axis])) + 1
+        window.append(slice(min(max(start, 0), shape[axis] - 1), min(max(stop, 1), shape[axis])))
+    return tuple(window)
+
+
+def _read_raster(path: str, crop_to_extent: Optional[Sequence[float]], block_rows: int,
+                 cache_dir: Optional[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rasterio = require_rasterio()
+
+    with rasterio.open(path) as dataset:
+        transform = dataset.transform
+        if transform.b != 0 or transform.d != 0 or transform.e >= 0:
+            raise ValueError("Only north-up rasters without rotation are supported as topography.")
+
+        if crop_to_extent is None:
+            window = rasterio.windows.Window(0, 0, dataset.width, dataset.height)
+        else:
+            window = rasterio.windows.from_bounds(
+                crop_to_extent[0], crop_to_extent[2], crop_to_extent[1], crop_to_extent[3],
+                transform=transform
+            )
+            # * One pixel of margin so the pixel centers bracket the extent
+            window = window.round_offsets("floor").round_lengths("ceil")
+            window = rasterio.windows.Window(window.col_off - 1, window.row_off - 1, window.width + 2, window.height + 2)
+            window = window.intersection(rasterio.windows.Window(0, 0, dataset.width, dataset.height))
+
+        col_off, row_off = int(window.col_off), int(window.row_off)
+        width, height = int(window.width), int(window.height)
+
+        # * The raster is stored row by row from north to south, heights are indexed [x, y] from south to north
+        z = np.memmap(tempfile.TemporaryFile(dir=cache_dir), dtype="float32", mode="w+", shape=(width, height))
+        for start in range(0, height, block_rows):
+            n_rows = min(block_rows, height - start)
+            block = dataset.read(1, window=rasterio.windows.Window(col_off, row_off + start, width, n_rows), masked=True)
+            z[:, height - start - n_rows:height - start] = block.astype("float32").filled(np.nan)[::-1].T
+
+        pixel_width, pixel_height = transform.a, -transform.e
+        origin = np.array([
+            transform.c + pixel_width * (col_off + 0.5),
+            transform.f - pixel_height * (row_off + height - 0.5)
+        ])
+    return z, origin, np.array([pixel_width, pixel_height])
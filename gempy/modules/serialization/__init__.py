@@ -0,0 +1,3 @@
+from .binary_model_file import save_model, load_model
+
+__all__ = ['save_model', 'load_model']
@@ -0,0 +1,262 @@
+import base64
+import enum
+import importlib
+import json
+import os
+import struct
+import tempfile
+from typing import Any
+
+import numpy as np
+
+from ...core.data.geo_model import GeoModel
+
+# * Layout: magic, format version, header size, JSON header, then every array as a raw block aligned to `_ALIGNMENT`
+_MAGIC = b"GEMPYMDL"
+_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sIQ")
+_ALIGNMENT = 64
+
+#: Packages whose classes can be rebuilt on load. Anything else in the header is rejected.
+_ALLOWED_PACKAGES = ("gempy", "gempy_engine", "numpy")
+
+def save_model(geo_model: GeoModel, path: str) -> None:
+    """
+    Save a GeoModel to a versioned binary file.
+
+    The file holds a JSON header describing the model (structural frame, groups, elements, grid, options, transforms
+    and solutions) followed by every array as a raw, aligned block, so the arrays can be memory-mapped on load.
+    Caches and the legacy model are not written: every class holding them leaves them out of its `__getstate__`, as
+    it does for pickle.
+
+    Args:
+        geo_model (GeoModel): The model to save.
+        path (str): Path of the file. An existing file is replaced atomically.
+    """
+    arrays: list[np.ndarray] = []
+    root = _Encoder(arrays).encode(geo_model)
+
+    blocks = []
+    offset = 0
+    for array in arrays:
+        offset = _aligned(offset)
+        blocks.append({
+                "offset": offset,
+                "dtype" : np.lib.format.dtype_to_descr(array.dtype),
+                "shape" : list(array.shape)
+        })
+        offset += array.nbytes
+
+    header = json.dumps({
+            "format_version": _FORMAT_VERSION,
+            "blocks"        : blocks,
+            "root"          : root
+    }).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(header)))
+            file.write(header)
+            for array, block in zip(arrays, blocks):
+                file.seek(data_start + block["offset"])
+                file.write(np.ascontiguousarray(array).tobytes())
+            file.truncate(data_start + offset)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_model(path: str, mmap: bool = True) -> GeoModel:
+    """
+    Load a GeoModel saved with :func:`save_model`.
+
+    Args:
+        path (str): Path of the file.
+        mmap (bool): If True, arrays are memory-mapped copy-on-write and only read from disk when accessed, so opening
+            a large solved model does not depend on its size. Modifying them never changes the file. If False,
+            every array is read into memory.
+
+    Raises:
+        ValueError: If the file is not a GemPy model file or was written by a newer format version.
+
+    Returns:
+        GeoModel: The loaded model. Caches start empty.
+    """
+    with open(path, "rb") as file:
+        magic, version, header_size = _PREAMBLE.unpack(file.read(_PREAMBLE.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a GemPy model file.")
+        if version > _FORMAT_VERSION:
+            raise ValueError(f"{path} has format version {version}, this version of GemPy reads up to {_FORMAT_VERSION}.")
+        header = json.loads(file.read(header_size).decode("utf-8"))
+
+    data_start = _aligned(_PREAMBLE.size + header_size)
+    arrays = [_read_block(path, data_start + block["offset"], block, mmap) for block in header["blocks"]]
+    return _Decoder(arrays).decode(header["root"])
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _read_block(path: str, offset: int, block: dict, mmap: bool) -> np.ndarray:
+    dtype = np.lib.format.descr_to_dtype(_as_descr(block["dtype"]))
+    shape = tuple(block["shape"])
+    count = int(np.prod(shape))
+    if count == 0:
+        return np.empty(shape, dtype=dtype)
+    if mmap:
+        return np.memmap(path, dtype=dtype, mode="c", offset=offset, shape=shape)
+    return np.fromfile(path, dtype=dtype, count=count, offset=offset).reshape(shape)
+
+
+def _as_descr(descr: Any) -> Any:
+    # * JSON turns the tuples of structured dtype descriptions into lists
+    if not isinstance(descr, list):
+        return descr
+    fields = []
+    for name, field_descr, *shape in descr:
+        fields.append((name, _as_descr(field_descr), *(tuple(item) for item in shape)))
+    return fields
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_class(path: str) -> type:
+    module_name, qualname = path.split(":")
+    if module_name.split(".")[0] not in _ALLOWED_PACKAGES:
+        raise ValueError(f"Class {path} is not allowed in a GemPy model file.")
+    value = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def _object_state(value: Any) -> dict[str, Any]:
+    getstate = getattr(type(value), "__getstate__", None)
+    if getstate is not None and getstate is not getattr(object, "__getstate__", None):
+        state = value.__getstate__()
+        if not isinstance(state, dict):
+            raise TypeError(f"Objects of type {_class_path(type(value))} cannot be saved in a GemPy model file.")
+        return state
+
+    state = dict(getattr(value, "__dict__", {}))
+    for cls in type(value).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if name not in state and hasattr(value, name):
+                state[name] = getattr(value, name)
+    return state
+
+
+class _Encoder:
+    """Turns an object graph into JSON nodes, moving arrays out to `arrays`. Shared objects are written once."""
+
+    def __init__(self, arrays: list[np.ndarray]):
+        self.arrays = arrays
+        self.memo: dict[int, int] = {}
+        self._alive: list = []  # * Keeps encoded objects alive so their ids are not reused
+
+    def encode(self, value: Any) -> Any:
+        if value is None or type(value) in (bool, int, float, str):
+            return value
+        if isinstance(value, enum.Enum):
+            # * Flags are combined by value, any other member is referenced by name since values can be functions
+            member = int(value.value) if isinstance(value, enum.Flag) else value.name
+            return {"__enum__": _class_path(type(value)), "member": member}
+        if isinstance(value, np.generic):
+            return {"__scalar__": np.lib.format.dtype_to_descr(value.dtype), "value": value.item()}
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                return {"__object_array__": [self.encode(item) for item in value.ravel()], "shape": list(value.shape)}
+            self.arrays.append(np.asarray(value))
+            return {"__array__": len(self.arrays) - 1}
+        if isinstance(value, bytes):
+            return {"__bytes__": base64.b64encode(value).decode("ascii")}
+        if isinstance(value, slice):
+            return {"__slice__": [self.encode(value.start), self.encode(value.stop), self.encode(value.step)]}
+        if isinstance(value, (list, tuple, set)):
+            key = {list: "__list__", tuple: "__tuple__", set: "__set__"}[type(value)]
+            return {key: [self.encode(item) for item in value]}
+        if isinstance(value, dict):
+            return {"__dict__": [[self.encode(key), self.encode(item)] for key, item in value.items()]}
+        if type(value).__name__ == "DataFrame":
+            return {"__dataframe__": self.encode(value.to_dict(orient="split"))}
+        return self._encode_object(value)
+
+    def _encode_object(self, value: Any) -> dict:
+        if id(value) in self.memo:
+            return {"__ref__": self.memo[id(value)]}
+
+        cls = type(value)
+        if cls.__module__.split(".")[0] not in _ALLOWED_PACKAGES or callable(value):
+            raise TypeError(f"Objects of type {_class_path(cls)} cannot be saved in a GemPy model file.")
+
+        self.memo[id(value)] = len(self.memo)
+        self._alive.append(value)
+        state = {name: self.encode(item) for name, item in _object_state(value).items()}
+        return {"__object__": _class_path(cls), "id": self.memo[id(value)], "state": state}
+
+
+class _Decoder:
+    """Inverse of `_Encoder`. Objects are rebuilt without calling `__init__`, their `__setstate__` restores the caches."""
+
+    def __init__(self, arrays: list[np.ndarray]):
+        self.arrays = arrays
+        self.memo: dict[int, Any] = {}
+
+    def decode(self, node: Any) -> Any:
+        if not isinstance(node, dict):
+            return node
+        if "__array__" in node:
+            return self.arrays[node["__array__"]]
+        if "__object__" in node:
+            return self._decode_object(node)
+        if "__ref__" in node:
+            return self.memo[node["__ref__"]]
+        if "__enum__" in node:
+            enum_class = _import_class(node["__enum__"])
+            member = node["member"]
+            return enum_class(member) if isinstance(member, int) else enum_class[member]
+        if "__scalar__" in node:
+            return np.dtype(node["__scalar__"]).type(node["value"])
+        if "__list__" in node:
+            return [self.decode(item) for item in node["__list__"]]
+        if "__tuple__" in node:
+            return tuple(self.decode(item) for item in node["__tuple__"])
+        if "__set__" in node:
+            return {self.decode(item) for item in node["__set__"]}
+        if "__dict__" in node:
+            return {self.decode(key): self.decode(item) for key, item in node["__dict__"]}
+        if "__object_array__" in node:
+            array = np.empty(len(node["__object_array__"]), dtype=object)
+            for i, item in enumerate(node["__object_array__"]):
+                array[i] = self.decode(item)
+            return array.reshape(node["shape"])
+        if "__bytes__" in node:
+            return base64.b64decode(node["__bytes__"])
+        if "__slice__" in node:
+            return slice(*(self.decode(item) for item in node["__slice__"]))
+        if "__dataframe__" in node:
+            from ...optional_dependencies import require_pandas
+            return require_pandas().DataFrame(**self.decode(node["__dataframe__"]))
+        raise ValueError(f"Unknown node in GemPy model file: {sorted(node)}")
+
+    def _decode_object(self, node: dict) -> Any:
+        cls = _import_class(node["__object__"])
+        value = cls.__new__(cls)
+        self.memo[node["id"]] = value  # * Registered before the state so cycles resolve to this object
+
+        state = {name: self.decode(item) for name, item in node["state"].items()}
+        if hasattr(value, "__setstate__"):
+            value.__setstate__(state)
+        else:
+            for name, item in state.items():
+                object.__setattr__(value, name, item)
+        return value
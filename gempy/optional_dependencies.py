@@ -58,4 +58,22 @@ def require_subsurface():
         import subsurface
     except ImportError:
         raise ImportError("The subsurface package is required to run this function.")
-    return subsurface
\ No newline at end of file
+    return subsurface
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("The pyarrow package is required to read Parquet files.")
+    return pyarrow
+
+
+def require_rasterio():
+    try:
+        import rasterio
+        import rasterio.windows
+    except ImportError:
+        raise ImportError("The rasterio package is required to read raster files.")
+    return rasterio
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+
+
+def test_compute_model_batch_matches_sequential():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    n_points = geo_model.structural_frame.surface_points_copy.xyz.shape[0]
+
+    realizations = np.zeros((2, n_points, 3))
+    realizations[1, :, 2] = 50
+
+    original_xyz = geo_model.structural_frame.surface_points_copy.xyz
+    solutions = gp.compute_model_batch(geo_model, realizations)
+    assert len(solutions) == 2
+    np.testing.assert_array_equal(geo_model.structural_frame.surface_points_copy.xyz, original_xyz)
+
+    reference = gp.compute_model(geo_model)
+    np.testing.assert_allclose(solutions[0].raw_arrays.lith_block, reference.raw_arrays.lith_block)
+
+    gp.modify_surface_points(geo_model, slice=None, Z=original_xyz[:, 2] + 50)
+    perturbed = gp.compute_model(geo_model)
+    np.testing.assert_allclose(solutions[1].raw_arrays.lith_block, perturbed.raw_arrays.lith_block)
+
+
+def test_compute_model_batch_validates_shape():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    with pytest.raises(ValueError):
+        gp.compute_model_batch(geo_model, np.zeros((2, 3, 3)))
+
+
+def test_compute_model_batch_solves_every_realization():
+    # * More surface points than numpy prints in full, with only one point in the middle perturbed
+    geo_model: gp.data.GeoModel = _dense_anticline()
+    n_points = geo_model.structural_frame.surface_points_copy.xyz.shape[0]
+    assert n_points > 333
+
+    realizations = np.zeros((3, n_points, 3))
+    realizations[1, n_points // 2, 2] = 300
+    realizations[2, n_points // 2, 2] = -300
+    solutions = gp.compute_model_batch(geo_model, realizations)
+
+    fields = [solution.raw_arrays.scalar_field_matrix for solution in solutions]
+    assert not np.allclose(fields[1], fields[0])
+    assert not np.allclose(fields[2], fields[1])
+
+    original_z = geo_model.structural_frame.surface_points_copy.xyz[:, 2]
+    geo_model.interpolation_options.cache_mode = geo_model.interpolation_options.CacheMode.NO_CACHE
+    for i, field in enumerate(fields):
+        gp.modify_surface_points(geo_model, slice=n_points // 2, Z=original_z[n_points // 2] + realizations[i, n_points // 2, 2])
+        reference = gp.compute_model(geo_model)
+        np.testing.assert_allclose(field, reference.raw_arrays.scalar_field_matrix, atol=1e-6)
+
+
+def _dense_anticline() -> gp.data.GeoModel:
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    geo_model.interpolation_options.mesh_extraction = False
+    geo_model.interpolation_options.number_octree_levels = 3
+
+    element = geo_model.structural_frame.structural_groups[0].elements[0]
+    rng = np.random.default_rng(0)
+    xyz = element.surface_points.xyz
+    new_xyz = xyz[rng.integers(0, len(xyz), 600)] + rng.uniform(-40, 40, (600, 3)) * [1, 1, 0.1]
+    gp.add_surface_points(
+        geo_model=geo_model,
+        x=new_xyz[:, 0],
+        y=new_xyz[:, 1],
+        z=new_xyz[:, 2],
+        elements_names=[element.name] * 600
+    )
+    return geo_model
@@ -0,0 +1,42 @@
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.core.data.grid_modules import RegularGrid
+
+
+def test_compute_model_chunked_matches_compute_model(tmp_path):
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    geo_model.interpolation_options.mesh_extraction = False
+    geo_model.grid.dense_grid = RegularGrid(geo_model.grid.extent, np.array([20, 10, 15]))
+    geo_model.grid.active_grids = gp.data.Grid.GridTypes.DENSE
+
+    reference = gp.compute_model(geo_model).raw_arrays
+    chunked = gp.compute_model_chunked(geo_model, chunk_size=777, memmap_dir=str(tmp_path))
+
+    assert isinstance(chunked.lith_block, np.memmap)
+    assert (tmp_path / "lith_block.npy").exists()
+    np.testing.assert_array_equal(chunked.lith_block, reference.lith_block)
+    np.testing.assert_allclose(chunked.scalar_field_matrix, reference.scalar_field_matrix, atol=1e-4)
+
+
+def test_dense_grid_chunks_are_lazy_views_of_values():
+    regular_grid = RegularGrid(np.array([0, 10, 0, 20, 0, 5.]), np.array([3, 4, 5]))
+    chunks = list(regular_grid.iter_values(chunk_size=7))
+
+    assert chunks[0][0] == slice(0, 7)
+    assert max(c[1].shape[0] for c in chunks) == 7
+    np.testing.assert_array_equal(np.concatenate([c[1] for c in chunks]), regular_grid.values)
+
+
+def test_compute_model_chunked_does_not_build_the_dense_grid():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    geo_model.grid.dense_grid = RegularGrid(geo_model.grid.extent, np.array([20, 10, 15]))
+    geo_model.grid.active_grids = gp.data.Grid.GridTypes.DENSE
+
+    gp.compute_model_chunked(geo_model, chunk_size=500)
+
+    # * Only the chunks are generated, neither the cell centers nor the engine grid of the model exist
+    assert geo_model.grid.dense_grid._values is None
+    assert geo_model.interpolation_input_cache.grid is None
+    assert geo_model.grid.dense_grid.values.shape == (20 * 10 * 15, 3)
@@ -0,0 +1,45 @@
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy_engine.API.interp_single import _interp_scalar_field
+
+
+def _count_solves(monkeypatch) -> list:
+    calls = []
+    solve = _interp_scalar_field._solve_interpolation
+
+    def _counting_solve(*args, **kwargs):
+        calls.append(1)
+        return solve(*args, **kwargs)
+
+    monkeypatch.setattr(_interp_scalar_field, "_solve_interpolation", _counting_solve)
+    return calls
+
+
+def test_evaluate_on_grid_reuses_weights(monkeypatch):
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    gp.compute_model(geo_model)
+    assert set(geo_model.kriging_weights_cache.entries) == {g.name for g in geo_model.structural_frame.structural_groups}
+
+    new_grid = gp.data.Grid(extent=geo_model.grid.extent, resolution=np.array([4, 4, 4]))
+    calls = _count_solves(monkeypatch)
+    solutions = gp.evaluate_on_grid(geo_model, new_grid)
+    assert calls == []
+
+    lith_block = solutions.raw_arrays.lith_block
+    assert lith_block.shape == (64,)
+
+    geo_model.grid = new_grid
+    reference = gp.compute_model(geo_model)
+    np.testing.assert_array_equal(lith_block, reference.raw_arrays.lith_block)
+
+
+def test_changed_group_is_solved_again(monkeypatch):
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    gp.compute_model(geo_model)
+
+    calls = _count_solves(monkeypatch)
+    gp.modify_surface_points(geo_model, slice=0, Z=800)
+    gp.compute_model(geo_model)
+    assert len(calls) == 1
@@ -0,0 +1,40 @@
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.core.data.gempy_engine_config import GemPyEngineConfig
+
+
+def test_unchanged_groups_reuse_their_scalar_field():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ONE_FAULT, compute_model=False)
+    geo_model.interpolation_options.evaluation_options.number_octree_levels = 3
+    engine_config = GemPyEngineConfig(reuse_scalar_fields=True)
+
+    # * Opt-in: the fields are not kept by default
+    gp.compute_model(geo_model)
+    assert geo_model.scalar_field_cache.entries == {}
+
+    # * The engine only keeps the scalar field gradients enabled from the second call on
+    for _ in range(3):
+        gp.compute_model(geo_model, engine_config=engine_config)
+    n_calls = len(geo_model.scalar_field_cache.entries)
+    assert geo_model.scalar_field_cache.n_reused_groups == n_calls  # * Nothing changed: every group is reused
+    assert geo_model.scalar_field_cache.n_evaluated_points == 0
+
+    # * Moving a point of the youngest series does not touch the fault
+    fault_group, strat_group = geo_model.structural_frame.structural_groups
+    element = strat_group.elements[0]
+    surface_points = geo_model.surface_points_copy
+    index = int(np.flatnonzero(surface_points.data['id'] == element.id)[0])
+    gp.modify_surface_points(geo_model, slice=index, Z=surface_points.data['Z'][index] + 20)
+
+    solutions = gp.compute_model(geo_model, engine_config=engine_config)
+    n_fault_calls = sum(name == fault_group.name for name, _ in geo_model.scalar_field_cache.entries)
+    assert geo_model.scalar_field_cache.n_reused_groups == n_fault_calls
+    scalar_field = solutions.raw_arrays.scalar_field_matrix.copy()
+    lith_block = solutions.raw_arrays.lith_block.copy()
+
+    geo_model.scalar_field_cache.clear()
+    full_solutions = gp.compute_model(geo_model)
+    np.testing.assert_allclose(scalar_field, full_solutions.raw_arrays.scalar_field_matrix, atol=1e-10)
+    np.testing.assert_array_equal(lith_block, full_solutions.raw_arrays.lith_block)
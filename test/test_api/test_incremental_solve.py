@@ -0,0 +1,49 @@
+import threading
+
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.core.data.gempy_engine_config import GemPyEngineConfig
+from gempy.modules.data_manipulation.engine_hooks import EngineHooks, engine_hooks, _active_hooks
+
+
+def test_incremental_solve_matches_full_solve():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    engine_config = GemPyEngineConfig(incremental_solve=True)
+
+    gp.compute_model(geo_model, engine_config=engine_config)
+    assert _active_hooks.get() is None
+    n_full_solves = geo_model.incremental_solver.n_full_solves
+    assert n_full_solves > 0
+
+    # * Add, move and delete a few points
+    element = geo_model.structural_frame.structural_groups[0].elements[0]
+    x, y, z = element.surface_points.xyz[0]
+    gp.add_surface_points(geo_model, x=[x + 50], y=[y + 30], z=[z + 5], elements_names=[element.name])
+    gp.modify_surface_points(geo_model, slice=2, Z=geo_model.surface_points_copy.data['Z'][2] + 3)
+    gp.delete_surface_points(geo_model, indices=5)
+
+    solutions = gp.compute_model(geo_model, engine_config=engine_config)
+    assert geo_model.incremental_solver.n_updated_solves > 0
+    assert geo_model.incremental_solver.n_full_solves == n_full_solves
+    scalar_field = solutions.raw_arrays.scalar_field_matrix.copy()
+
+    geo_model.kriging_weights_cache.clear()
+    full_solutions = gp.compute_model(geo_model)
+    np.testing.assert_allclose(scalar_field, full_solutions.raw_arrays.scalar_field_matrix, atol=1e-8)
+
+
+def test_engine_hooks_are_local_to_the_thread():
+    hooks = EngineHooks(solve=lambda interp_input, kernel_options, engine_solve: engine_solve(interp_input, kernel_options))
+    hooks_in_thread = []
+
+    with engine_hooks(hooks):
+        thread = threading.Thread(target=lambda: hooks_in_thread.append(_active_hooks.get()))
+        thread.start()
+        thread.join()
+        assert _active_hooks.get() is hooks
+
+    # * An engine call running in another thread goes straight to the engine
+    assert hooks_in_thread == [None]
+    assert _active_hooks.get() is None
@@ -0,0 +1,55 @@
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.modules.data_manipulation.engine_factory import interpolation_input_from_structural_frame
+
+
+def test_cache_reuses_unchanged_components():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    cache = geo_model.interpolation_input_cache
+
+    first = cache.get_interpolation_input(geo_model)
+    second = cache.get_interpolation_input(geo_model)
+
+    assert second.surface_points is first.surface_points
+    assert second.orientations is first.orientations
+    assert second.grid is first.grid
+    assert geo_model.input_data_descriptor is geo_model.input_data_descriptor
+
+    fresh = interpolation_input_from_structural_frame(geo_model)
+    np.testing.assert_array_equal(second.surface_points.sp_coords, fresh.surface_points.sp_coords)
+    np.testing.assert_array_equal(second.orientations.dip_gradients, fresh.orientations.dip_gradients)
+    np.testing.assert_array_equal(second.grid.values, fresh.grid.values)
+
+
+def test_cache_rebuilds_changed_components():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    cache = geo_model.interpolation_input_cache
+    first = cache.get_interpolation_input(geo_model)
+
+    gp.modify_surface_points(geo_model, slice=0, Z=800)
+    after_points = cache.get_interpolation_input(geo_model)
+    assert after_points.surface_points is not first.surface_points
+    assert after_points.orientations is first.orientations
+    assert after_points.grid is first.grid
+    np.testing.assert_array_equal(
+        after_points.surface_points.sp_coords,
+        interpolation_input_from_structural_frame(geo_model).surface_points.sp_coords
+    )
+
+    gp.set_custom_grid(geo_model.grid, xyz_coord=np.array([[500, 500, 500]]))
+    after_grid = cache.get_interpolation_input(geo_model)
+    assert after_grid.grid is not first.grid
+    assert after_grid.surface_points is after_points.surface_points
+
+    geo_model.input_transform = gp.data.Transform.init_neutral()
+    after_transform = cache.get_interpolation_input(geo_model)
+    assert after_transform.surface_points is not after_grid.surface_points
+    assert after_transform.orientations is not after_grid.orientations
+    assert after_transform.grid is not after_grid.grid
+
+    geo_model.structural_frame.is_dirty = True
+    after_dirty = cache.get_interpolation_input(geo_model)
+    assert after_dirty.surface_points is not after_transform.surface_points
+    assert geo_model.structural_frame.is_dirty is False
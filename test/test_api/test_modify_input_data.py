@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from gempy import generate_example_model
 from gempy.core.data.enumerators import ExampleModel
 import gempy_viewer as gp_viewer
@@ -49,3 +52,77 @@ def test_modify_surface_point_by_global_index():
         show_boundaries=False,  # TODO: Fix boundaries
     )
 
+
+def test_add_points_with_interleaved_element_names():
+    model = generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    names = [element.name for element in model.structural_frame.structural_groups[0].elements]
+    n_points = {name: model.structural_frame.get_element_by_name(name).number_of_points for name in names}
+
+    gp.add_surface_points(
+        geo_model=model,
+        x=[1., 2., 3., 4.],
+        y=[0., 0., 0., 0.],
+        z=[10., 20., 30., 40.],
+        elements_names=[names[1], names[0], names[1], names[0]]
+    )
+    gp.add_orientations(
+        geo_model=model,
+        x=[1., 2.],
+        y=[0., 0.],
+        z=[10., 20.],
+        elements_names=[names[1], names[0]],
+        pole_vector=[[0., 0., 1.], [1., 0., 0.]]
+    )
+
+    first, second = (model.structural_frame.get_element_by_name(name) for name in names[:2])
+    assert first.number_of_points == n_points[names[0]] + 2
+    assert second.number_of_points == n_points[names[1]] + 2
+    assert first.surface_points.data['Z'][-2:].tolist() == [20., 40.]  # * Input order is kept within an element
+    assert second.surface_points.data['Z'][-2:].tolist() == [10., 30.]
+    assert first.orientations.data['G_x'][-1] == 1.
+    assert second.orientations.data['G_z'][-1] == 1.
+
+
+def test_delete_points_by_index_name_and_region():
+    model = generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    structural_frame = model.structural_frame
+    first, second = structural_frame.structural_groups[0].elements[:2]
+
+    surface_points = model.surface_points_copy
+    n_points, n_first = len(surface_points), first.number_of_points
+    gp.delete_surface_points(model, indices=[0, n_points - 1])
+    assert len(model.surface_points_copy) == n_points - 2
+    assert first.number_of_points == n_first - 1
+    np.testing.assert_array_equal(first.surface_points.data, surface_points.data[1:n_first])
+
+    # * Criteria are combined: only the points of `second` inside the box go
+    xyz = second.surface_points.xyz
+    x_mid = np.median(xyz[:, 0])
+    extent = [xyz[:, 0].min(), x_mid, xyz[:, 1].min(), xyz[:, 1].max(), xyz[:, 2].min(), xyz[:, 2].max()]
+    n_inside = np.count_nonzero(xyz[:, 0] <= x_mid)
+    n_first = first.number_of_points
+    gp.delete_surface_points(model, elements_names=second.name, extent=extent)
+    assert np.all(second.surface_points.xyz[:, 0] > x_mid)
+    assert first.number_of_points == n_first
+    assert len(model.surface_points_copy) == n_points - 2 - n_inside
+
+    # * A polygon and a sphere containing every orientation
+    orientations_xyz = model.orientations_copy.xyz
+    x_min, y_min, _ = orientations_xyz.min(axis=0) - 1
+    x_max, y_max, _ = orientations_xyz.max(axis=0) + 1
+    gp.delete_orientations(model, polygon=[[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]], center=orientations_xyz[0], radius=1e-6)
+    assert len(model.orientations_copy) == len(orientations_xyz) - 1
+
+    with pytest.raises(ValueError):
+        gp.delete_surface_points(model)
+
+
+def test_delete_points_refreshes_cached_input():
+    model = generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    n_points = len(model.surface_points_copy)
+    interpolation_input = model.interpolation_input_cache.get_interpolation_input(model)
+    assert interpolation_input.surface_points.sp_coords.shape[0] == n_points
+
+    gp.delete_surface_points(model, center=model.surface_points_copy.xyz[0], radius=0.)
+    interpolation_input = model.interpolation_input_cache.get_interpolation_input(model)
+    assert interpolation_input.surface_points.sp_coords.shape[0] == n_points - 1
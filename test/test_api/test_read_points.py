@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from gempy.API.io_API import read_orientations, read_surface_points
+from gempy.core.data._data_points_helpers import structural_element_hasher
+
+
+def test_read_points_maps_names_in_bulk(tmp_path):
+    rng = np.random.default_rng(0)
+    n_points = 1000
+    names = rng.choice(["rock1", "rock2", "fault"], size=n_points)
+    xyz = rng.uniform(0, 1000, size=(n_points, 3))
+    azimuth, dip = rng.uniform(0, 360, n_points), rng.uniform(0, 90, n_points)
+
+    surface_points_file = tmp_path / "surface_points.csv"
+    surface_points_file.write_text("x,y,z,surface\n" + "".join(f"{x},{y},{z},{name}\n" for (x, y, z), name in zip(xyz, names)))
+    orientations_file = tmp_path / "orientations.csv"
+    orientations_file.write_text("X;Y;Z;Azimuth;Dip;Polarity;formation\n" + "".join(
+        f"{x};{y};{z};{a};{d};1;{name}\n" for (x, y, z), a, d, name in zip(xyz, azimuth, dip, names)
+    ))
+
+    surface_points = read_surface_points(str(surface_points_file))
+    np.testing.assert_allclose(surface_points.xyz, xyz)
+    expected_map = {name: structural_element_hasher(i, name) for i, name in enumerate(np.unique(names))}
+    assert surface_points.name_id_map == expected_map
+    np.testing.assert_array_equal(surface_points.data['id'], [expected_map[name] for name in names])
+
+    orientations = read_orientations(str(orientations_file), name_id_map=expected_map, pandas_kwargs={"sep": ";"})
+    np.testing.assert_array_equal(orientations.data['id'], surface_points.data['id'])
+    np.testing.assert_allclose(orientations.grads[:, 2], np.cos(np.deg2rad(dip)))
+
+
+def test_read_points_rejects_columns_with_the_same_standard_name(tmp_path):
+    surface_points_file = tmp_path / "surface_points.csv"
+    surface_points_file.write_text("X,x,Y,Z,formation\n0,1,2,3,rock1\n")
+
+    with pytest.raises(ValueError, match="'X' and 'x' both map to 'X'"):
+        read_surface_points(str(surface_points_file))
+
+
+def test_read_points_from_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.parquet")
+    rng = np.random.default_rng(0)
+    n_points = 100
+    names = rng.choice(["rock1", "rock2"], size=n_points)
+    xyz = rng.uniform(0, 1000, size=(n_points, 3))
+    azimuth, dip = rng.uniform(0, 360, n_points), rng.uniform(0, 90, n_points)
+
+    surface_points_file = str(tmp_path / "surface_points.parquet")
+    pa.parquet.write_table(pa.table({
+            "x"      : xyz[:, 0],
+            "y"      : xyz[:, 1],
+            "z"      : xyz[:, 2],
+            "surface": pa.array(names).dictionary_encode()
+    }), surface_points_file)
+    orientations_file = str(tmp_path / "orientations.pq")
+    pa.parquet.write_table(pa.table({
+            "X"        : xyz[:, 0],
+            "Y"        : xyz[:, 1],
+            "Z"        : xyz[:, 2],
+            "Azimuth"  : azimuth,
+            "Dip"      : dip,
+            "Polarity" : np.ones(n_points),
+            "formation": names
+    }), orientations_file)
+
+    surface_points = read_surface_points(surface_points_file)
+    np.testing.assert_allclose(surface_points.xyz, xyz)
+    expected_map = {name: structural_element_hasher(i, name) for i, name in enumerate(np.unique(names))}
+    assert surface_points.name_id_map == expected_map
+
+    orientations = read_orientations(orientations_file, name_id_map=expected_map)
+    np.testing.assert_array_equal(orientations.data['id'], surface_points.data['id'])
+    np.testing.assert_allclose(orientations.grads[:, 2], np.cos(np.deg2rad(dip)))
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+
+
+def test_save_and_load_solved_model(tmp_path):
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=True)
+    path = str(tmp_path / "anticline.gempy")
+    gp.save_model(geo_model, path)
+
+    loaded_model = gp.load_model(path)
+    assert isinstance(loaded_model.solutions.raw_arrays.lith_block, np.memmap)  # * Paged in on access
+    np.testing.assert_array_equal(loaded_model.solutions.raw_arrays.lith_block, geo_model.solutions.raw_arrays.lith_block)
+    np.testing.assert_array_equal(loaded_model.surface_points_copy.data, geo_model.surface_points_copy.data)
+    np.testing.assert_array_equal(loaded_model.orientations_copy.data, geo_model.orientations_copy.data)
+    np.testing.assert_array_equal(loaded_model.grid.values, geo_model.grid.values)
+    assert loaded_model.structural_frame.element_id_registry == geo_model.structural_frame.element_id_registry
+    assert loaded_model.interpolation_options.kernel_options == geo_model.interpolation_options.kernel_options
+    assert loaded_model.interpolation_options.evaluation_options == geo_model.interpolation_options.evaluation_options
+
+    # * The loaded model is a regular model: it can be modified and computed, the file is not touched
+    gp.modify_surface_points(loaded_model, slice=0, Z=loaded_model.surface_points_copy.data['Z'][0] + 10)
+    gp.compute_model(loaded_model)
+    in_memory_model = gp.load_model(path, mmap=False)
+    np.testing.assert_array_equal(in_memory_model.surface_points_copy.data, geo_model.surface_points_copy.data)
+
+
+def test_loaded_model_keeps_octree_outputs(tmp_path):
+    gpv = pytest.importorskip("gempy_viewer")
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=True)
+    path = str(tmp_path / "anticline.gempy")
+    gp.save_model(geo_model, path)
+
+    loaded_model = gp.load_model(path)
+    octrees_output = loaded_model.solutions.octrees_output
+    assert len(octrees_output) == len(geo_model.solutions.octrees_output)
+    np.testing.assert_array_equal(
+        octrees_output[0].last_output_center.scalar_fields.exported_fields.scalar_field,
+        geo_model.solutions.octrees_output[0].last_output_center.scalar_fields.exported_fields.scalar_field
+    )
+    assert loaded_model.solutions.dc_meshes[0].dc_data is not None
+
+    # * The viewer reads the scalar field of the first octree level
+    gpv.plot_2d(loaded_model, show_scalar=True, show=False)
+
+
+def test_load_model_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_model.gempy"
+    path.write_bytes(b"0" * 64)
+    with pytest.raises(ValueError):
+        gp.load_model(str(path))
@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.core.data.gempy_engine_config import GemPyEngineConfig
+from gempy.modules.data_manipulation.solutions_disk_cache import SolutionsDiskCache
+
+
+def test_identical_models_are_loaded_from_disk(tmp_path):
+    engine_config = GemPyEngineConfig(solutions_cache_dir=str(tmp_path))
+    solutions_cache = SolutionsDiskCache(directory=str(tmp_path))
+
+    geo_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    key = solutions_cache.key(geo_model)
+    solutions = gp.compute_model(geo_model, engine_config=engine_config)
+    assert os.path.exists(tmp_path / f"{key}.npz")
+
+    # * A model built from scratch with the same content, as after restarting the process
+    new_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    assert solutions_cache.key(new_model) == key
+    cached_solutions = solutions_cache.load(key)
+    assert solutions_cache.n_hits == 1
+
+    gp.compute_model(new_model, engine_config=engine_config)
+    assert not hasattr(new_model, "taped_interpolation_input")  # * Loaded, not computed
+    assert len(new_model.solutions.octrees_output) == len(solutions.octrees_output)
+    np.testing.assert_array_equal(
+        new_model.solutions.octrees_output[0].last_output_center.scalar_fields.exported_fields.scalar_field,
+        solutions.octrees_output[0].last_output_center.scalar_fields.exported_fields.scalar_field
+    )
+    np.testing.assert_array_equal(new_model.solutions.raw_arrays.lith_block, solutions.raw_arrays.lith_block)
+    np.testing.assert_array_equal(new_model.solutions.raw_arrays.scalar_field_matrix, solutions.raw_arrays.scalar_field_matrix)
+    np.testing.assert_array_equal(cached_solutions.dc_meshes[0].vertices, solutions.dc_meshes[0].vertices)
+    assert [element.name for element in new_model.structural_frame.structural_elements] == \
+           [element.name for element in geo_model.structural_frame.structural_elements]
+
+    # * Any change of the input is a different entry
+    gp.modify_surface_points(new_model, slice=0, Z=new_model.surface_points_copy.data['Z'][0] + 1)
+    assert solutions_cache.key(new_model) != key
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    geo_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=True)
+    solutions_cache = SolutionsDiskCache(directory=str(tmp_path))
+
+    for key in ("a", "b", "c"):
+        solutions_cache.store(key, geo_model.solutions)
+        os.utime(tmp_path / f"{key}.npz", (0, len(os.listdir(tmp_path))))  # * Deterministic recency
+    entry_size = os.path.getsize(tmp_path / "a.npz")
+
+    assert solutions_cache.load("a") is not None  # * "a" becomes the most recently used
+    solutions_cache.max_bytes = 2 * entry_size
+    assert solutions_cache.evict() == 1
+    assert sorted(os.listdir(tmp_path)) == ["a.npz", "c.npz"]
+
+    solutions_cache.clear()
+    assert solutions_cache.size_bytes == 0
+    assert solutions_cache.load("a") is None
@@ -0,0 +1,72 @@
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.core.data import SurfacePointsTable, OrientationsTable
+
+
+def test_point_table_coordinates_are_views():
+    surface_points = SurfacePointsTable.from_arrays(
+        x=np.array([0., 1.]),
+        y=np.array([2., 3.]),
+        z=np.array([4., 5.]),
+        names=["a", "b"]
+    )
+    xyz = surface_points.xyz
+    assert np.shares_memory(xyz, surface_points.data)
+    np.testing.assert_array_equal(xyz, [[0., 2., 4.], [1., 3., 5.]])
+
+    xyz[:, 2] += 10
+    np.testing.assert_array_equal(surface_points.data['Z'], [14., 15.])
+
+    orientations = OrientationsTable.from_arrays(
+        x=np.array([0.]), y=np.array([1.]), z=np.array([2.]),
+        G_x=np.array([0.]), G_y=np.array([0.]), G_z=np.array([1.]),
+        names=["a"]
+    )
+    assert np.shares_memory(orientations.grads, orientations.data)
+    orientations.grads_view = np.array([[1., 0., 0.]])
+    np.testing.assert_array_equal(orientations.data[['G_x', 'G_y', 'G_z']].tolist(), [(1., 0., 0.)])
+    np.testing.assert_array_equal(orientations.xyz, [[0., 1., 2.]])
+
+
+def test_frame_point_tables_share_one_buffer():
+    geo_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    structural_frame = geo_model.structural_frame
+
+    surface_points = structural_frame.surface_points_copy
+    offsets = structural_frame.surface_points_offsets
+    assert offsets[-1] == len(surface_points)
+
+    element = structural_frame.structural_elements[0]
+    np.testing.assert_array_equal(element.surface_points.data, surface_points.data[offsets[0]:offsets[1]])
+
+    # * Writing the frame table back goes straight into the element tables
+    surface_points.data['Z'] += 1
+    structural_frame.surface_points = surface_points
+    np.testing.assert_array_equal(element.surface_points.data['Z'], surface_points.data['Z'][offsets[0]:offsets[1]])
+
+    # * Replacing the data of an element is picked up on the next read
+    gp.add_surface_points(geo_model, x=[0.], y=[0.], z=[0.], elements_names=[element.name])
+    assert len(structural_frame.surface_points_copy) == len(surface_points) + 1
+    assert structural_frame.surface_points_offsets[1] == offsets[1] + 1
+
+
+def test_point_table_append_grows_geometrically():
+    surface_points = SurfacePointsTable.initialize_empty()
+    storages = []
+    for i in range(1000):
+        row, _ = SurfacePointsTable._data_from_arrays(np.array([i]), np.array([0.]), np.array([0.]), names="a")
+        surface_points.append(row)
+        if not storages or surface_points._storage is not storages[-1]:
+            storages.append(surface_points._storage)
+
+    assert len(surface_points) == 1000
+    assert len(storages) <= 8  # * Reallocated only when the capacity doubles
+    np.testing.assert_array_equal(surface_points.data['X'], np.arange(1000))
+
+    # * Appending after the data was replaced starts from the new data
+    surface_points.data = surface_points.data[:10].copy()
+    surface_points.append(row)
+    assert len(surface_points) == 11
+    assert surface_points.data['X'][-1] == 999
@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import gempy as gp
+from gempy.core.data import StructuralElement, SurfacePointsTable, OrientationsTable
+from gempy.core.data._data_points_helpers import structural_element_hasher
+from gempy.core.data.enumerators import ExampleModel
+
+
+def _new_element(name: str) -> StructuralElement:
+    return StructuralElement(
+        name=name,
+        surface_points=SurfacePointsTable.initialize_empty(),
+        orientations=OrientationsTable.initialize_empty(),
+        color="#015482"
+    )
+
+
+def test_structural_elements_are_cached_until_the_layout_changes():
+    geo_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    structural_frame = geo_model.structural_frame
+
+    elements = structural_frame.structural_elements
+    basement = elements[-1]
+    assert structural_frame.structural_elements[-1] is basement  # * The basement is not recreated on every access
+    np.testing.assert_array_equal(structural_frame.elements_ids, np.arange(len(elements)) + 1)
+
+    group = structural_frame.structural_groups[0]
+    new_element = _new_element("new_element")
+    group.append_element(new_element)
+    assert structural_frame.structural_elements[-2] is new_element
+    assert structural_frame.n_elements == len(elements) + 1
+
+    group.remove_element(new_element)
+    assert new_element not in structural_frame.structural_elements
+
+    # * Replacing the element list (e.g. when sorting by solution) is picked up as well
+    group.elements = group.elements[::-1]
+    assert structural_frame.structural_elements[:-1] == group.elements
+
+
+def test_structural_frame_lookups_follow_mutations():
+    geo_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    structural_frame = geo_model.structural_frame
+    group = structural_frame.structural_groups[0]
+    element = group.elements[0]
+
+    assert structural_frame.get_element_by_name(element.name) is element
+    assert structural_frame.get_element_by_id(element.id) is element
+    assert structural_frame.get_group_by_name(group.name) is group
+    assert structural_frame.get_group_by_element(element) is group
+
+    new_element = _new_element("new_element")
+    group.append_element(new_element)
+    assert structural_frame.get_element_by_name("new_element") is new_element
+    assert structural_frame.get_group_by_element(new_element) is group
+
+    # * Renaming does not change the layout, the stale entry is detected on lookup
+    new_element.name = "renamed_element"
+    assert structural_frame.get_element_by_name("renamed_element") is new_element
+    with pytest.raises(ValueError):
+        structural_frame.get_element_by_name("new_element")
+
+    gp.remove_element_by_name(geo_model, "renamed_element")
+    with pytest.raises(ValueError):
+        structural_frame.get_group_by_element(new_element)
+
+
+def test_element_ids_do_not_depend_on_the_process():
+    code = "from gempy.core.data._data_points_helpers import structural_element_hasher; print(structural_element_hasher(1, 'rock1'))"
+    ids = {
+        int(subprocess.run([sys.executable, "-c", code], env={**os.environ, "PYTHONHASHSEED": seed},
+                           capture_output=True, text=True, check=True).stdout.split()[-1])
+        for seed in ("1", "2")
+    }
+    assert ids == {structural_element_hasher(1, 'rock1')}
+
+
+def test_element_id_registry_detects_shared_ids():
+    geo_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    structural_frame = geo_model.structural_frame
+    registry = structural_frame.element_id_registry
+    assert registry == {element.id: element.name for element in structural_frame.structural_elements}
+
+    element = structural_frame.structural_groups[0].elements[0]
+    new_element = _new_element("new_element")
+    new_element._id = element.id
+    structural_frame.structural_groups[0].append_element(new_element)
+    with pytest.raises(ValueError):
+        _ = structural_frame.element_id_registry
+
+
+def test_basement_color_follows_element_colors():
+    geo_model = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    structural_frame = geo_model.structural_frame
+    basement = structural_frame.structural_elements[-1]
+
+    element = structural_frame.structural_groups[0].elements[0]
+    element.color = basement.color  # * Does not change the layout the element list is cached on
+    elements = structural_frame.structural_elements
+    assert elements[-1] is basement
+    assert basement.color != element.color
+    assert structural_frame.elements_colors[0] == basement.color
+
+    # * A color chosen by the user is changed with a warning
+    structural_frame.basement_color = "#000000"
+    assert structural_frame.structural_elements[-1].color == "#000000"
+    element.color = "#000000"
+    with pytest.warns(UserWarning, match="basement color"):
+        assert structural_frame.structural_elements[-1].color != "#000000"
@@ -0,0 +1,67 @@
+import pickle
+
+import numpy as np
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.modules.ensemble import run_ensemble, geo_model_snapshot
+
+
+def test_snapshot_drops_heavy_attributes():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=True)
+
+    snapshot = pickle.loads(geo_model_snapshot(geo_model))
+    assert snapshot.solutions is None
+    assert not hasattr(snapshot, "taped_interpolation_input")
+    assert geo_model.solutions is not None
+    np.testing.assert_array_equal(snapshot.surface_points_copy.xyz, geo_model.surface_points_copy.xyz)
+
+
+def test_run_ensemble_matches_batch():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    n_points = geo_model.surface_points_copy.xyz.shape[0]
+
+    realizations = np.zeros((3, n_points, 3))
+    realizations[1, :, 2] = 40
+    realizations[2, :, 2] = -40
+
+    ensemble = run_ensemble(geo_model, realizations, max_workers=2, chunk_size=1)
+    batch = gp.compute_model_batch(geo_model, realizations)
+
+    assert ensemble["lith_block"].shape == (3, *batch[0].raw_arrays.lith_block.shape)
+    for i, solution in enumerate(batch):
+        np.testing.assert_allclose(ensemble["lith_block"][i], solution.raw_arrays.lith_block)
+        np.testing.assert_allclose(ensemble["scalar_field_matrix"][i], solution.raw_arrays.scalar_field_matrix)
+
+
+def test_run_ensemble_solves_every_realization_of_a_chunk():
+    # * More surface points than numpy prints in full, with only one point in the middle perturbed
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    geo_model.interpolation_options.mesh_extraction = False
+    geo_model.interpolation_options.number_octree_levels = 3
+
+    element = geo_model.structural_frame.structural_groups[0].elements[0]
+    rng = np.random.default_rng(0)
+    xyz = element.surface_points.xyz
+    new_xyz = xyz[rng.integers(0, len(xyz), 600)] + rng.uniform(-40, 40, (600, 3)) * [1, 1, 0.1]
+    gp.add_surface_points(
+        geo_model=geo_model,
+        x=new_xyz[:, 0],
+        y=new_xyz[:, 1],
+        z=new_xyz[:, 2],
+        elements_names=[element.name] * 600
+    )
+    n_points = geo_model.surface_points_copy.xyz.shape[0]
+    assert n_points > 333
+
+    realizations = np.zeros((4, n_points, 3))
+    realizations[1:, n_points // 2, 2] = [300, -300, 150]
+
+    ensemble = run_ensemble(geo_model, realizations, max_workers=1, chunk_size=3)
+
+    original_z = geo_model.surface_points_copy.xyz[:, 2]
+    geo_model.interpolation_options.cache_mode = geo_model.interpolation_options.CacheMode.NO_CACHE
+    for i in range(len(realizations)):
+        gp.modify_surface_points(geo_model, slice=n_points // 2, Z=original_z[n_points // 2] + realizations[i, n_points // 2, 2])
+        reference = gp.compute_model(geo_model)
+        np.testing.assert_allclose(ensemble["scalar_field_matrix"][i], reference.raw_arrays.scalar_field_matrix, atol=1e-6)
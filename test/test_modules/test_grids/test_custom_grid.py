@@ -55,3 +55,27 @@ def test_compute_at():
         sol,
         np.array([3., 3., 3., 3., 1., 1., 1., 1.])
     )
+
+
+def test_compute_at_has_no_side_effects_and_chunks():
+    geo_model: gp.data.GeoModel = gp.generate_example_model(
+        example_model=ExampleModel.ANTICLINE,
+        compute_model=False
+    )
+
+    geo_model.interpolation_options.number_octree_levels = 2
+    active_grids = geo_model.grid.active_grids
+
+    sol: np.ndarray = gp.compute_model_at(
+        gempy_model=geo_model,
+        at=xyz_coord,
+        chunk_size=3
+    )
+
+    np.testing.assert_array_equal(sol, np.array([3., 3., 3., 3., 1., 1., 1., 1.]))
+    assert geo_model.grid.custom_grid is None
+    assert geo_model.grid.active_grids == active_grids
+    assert geo_model.solutions is None
+
+    streamed = list(gp.compute_model_at_chunks(geo_model, (xyz_coord[i:i + 4] for i in (0, 4))))
+    np.testing.assert_array_equal(np.concatenate(streamed), sol)
@@ -0,0 +1,42 @@
+import weakref
+
+import numpy as np
+
+import gempy as gp
+
+
+def test_grid_values_are_materialized_on_demand():
+    grid = gp.data.Grid(extent=[0, 10, 0, 10, 0, 10], resolution=[2, 2, 2])
+    assert grid._values_cache is None
+
+    values = grid.values
+    assert values.shape == (8, 3)
+    assert grid.values is values  # * Reused while the sub-grids do not change
+
+    custom = np.array([[1., 2., 3.], [4., 5., 6.]])
+    gp.set_custom_grid(grid, custom)
+    np.testing.assert_array_equal(grid.length, [0, 8, 10])
+    np.testing.assert_array_equal(grid.values[grid.length[1]:grid.length[2]], custom)
+
+    grid.active_grids = grid.GridTypes.NONE
+    assert grid.values.shape == (0, 3)
+
+
+def test_grid_values_follow_replaced_sub_grid_arrays():
+    grid = gp.data.Grid(extent=[0, 10, 0, 10, 0, 10], resolution=[2, 2, 2])
+    gp.set_custom_grid(grid, np.zeros((2, 3)))
+
+    grid.values
+    read_values = weakref.ref(grid.custom_grid.values)
+    grid.custom_grid.values = np.ones((2, 3))
+    assert read_values() is not None  # * Kept alive by the cache so no new array can take its id
+    np.testing.assert_array_equal(grid.values[8:], 1)
+
+    up_to_date = []
+    for i in range(20):
+        grid.values
+        # * The array read last is freed by the first replacement, the second one may get its id
+        grid.custom_grid.values = np.full((2, 3), -1.)
+        grid.custom_grid.values = np.full((2, 3), float(i))
+        up_to_date.append(bool(np.all(grid.values[8:] == i)))
+    assert all(up_to_date)
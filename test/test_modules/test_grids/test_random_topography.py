@@ -0,0 +1,34 @@
+import numpy as np
+
+import gempy as gp
+from gempy.modules.grids.create_topography import _LoadDEMArtificial, create_random_topography
+
+
+def test_fractal_grid_is_reproducible():
+    surface = _LoadDEMArtificial.fractalGrid(2.0, n=(64, 48), rng=7)
+    assert surface.shape == (64, 48)
+    assert surface.dtype == np.float32
+    assert surface.min() == 0 and surface.max() == 1
+    np.testing.assert_array_equal(surface, _LoadDEMArtificial.fractalGrid(2.0, n=(64, 48), rng=7))
+    assert not np.array_equal(surface, _LoadDEMArtificial.fractalGrid(2.0, n=(64, 48), rng=8))
+
+    full_spectrum = _LoadDEMArtificial.fractalGrid(2.0, n=(64, 48), rng=7, use_rfft=False, dtype=np.float64)
+    assert full_spectrum.dtype == np.float64
+    assert full_spectrum.min() == 0 and full_spectrum.max() == 1
+
+
+def test_random_topography_values():
+    extent = np.array([0, 1000, 0, 500, -500, 0])
+    values = create_random_topography(extent, resolution=[100, 50], dz=np.array([-100, 0]), seed=1)
+    assert values.shape == (100, 50, 3)
+    np.testing.assert_allclose(values[:, 0, 0], np.linspace(0, 1000, 100))
+    np.testing.assert_allclose(values[0, :, 1], np.linspace(0, 500, 50))
+    np.testing.assert_allclose([values[..., 2].min(), values[..., 2].max()], [-100, 0], atol=1e-4)
+
+
+def test_set_topography_from_random_seed():
+    grid = gp.data.Grid(extent=[0, 1000, 0, 1000, 0, 1000], resolution=[10, 10, 10])
+    topography = gp.set_topography_from_random(grid, d_z=np.array([700, 900]), topography_resolution=[40, 40], seed=3)
+    values = topography.values.copy()
+    gp.set_topography_from_random(grid, d_z=np.array([700, 900]), topography_resolution=[40, 40], seed=3)
+    np.testing.assert_array_equal(grid.topography.values, values)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import gempy as gp
+from gempy.modules.grids.rasterize_points import rasterize_points
+
+
+def _plane(x, y):
+    return 300 + 0.2 * x - 0.1 * y
+
+
+@pytest.fixture
+def scattered_points():
+    xyz = np.random.default_rng(0).uniform(0, 1000, size=(5000, 3))
+    xyz[:, 2] = _plane(xyz[:, 0], xyz[:, 1])
+    return xyz
+
+
+def test_rasterize_points_methods(scattered_points):
+    scipy = pytest.importorskip("scipy")
+
+    z, origin, spacing = rasterize_points(scattered_points, [0, 1000, 0, 1000], resolution=[41, 21], chunk_size=100)
+    assert z.shape == (41, 21)
+    np.testing.assert_array_equal(spacing, [25, 50])
+    x, y = np.meshgrid(origin[0] + spacing[0] * np.arange(41), origin[1] + spacing[1] * np.arange(21), indexing='ij')
+    np.testing.assert_array_equal(z, scipy.interpolate.griddata(scattered_points[:, :2], scattered_points[:, 2], (x, y), method='nearest'))
+
+    z_linear, _, _ = rasterize_points(scattered_points, [0, 1000, 0, 1000], resolution=[41, 21], method="linear", chunk_size=100)
+    np.testing.assert_allclose(z_linear[2:-2, 2:-2], _plane(x, y)[2:-2, 2:-2])
+    assert not np.isnan(z_linear).any()  # * Nodes outside the convex hull take the closest point
+
+    # * Inverse distance weighting keeps the value of points lying on a node
+    points_on_nodes = np.column_stack([x.ravel(), y.ravel(), _plane(x, y).ravel()])[::7]
+    z_idw, _, _ = rasterize_points(np.vstack([scattered_points, points_on_nodes]), [0, 1000, 0, 1000],
+                                   resolution=[41, 21], method="idw", n_neighbors=4)
+    np.testing.assert_allclose(z_idw.ravel()[::7], points_on_nodes[:, 2])
+    assert np.abs(z_idw - _plane(x, y)).max() < 10
+
+    with pytest.raises(ValueError):
+        rasterize_points(scattered_points, [0, 1000, 0, 1000], resolution=[4, 4], method="cubic")
+
+
+def test_set_topography_from_arrays_spacing(scattered_points):
+    grid = gp.data.Grid(extent=[0, 1000, 0, 1000, 0, 1000], resolution=[10, 10, 10])
+    topography = gp.set_topography_from_arrays(grid, scattered_points, spacing=20, method="linear")
+    assert topography.resolution == (51, 51)  # * Follows the spacing, not the model resolution
+    np.testing.assert_array_equal(topography.x[[0, -1]], [0, 1000])
+
+    topography = gp.set_topography_from_arrays(grid, scattered_points)
+    assert topography.resolution == (10, 10)
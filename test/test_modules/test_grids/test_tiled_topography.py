@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+import pytest
+
+import gempy as gp
+from gempy.core.data.enumerators import ExampleModel
+from gempy.core.data.grid_modules import TiledTopography
+
+
+def _plane(x, y):
+    return 500 + 0.1 * x - 0.05 * y
+
+
+def test_tiled_topography_from_npy(tmp_path):
+    # * A DEM larger than the model: 1 m pixels from -100 to 2100 in X and Y
+    origin, spacing = np.array([-100., -100.]), np.array([1., 1.])
+    axis = origin[0] + spacing[0] * np.arange(2201)
+    path = str(tmp_path / "dem.npy")
+    np.save(path, _plane(axis[:, None], axis[None, :]).astype("float32"))
+
+    grid = gp.data.Grid(extent=[0, 2000, 0, 2000, 0, 1000], resolution=[37, 23, 11])
+    topography = gp.set_topography_from_file(grid, path, tiled=True, origin=origin, spacing=spacing, tile_size=8)
+
+    assert isinstance(topography, TiledTopography)
+    assert isinstance(topography.z, np.memmap)  # * Cropped view of the file, nothing loaded
+    assert topography.z.shape == (2001, 2001)  # * Pixel centers 0 to 2000 bracket the extent
+    np.testing.assert_array_equal(topography.x[[0, -1]], [0, 2000])
+    assert grid.GridTypes.TOPOGRAPHY in grid.active_grids
+
+    regular_grid = grid.regular_grid
+    expected_topography = _plane(regular_grid.x_coord[:, None], regular_grid.y_coord[None, :])
+    np.testing.assert_allclose(topography.resize_topo(), expected_topography, atol=1e-3)
+    expected_mask = regular_grid.z_coord[None, None, :] > (expected_topography - regular_grid.dz * 2)[:, :, None]
+    np.testing.assert_array_equal(topography.topography_mask, expected_mask)
+    # * Keyed on the file, the raster is never digested
+    assert topography.dem_key[0] == os.path.abspath(path)
+    assert topography._dem_digest is None
+
+    np.testing.assert_array_equal(topography.values_2d[:, :, 2], topography.z)
+    assert topography.values.shape == (2001 * 2001, 3)
+
+
+def test_tiled_topography_in_model(tmp_path):
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    extent = geo_model.grid.regular_grid.extent
+    axis = np.linspace(extent[0], extent[1], 50)
+    path = str(tmp_path / "dem.npy")
+    np.save(path, np.full((50, 50), 600.))
+
+    gp.set_topography_from_file(geo_model.grid, path, tiled=True, origin=axis[[0, 0]], spacing=axis[[1, 1]] - axis[0])
+    gp.compute_model(geo_model)
+    assert geo_model.solutions.raw_arrays.geological_map.shape == (50 * 50,)
+
+
+def test_npy_dem_requires_georeference(tmp_path):
+    path = str(tmp_path / "dem.npy")
+    np.save(path, np.zeros((2, 2)))
+    grid = gp.data.Grid(extent=[0, 1, 0, 1, 0, 1], resolution=[2, 2, 2])
+    with pytest.raises(ValueError):
+        gp.set_topography_from_file(grid, path, tiled=True)
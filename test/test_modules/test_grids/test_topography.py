@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from gempy.core.data.grid_modules import RegularGrid, Topography
+from gempy.modules.grids.create_topography import create_random_topography
+
+
+def test_topography_keeps_only_heights():
+    regular_grid = RegularGrid(extent=np.array([0, 1000, 0, 500, 0, 1000]), resolution=np.array([20, 10, 10]))
+    values_2d = create_random_topography(regular_grid.extent, resolution=[30, 20], dz=np.array([600, 900]), seed=0)
+    topography = Topography(regular_grid=regular_grid, values_2d=values_2d)
+
+    assert topography.z.shape == topography.resolution == (30, 20)
+    assert topography._values is None  # * Built on first access
+    np.testing.assert_allclose(topography.x, values_2d[:, 0, 0])
+    np.testing.assert_allclose(topography.y, values_2d[0, :, 1])
+    np.testing.assert_allclose(topography.values_2d, values_2d)
+    np.testing.assert_allclose(topography.values, values_2d.reshape(-1, 3))
+
+    chunks = list(topography.iter_values(chunk_size=77))
+    assert chunks[0][0] == slice(0, 77)
+    np.testing.assert_array_equal(np.concatenate([xyz for _, xyz in chunks]), topography.values)
+
+    # * The voxel mask is the same as resizing the XYZ raster
+    skimage = pytest.importorskip("skimage")
+    resized = skimage.transform.resize(values_2d, (20, 10), mode='constant', anti_aliasing=False, preserve_range=True)
+    expected_mask = regular_grid.values[:, 2].reshape(20, 10, 10) > resized[:, :, [2]] - regular_grid.dz * 2
+    np.testing.assert_array_equal(topography.topography_mask, expected_mask)
+
+    topography.set_z(np.zeros((4, 3)), origin=(0, 0), spacing=(250, 200))
+    assert topography._values is None and not topography._mask_cache.masks
+    np.testing.assert_array_equal(topography.y, [0, 200, 400])
+
+
+def test_engine_topography_is_built_from_the_heights():
+    import gempy as gp
+    from gempy.core.data.enumerators import ExampleModel
+    from gempy.modules.data_manipulation.engine_factory import _transformed_topography_values
+
+    geo_model: gp.data.GeoModel = gp.generate_example_model(ExampleModel.ANTICLINE, compute_model=False)
+    gp.set_topography_from_random(geo_model.grid, topography_resolution=[30, 20], seed=0)
+    topography = geo_model.grid.topography
+
+    engine_values = _transformed_topography_values(topography, geo_model.input_transform, chunk_size=77)
+    assert topography._values is None
+    np.testing.assert_allclose(engine_values, geo_model.input_transform.apply(topography.values))
+
+
+def test_topography_rejects_irregular_coordinates():
+    regular_grid = RegularGrid(extent=np.array([0, 1, 0, 1, 0, 1]), resolution=np.array([2, 2, 2]))
+    x, y = np.meshgrid([0, 0.2, 1], [0, 0.5, 1], indexing='ij')
+    with pytest.raises(ValueError):
+        Topography(regular_grid=regular_grid, values_2d=np.dstack([x, y, np.zeros_like(x)]))
+
+
+def test_topography_mask_follows_grid_and_heights():
+    regular_grid = RegularGrid(extent=np.array([0, 1000, 0, 1000, 0, 1000]), resolution=np.array([16, 16, 8]))
+    values_2d = create_random_topography(regular_grid.extent, resolution=[40, 40], dz=np.array([400, 800]), seed=2)
+    topography = Topography(regular_grid=regular_grid, values_2d=values_2d)
+    mask_cache = topography._mask_cache
+
+    mask = topography.topography_mask
+    assert topography.topography_mask is mask
+    assert (mask_cache.n_misses, mask_cache.n_hits) == (1, 1)
+
+    # * Only the vertical resolution changes: the resampled topography is reused
+    regular_grid.set_regular_grid(extent=regular_grid.extent, resolution=[16, 16, 32])
+    assert topography.topography_mask.shape == (16, 16, 32)
+    assert (mask_cache.n_misses, mask_cache.n_surface_hits) == (1, 1)
+    np.testing.assert_array_equal(
+        topography.topography_mask,
+        Topography(regular_grid=regular_grid, values_2d=values_2d).topography_mask
+    )
+
+    # * Heights are changed through `set_z`, which gives a different DEM. In place edits are refused
+    n_above = topography.topography_mask.sum()
+    with pytest.raises(ValueError):
+        topography.z -= 100
+    topography.set_z(topography.z - 100, topography.origin, topography.spacing)
+    assert topography.topography_mask.sum() > n_above
+    assert mask_cache.n_misses == 2
+
+    octree_grid = RegularGrid(extent=regular_grid.extent, resolution=np.array([8, 8, 8]))
+    octree_masks = topography.octree_masks(octree_grid)
+    assert [level_mask.shape for level_mask in octree_masks] == [(2, 2, 2), (4, 4, 4), (8, 8, 8)]
+    assert topography.mask(octree_grid) is octree_masks[-1]
+
+
+def test_dem_digest_reads_views_by_blocks():
+    from gempy.core.data.grid_modules.topography_mask_cache import dem_digest
+
+    z = np.random.default_rng(0).normal(size=(50, 40))
+    origin, spacing = np.zeros(2), np.ones(2)
+    cropped = z[3:47, 5:30]  # * Not contiguous, as a cropped memory map
+    assert dem_digest(cropped, origin, spacing, block_rows=7) == dem_digest(cropped.copy(), origin, spacing)
+    assert dem_digest(cropped, origin, spacing) != dem_digest(z[3:47, 5:31], origin, spacing)